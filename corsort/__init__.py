@@ -6,27 +6,38 @@ __version__ = '0.1.4'
 
 
 from corsort.chain_and_y import ChainAndY, linear_extensions
+from corsort.comparison_log import ComparisonLog
 from corsort.corsort import Corsort
 from corsort.corsort_borda import CorsortBorda
+from corsort.corsort_chain_decomposition import CorsortChainDecomposition
 from corsort.corsort_chain_decomposition_merge_v import CorsortChainDecompositionMergeV
 from corsort.corsort_chain_decomposition_merge_x import CorsortChainDecompositionMergeX
 from corsort.corsort_delegate import CorsortDelegate
-from corsort.corsort_gain import CorsortGain
+from corsort.corsort_gain import CorsortGain, argmax_pair
 from corsort.corsort_gain_lexi import CorsortGainLexi
-from corsort.distance_to_sorted_array import distance_to_sorted_array
+from corsort.distance_to_sorted_array import distance_to_sorted_array, kendall_tau_to_sorted_array, \
+    kendall_tau_to_sorted_array_batch
 from corsort.entropy_bound import entropy_bound
+from corsort.jit_batch import jit_corsort_batch, corsort_batch, jit_scorer_batch
 from corsort.jit_scorers import jit_scorer_rho, jit_scorer_delta
-from corsort.jit_sorts import jit_corsort_borda, jit_corsort_delta_max_rho, \
+from corsort.jit_sorts import jit_corsort_variant, jit_corsort_borda, jit_corsort_delta_max_rho, \
     jit_corsort_delta_sum_rho, jit_corsort_delta_max_delta, jit_corsort_delta_sum_delta, \
     jit_corsort_rho_max_rho, jit_corsort_rho_sum_rho, jit_corsort_rho_max_delta, \
     jit_corsort_rho_sum_delta, heapify, jit_heapsort
+from corsort.jit_comparison_sorts import jit_quicksort, jit_merge_sort_top_down, jit_merge_sort_bottom_up, \
+    jit_binary_insertion_sort, jit_shellsort
 from corsort.merge import merge
-from corsort.montecarlo import print_res, evaluate, evaluate_convergence, evaluate_comparisons
+from corsort.montecarlo import print_res, evaluate, evaluate_convergence, evaluate_comparisons, evaluate_chunks, \
+    evaluate_online, evaluate_adaptive, chunk_seeds, sweep, load_sweep
 from corsort.multi_merge import multi_merge
+from corsort.online_stats import RunningMoments, CountHistogram, P2Quantile, RunningProfile
 from corsort.partition import partition
+from corsort.poset_bitset import PosetBitset
+from corsort.poset_dense import PosetDense
 from corsort.presets import colors, sorts, color_dict, auto_colors
 from corsort.print_order_as_letters import print_order_as_letters
-from corsort.scorers import scorer_delta, scorer_rho
+from corsort.ragged_histories import RaggedHistories
+from corsort.scorers import scorer_delta, scorer_rho, IncrementalScorer, ScorerDelta, ScorerRho
 from corsort.sort import Sort
 from corsort.sort_asort_quickselect import SortAsortQuickselect
 from corsort.sort_binary_insertion import SortBinaryInsertion
@@ -38,8 +49,10 @@ from corsort.sort_multizip import SortMultizip
 from corsort.sort_quick import SortQuick
 from corsort.sort_shell import SortShell
 from corsort.split_pointer_lists import split_pointer_lists
-from corsort.util_chains import longest_chain_starting_at, longest_chain, greedy_chain_decomposition
-from corsort.util_latex import print_corsort_execution
+from corsort.transitive_reduction import transitive_reduction, TransitiveReduction
+from corsort.util_chains import longest_chain_starting_at, longest_chain, greedy_chain_decomposition, \
+    ChainDecomposition, jit_chain_heights, minimum_chain_decomposition
+from corsort.util_latex import print_corsort_execution, write_corsort_execution
 from corsort.wrap_full_jit import WrapFullJit, JitCorsortBorda, JitHeapsort, \
     JitCorsortDeltaMaxDelta, JitCorsortDeltaMaxRho, JitCorsortDeltaSumDelta, JitCorsortDeltaSumRho, \
     JitCorsortRhoMaxDelta, JitCorsortRhoMaxRho, JitCorsortRhoSumDelta, JitCorsortRhoSumRho
@@ -33,6 +33,7 @@ class ChainAndY:
         self._cache_profile_linear_extensions = None
         self._cache_profile_linear_extensions_svvamp = None
         self._cache_positions_counts_in_extensions = None
+        self._cache_precedence_counts = None
 
     @property
     def n_nodes(self):
@@ -137,6 +138,28 @@ class ChainAndY:
         """
         return comb(self.c + self.d, self.c) * comb(self.n_nodes, self.a)
 
+    @property
+    def count_dtype(self):
+        """
+        Data type of the arrays of numbers of linear extensions.
+
+        Returns
+        -------
+        :class:`str` or :class:`type`
+            `'int64'` if the numbers of linear extensions (multiplied by squared ranks, as in
+            :meth:`spearman_costs`) fit in it, `object` otherwise (exact Python integers).
+
+        Examples
+        --------
+            >>> ChainAndY(2, 1, 7, 3).count_dtype
+            'int64'
+            >>> ChainAndY(15, 15, 15, 15).count_dtype
+            <class 'object'>
+        """
+        if self.nb_linear_extensions * (self.n_nodes + 1) ** 2 < 2 ** 63:
+            return 'int64'
+        return object
+
     @property
     def nb_ancestors(self):
         """
@@ -387,7 +410,7 @@ class ChainAndY:
                    [   0,  120,  240,  360,  480,  600,  720,  840,  960, 1080, 1200,
                     1320, 1440]]...)
         """
-        result = np.zeros((self.a, self.a + self.b + self.c + self.d), 'int64')
+        result = np.zeros((self.a, self.a + self.b + self.c + self.d), self.count_dtype)
         ways_to_merge_c_and_d = comb(self.c + self.d, self.c)
         for i in range(self.a):  # i: index of element in chain `a`
             smaller_from_a = i
@@ -418,7 +441,7 @@ class ChainAndY:
             array([[7920, 1320,  120,    0,    0,    0,    0,    0,    0,    0,    0,
                        0,    0]]...)
         """
-        result = np.zeros((self.b, self.a + self.b + self.c + self.d), 'int64')
+        result = np.zeros((self.b, self.a + self.b + self.c + self.d), self.count_dtype)
         ways_to_merge_c_and_d = comb(self.c + self.d, self.c)
         for i in range(self.b):  # i: index of element in chain `b`
             smaller_from_y = i
@@ -554,8 +577,8 @@ class ChainAndY:
         m = self.positions_counts_in_extensions
         m_cumsum = m.cumsum(axis=1)
         nb_linear_extensions = self.nb_linear_extensions
-        median_low = np.argmax(m_cumsum >= nb_linear_extensions / 2, axis=1)
-        median_high = np.argmax(m_cumsum > nb_linear_extensions / 2, axis=1)
+        median_low = np.argmax(2 * m_cumsum >= nb_linear_extensions, axis=1)
+        median_high = np.argmax(2 * m_cumsum > nb_linear_extensions, axis=1)
         return (median_low + median_high) / 2
 
     @property
@@ -620,14 +643,73 @@ class ChainAndY:
             >>> ChainAndY(0, 1, 2, 7).order_spearman_optimal  # doctest: +ELLIPSIS
             array([0, 3, 4, 1, 5, 6, 7, 2, 8, 9]...)
         """
-        _, col_ind = linear_sum_assignment(self.spearman_costs.T)
+        # The costs are converted to floats if they are Python integers (cf. :meth:`count_dtype`).
+        _, col_ind = linear_sum_assignment(self.spearman_costs.T.astype(float))
         return col_ind
 
+    @property
+    def precedence_counts(self):
+        """
+        Pairwise precedence counts in linear extensions.
+
+        They are computed with binomial formulas, without enumerating the linear extensions. The chain `a` is
+        interleaved with an extension of the Y, in which a node of the trunk has a fixed rank and the rank of a node
+        of a branch depends on the interleaving of the two branches.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            Size `a + b + c + d` * `a + b + c + d`. Coefficient (i, j) represents the number of linear extensions
+            where node `i` is before node `j`. Same as the attribute `matrix_duels_rk` of
+            :meth:`profile_linear_extensions_svvamp`. The data type is given by :meth:`count_dtype`.
+
+        Examples
+        --------
+            >>> poset = ChainAndY(1, 1, 1, 2)
+            >>> poset.precedence_counts
+            array([[ 0,  3,  9,  7, 11],
+                   [12,  0, 15, 15, 15],
+                   [ 6,  0,  0,  5, 10],
+                   [ 8,  0, 10,  0, 15],
+                   [ 4,  0,  5,  0,  0]])
+            >>> np.array_equal(poset.precedence_counts, poset.profile_linear_extensions_svvamp.matrix_duels_rk)
+            True
+        """
+        if self._cache_precedence_counts is None:
+            a, b, c, d = self.a, self.b, self.c, self.d
+            n = self.n_nodes
+            n_extensions = self.nb_linear_extensions
+            result = np.zeros((n, n), dtype=object)
+            # Comparable pairs: all the extensions or none.
+            lower = np.zeros((n, n), dtype=bool)
+            for start, size in [(0, a), (a, b), (a + b, c), (a + b + c, d)]:
+                lower[start:start + size, start:start + size] = np.triu(np.ones((size, size), dtype=bool), 1)
+            lower[a:a + b, a + b:] = True
+            result[lower] = n_extensions
+            # Branches: interleavings of `c` and `d`, times the interleavings with `a`.
+            result[a + b:a + b + c, a + b + c:] = _interleaving_counts(c, d) * comb(n, a)
+            # Isolated chain: interleavings of `a` and the Y, given the distribution of the ranks in the Y.
+            ranks_y = np.zeros((b + c + d, b + c + d), dtype=object)
+            ranks_y[range(b), range(b)] = comb(c + d, c)
+            ranks_y[b:b + c, b:] = _ranks_in_interleavings(c, d)
+            ranks_y[b + c:, b:] = _ranks_in_interleavings(d, c)
+            result[:a, a:] = np.dot(_interleaving_counts(a, b + c + d), ranks_y.T)
+            # Reverse pairs of the incomparable ones.
+            incomparable = ~(lower | lower.T)
+            np.fill_diagonal(incomparable, False)
+            upper_incomparable = np.triu(incomparable, 1)
+            result.T[upper_incomparable] = n_extensions - result[upper_incomparable]
+            self._cache_precedence_counts = result.astype(self.count_dtype)
+        return self._cache_precedence_counts
+
     @property
     def profile_linear_extensions(self):
         """
         Profile consisting of all linear extensions.
 
+        It enumerates the linear extensions, so it is only suitable for small posets. The statistics of the class
+        (e.g. :meth:`precedence_counts`, :meth:`positions_counts_in_extensions`) are computed without it.
+
         Returns
         -------
         :class:`~numpy.ndarray`
@@ -712,6 +794,11 @@ class ChainAndY:
         """
         Kemeny order of the nodes in the profile of linear extensions.
 
+        A Kemeny order respects the unanimous preferences of the profile, so it is a linear extension of the poset.
+        It is found by dynamic programming on the numbers of nodes already placed from each chain, with the costs
+        given by :meth:`precedence_counts`. In case of tie, the first optimal order in lexicographic order is
+        returned, like svvamp's Kemeny rule.
+
         Returns
         -------
         :class:`~numpy.ndarray`
@@ -719,11 +806,54 @@ class ChainAndY:
 
         Examples
         --------
-            >>> ChainAndY(0, 1, 2, 7).order_kemeny
+            >>> poset = ChainAndY(0, 1, 2, 7)
+            >>> poset.order_kemeny
+            array([0, 3, 4, 1, 5, 6, 7, 2, 8, 9])
+            >>> svvamp.RuleKemeny()(poset.profile_linear_extensions_svvamp).candidates_by_scores_best_to_worst_
             array([0, 3, 4, 1, 5, 6, 7, 2, 8, 9])
-        """
-        election = svvamp.RuleKemeny()(self.profile_linear_extensions_svvamp)
-        return election.candidates_by_scores_best_to_worst_
+
+        It does not enumerate the linear extensions, so it works for larger posets:
+
+            >>> ChainAndY(15, 15, 15, 15).order_kemeny[:10]
+            array([15, 16,  0, 17, 18, 19,  1, 20, 21, 22])
+        """
+        precedence_counts = self.precedence_counts
+        chains = [
+            np.arange(self.a),
+            np.arange(self.a, self.a + self.b),
+            np.arange(self.a + self.b, self.a + self.b + self.c),
+            np.arange(self.a + self.b + self.c, self.n_nodes),
+        ]
+        # placed_costs[k][x, m]: number of extensions where `x` is before one of the `m` first nodes of chain `k`.
+        placed_costs = [np.concatenate((np.zeros((self.n_nodes, 1), dtype=precedence_counts.dtype),
+                                        np.cumsum(precedence_counts[:, chain], axis=1)), axis=1)
+                        for chain in chains]
+
+        def moves(state):
+            # The branches can start only when the trunk is complete.
+            for k, chain in enumerate(chains):
+                if state[k] < len(chain) and (k < 2 or state[1] == self.b):
+                    x = chain[state[k]]
+                    cost = sum(placed_costs[kk][x, state[kk]] for kk in range(4))
+                    yield x, cost, state[:k] + (state[k] + 1,) + state[k + 1:]
+
+        # Cost to go from each state, computed by decreasing number of placed nodes.
+        final = tuple(len(chain) for chain in chains)
+        cost_to_go = {final: 0}
+        states = [(i, j, 0, 0) for i in range(self.a + 1) for j in range(self.b)]
+        states += [(i, self.b, k, m) for i in range(self.a + 1) for k in range(self.c + 1) for m in range(self.d + 1)]
+        for state in sorted(states, key=sum, reverse=True):
+            if state != final:
+                cost_to_go[state] = min(cost + cost_to_go[next_state] for _, cost, next_state in moves(state))
+        # Lexicographically first optimal order.
+        order = []
+        state = (0, 0, 0, 0)
+        while state != final:
+            x, next_state = min((x, next_state) for x, cost, next_state in moves(state)
+                                if cost + cost_to_go[next_state] == cost_to_go[state])
+            order.append(x)
+            state = next_state
+        return np.array(order, dtype=int)
 
     def kemeny_score(self, order):
         """
@@ -744,10 +874,12 @@ class ChainAndY:
             >>> poset = ChainAndY(2, 2, 1, 3)
             >>> poset.kemeny_score([0, 4, 7, 2, 6, 3, 5, 1])
             13.5
+            >>> poset = ChainAndY(15, 15, 15, 15)
+            >>> round(poset.kemeny_score(poset.order_kemeny), 2)
+            91.56
         """
-        profile = self.profile_linear_extensions_svvamp
-        n_extensions = profile.n_v
-        return np.sum(np.tril(profile.matrix_duels_rk[order, :][:, order], -1)) / n_extensions
+        order = np.asarray(order)
+        return np.sum(np.tril(self.precedence_counts[order, :][:, order], -1)) / self.nb_linear_extensions
 
     def spearman_score(self, order):
         """
@@ -918,7 +1050,7 @@ def _average_height_c(a, b, c, d):
         array([Fraction(5, 4), Fraction(5, 2), Fraction(15, 4), Fraction(5, 1),
                Fraction(25, 4), Fraction(15, 2), Fraction(35, 4)], dtype=object)
     """
-    result = np.zeros(c, dtype='int64')
+    result = np.zeros(c, dtype=ChainAndY(a, b, c, d).count_dtype)
     for k in range(c):
         # Elements of c are: 0 ... (k-1) k (k+1) .. (c-1)
         smaller_from_c = k
@@ -967,7 +1099,7 @@ def _positions_counts_in_extensions_c(a, b, c, d):
                [ 0,  0,  0,  0,  0,  3, 12, 21,  0],
                [ 0,  0,  0,  0,  0,  0,  1,  7, 28]]...)
     """
-    result = np.zeros((c, a + b + c + d), 'int64')
+    result = np.zeros((c, a + b + c + d), ChainAndY(a, b, c, d).count_dtype)
     for k in range(c):
         # Elements of c are: 0 ... (k-1) k (k+1) .. (c-1)
         smaller_from_c = k
@@ -985,6 +1117,63 @@ def _positions_counts_in_extensions_c(a, b, c, d):
     return result
 
 
+def _interleaving_counts(x, y):
+    """
+    Precedence counts in the interleavings of two chains.
+
+    Parameters
+    ----------
+    x, y: int
+        Sizes of the chains.
+
+    Returns
+    -------
+    :class:`~numpy.ndarray`
+        Size `x` * `y` (Python integers). Coefficient (i, j) is the number of interleavings where item `i` of the
+        first chain is before item `j` of the second one, i.e. at least `i + 1` of the first `i + j + 1` items are
+        from the first chain.
+
+    Examples
+    --------
+        >>> _interleaving_counts(2, 2)
+        array([[3, 5],
+               [1, 3]], dtype=object)
+    """
+    result = np.zeros((x, y), dtype=object)
+    for i in range(x):
+        for j in range(y):
+            result[i, j] = sum(comb(i + j + 1, k) * comb(x + y - i - j - 1, x - k) for k in range(i + 1, x + 1))
+    return result
+
+
+def _ranks_in_interleavings(x, y):
+    """
+    Rank counts in the interleavings of two chains.
+
+    Parameters
+    ----------
+    x, y: int
+        Sizes of the chains.
+
+    Returns
+    -------
+    :class:`~numpy.ndarray`
+        Size `x` * `x + y` (Python integers). Coefficient (i, r) is the number of interleavings where item `i` of the
+        first chain has rank `r`, i.e. is preceded by `r - i` items of the second chain.
+
+    Examples
+    --------
+        >>> _ranks_in_interleavings(2, 1)
+        array([[2, 1, 0],
+               [0, 1, 2]], dtype=object)
+    """
+    result = np.zeros((x, x + y), dtype=object)
+    for i in range(x):
+        for t in range(y + 1):
+            result[i, i + t] = comb(i + t, i) * comb(x - 1 - i + y - t, y - t)
+    return result
+
+
 def linear_extensions(chain_1, chain_2):
     """
     Linear extensions for two independent chains (separate connected components).
@@ -0,0 +1,160 @@
+import numpy as np
+
+
+class ComparisonLog:
+    """
+    History of pairwise comparisons, stored in a growable int32 buffer of size `(capacity, 2)`.
+
+    It behaves like the list of tuples it replaces (iteration, indexing, equality, representation), but the
+    comparisons are also available as arrays without any copy.
+
+    Parameters
+    ----------
+    capacity: :class:`int`
+        Initial number of rows of the buffer (it is doubled when needed).
+
+    Examples
+    --------
+        >>> log = ComparisonLog(capacity=1)
+        >>> log.append(1, 0)
+        >>> log.append(0, 2)
+        >>> log
+        [(1, 0), (0, 2)]
+        >>> len(log), log[1]
+        (2, (0, 2))
+        >>> log.downs, log.ups
+        (array([1, 0], dtype=int32), array([0, 2], dtype=int32))
+        >>> log == [(1, 0), (0, 2)]
+        True
+        >>> [j for (i, j) in log]
+        [0, 2]
+    """
+
+    def __init__(self, capacity=16):
+        self.buffer = np.empty((capacity, 2), dtype=np.int32)
+        self.m = 0
+        self._values = None
+
+    @classmethod
+    def from_array(cls, comparisons):
+        """
+        Log from an array of comparisons (without copy if it is already a contiguous int32 array).
+
+        Parameters
+        ----------
+        comparisons: :class:`~numpy.ndarray`
+            Array of size `(m, 2)`, e.g. returned by a jit sort.
+
+        Returns
+        -------
+        :class:`ComparisonLog`
+            The log.
+
+        Examples
+        --------
+            >>> ComparisonLog.from_array(np.array([[1, 0], [0, 2]]))
+            [(1, 0), (0, 2)]
+        """
+        log = cls(capacity=0)
+        log.buffer = np.ascontiguousarray(np.asarray(comparisons, dtype=np.int32).reshape(-1, 2))
+        log.m = log.buffer.shape[0]
+        return log
+
+    def append(self, i, j):
+        """
+        Add a comparison.
+
+        Parameters
+        ----------
+        i: :class:`int`
+            Index of the lower item.
+        j: :class:`int`
+            Index of the higher item.
+        """
+        if self.m == self.buffer.shape[0]:
+            buffer = np.empty((2 * self.m + 1, 2), dtype=np.int32)
+            buffer[:self.m] = self.buffer
+            self.buffer = buffer
+        self.buffer[self.m] = i, j
+        self.m += 1
+
+    @property
+    def array(self):
+        """:class:`~numpy.ndarray`: View of the comparisons, of size `(m, 2)`."""
+        return self.buffer[:self.m]
+
+    @property
+    def downs(self):
+        """:class:`~numpy.ndarray`: View of the indices of the lower items."""
+        return self.buffer[:self.m, 0]
+
+    @property
+    def ups(self):
+        """:class:`~numpy.ndarray`: View of the indices of the higher items."""
+        return self.buffer[:self.m, 1]
+
+    def values(self, perm):
+        """
+        Comparisons in terms of compared values.
+
+        The result is cached: it is computed again only if the log has grown or `perm` is another array.
+
+        Parameters
+        ----------
+        perm: :class:`~numpy.ndarray`
+            The permutation that was sorted.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            Array of size `(m, 2)`. Row (x, y) means that items of values x and y were compared, and that x < y.
+
+        Examples
+        --------
+            >>> my_perm = np.array([4, 1, 7])
+            >>> log = ComparisonLog.from_array(np.array([[1, 0], [0, 2]]))
+            >>> log.values(my_perm)
+            array([[1, 4],
+                   [4, 7]])
+            >>> log.values(my_perm) is log.values(my_perm)
+            True
+        """
+        if self._values is None or self._values[0] is not perm or self._values[1] != self.m:
+            self._values = perm, self.m, np.asarray(perm)[self.array]
+        return self._values[2]
+
+    def tolist(self):
+        """
+        Comparisons as a list of tuples.
+
+        Returns
+        -------
+        :class:`list` of :class:`tuple`
+            The comparisons.
+        """
+        return [(i, j) for i, j in self.array.tolist()]
+
+    def __len__(self):
+        return self.m
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self.tolist()[item]
+        if item < 0:
+            item += self.m
+        if not 0 <= item < self.m:
+            raise IndexError("Comparison index out of range.")
+        return tuple(self.buffer[item].tolist())
+
+    def __eq__(self, other):
+        if isinstance(other, ComparisonLog):
+            return np.array_equal(self.array, other.array)
+        if isinstance(other, list):
+            return self.tolist() == other
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(self.tolist())
@@ -2,7 +2,8 @@ import numpy as np
 
 from corsort.distance_to_sorted_array import distance_to_sorted_array
 from corsort.sort import Sort
-from corsort.scorers import scorer_rho, scorer_delta
+from corsort.scorers import scorer_rho, scorer_delta, IncrementalScorer
+from corsort.poset_dense import PosetDense
 
 
 class Corsort(Sort):
@@ -16,15 +17,24 @@ class Corsort(Sort):
     record_leq: :class:`bool`
         If True, then record all the states of the `leq_` matrix.
     final_scorer: callable
-        Scorer used to compute the tentative estimate of the sorted list.
+        Scorer used to compute the tentative estimate of the sorted list. If it is an
+        :class:`~corsort.IncrementalScorer` (e.g. :class:`~corsort.ScorerRho`), it is updated after each comparison
+        with the newly learned pairs only, instead of being recomputed from the full `leq_` matrix.
+    poset: class
+        Backend used to store the poset, e.g. :class:`~corsort.PosetDense` (default) or
+        :class:`~corsort.PosetBitset` (lower memory footprint for large `n`, as long as `leq_` is not read, cf.
+        :class:`~corsort.PosetBitset`).
 
     Attributes
     ----------
+    poset_: :class:`~corsort.PosetDense` or :class:`~corsort.PosetBitset`
+        Current knowledge about the comparisons.
     leq_: :class:`~numpy.ndarray`.
         Matrix of size `(n_, n_)`. Coefficient (i, j) is
         +1 if we know perm_[i] <= perm_[j],
         -1 if we know perm_[i] > perm_[j],
         0 if we do not know the comparison between them.
+        This is a view on `poset_`.
     position_estimates_: :class:`list` of :class:`float`
         For each index (in the original list), its position estimate in the sorted list.
         Note that a position of 0 means the start of the sorted list, i.e. smallest element, whereas
@@ -36,19 +46,42 @@ class Corsort(Sort):
     Cf. also the attributes defined in the parent class :class:`~corsort.Sort`.
     """
 
-    def __init__(self, compute_history=False, record_leq=False, final_scorer=scorer_rho):
+    def __init__(self, compute_history=False, record_leq=False, final_scorer=scorer_rho, poset=PosetDense):
         super().__init__(compute_history=compute_history)
         self.record_leq = record_leq
         self.final_scorer = final_scorer
+        self.poset = poset
         # Computed attributes
-        self.leq_ = None
+        self.poset_ = None
         self.position_estimates_ = None
         self.history_leq_ = None
 
-    def update_position_estimates(self):
+    @property
+    def leq_(self):
+        """:class:`~numpy.ndarray`: Dense view on `poset_`, cf. the attributes of the class."""
+        if self.poset_ is None:
+            return None
+        return self.poset_.leq
+
+    @leq_.setter
+    def leq_(self, leq):
+        self.poset_ = self.poset.from_leq(leq)
+
+    def update_position_estimates(self, downs=None, ups=None):
         """
         Update position estimate of each item.
 
+        Parameters
+        ----------
+        downs: :class:`~numpy.ndarray`, optional
+            Indices of the low items of the pairs learned since the last update.
+        ups: :class:`~numpy.ndarray`, optional
+            Indices of the high items of the pairs learned since the last update.
+
+        If `final_scorer` is an :class:`~corsort.IncrementalScorer`, then the scorer is updated incrementally with the
+        newly learned pairs if they are given, and fully recomputed from the counts of `poset_` otherwise. For other
+        scorers, the scores are fully recomputed from `leq_`.
+
         Examples
         --------
             >>> corsort = Corsort(final_scorer=scorer_delta)
@@ -63,7 +96,13 @@ class Corsort(Sort):
             >>> corsort.position_estimates_
             array([-3,  3,  0,  0])
         """
-        self.position_estimates_ = self.final_scorer(self.leq_)
+        if isinstance(self.final_scorer, IncrementalScorer):
+            if downs is None:
+                self.position_estimates_ = self.final_scorer.initialize(self.poset_)
+            else:
+                self.position_estimates_ = self.final_scorer.update(downs, ups)
+        else:
+            self.position_estimates_ = self.final_scorer(self.leq_)
 
     def distance_to_sorted_array(self):
         """
@@ -111,14 +150,49 @@ class Corsort(Sort):
                    [-1, -1, -1,  1]])
 
         Now we know the full order by transitivity.
+
+        The same works with a bitset backend:
+
+            >>> from corsort.poset_bitset import PosetBitset
+            >>> corsort = Corsort(poset=PosetBitset)
+            >>> corsort.n_ = 4
+            >>> corsort.leq_ = np.array([
+            ...     [ 1,  1,  0,  0],
+            ...     [-1,  1,  0,  0],
+            ...     [ 0,  0,  1,  1],
+            ...     [ 0,  0, -1,  1],
+            ... ])
+            >>> corsort.apply_i_lt_j(1, 2)
+            >>> corsort.leq_
+            array([[ 1,  1,  1,  1],
+                   [-1,  1,  1,  1],
+                   [-1, -1,  1,  1],
+                   [-1, -1, -1,  1]], dtype=int8)
+
+        With an incremental scorer, only the newly learned pairs are used to update the position estimates:
+
+            >>> from corsort.scorers import ScorerRho
+            >>> corsort = Corsort(final_scorer=ScorerRho(), poset=PosetBitset)
+            >>> corsort.n_ = 4
+            >>> corsort.leq_ = np.array([
+            ...     [ 1,  1,  0,  0],
+            ...     [-1,  1,  0,  0],
+            ...     [ 0,  0,  1,  1],
+            ...     [ 0,  0, -1,  1],
+            ... ])
+            >>> corsort.update_position_estimates()
+            >>> corsort.position_estimates_
+            array([0.5, 2. , 0.5, 2. ])
+            >>> corsort.apply_i_lt_j(1, 2)
+            >>> corsort.position_estimates_
+            array([0.25      , 0.66666667, 1.5       , 4.        ])
+            >>> scorer_rho(corsort.leq_)
+            array([0.25      , 0.66666667, 1.5       , 4.        ])
         """
-        mask_i_and_smaller = self.leq_[:, i] > 0
-        mask_j_and_greater = self.leq_[j, :] > 0
-        self.leq_[np.ix_(mask_i_and_smaller, mask_j_and_greater)] = 1
-        self.leq_[np.ix_(mask_j_and_greater, mask_i_and_smaller)] = -1
+        downs, ups = self.poset_.apply_i_lt_j(i, j)
         if self.record_leq:
             self.history_leq_.append(self.leq_.copy())
-        self.update_position_estimates()
+        self.update_position_estimates(downs, ups)
 
     def compare_and_update_poset(self, i, j):
         """
@@ -160,7 +234,7 @@ class Corsort(Sort):
             >>> my_sort.history_distances_
             [2]
         """
-        self.leq_ = np.eye(self.n_, dtype=int)
+        self.poset_ = self.poset(self.n_)
         self.history_leq_ = []
         if self.record_leq:
             self.history_leq_.append(self.leq_.copy())
@@ -22,21 +22,95 @@ class CorsortBorda(Corsort):
          12, 12, 16, 12, 10, 10, 8, 4, 4, 4, 2, 4, 2]
         >>> corsort.__name__
         'corsort_borda'
+
+    The poset can be stored as bitsets, which gives the same execution:
+
+        >>> from corsort.poset_bitset import PosetBitset
+        >>> corsort_bitset = CorsortBorda(compute_history=True, poset=PosetBitset)
+        >>> corsort_bitset(perm).history_comparisons_ == corsort.history_comparisons_
+        True
     """
 
     __name__ = 'corsort_borda'
 
     def next_compare(self):
         while True:
-            gain_matrix = -np.abs(self.position_estimates_[np.newaxis, :] - self.position_estimates_[:, np.newaxis])
-            # (i, j): argmax of the gain, with i < j and leq_[i, j] == 0.
-            i, j = np.unravel_index(
-                np.argmax(
-                    np.where(np.triu(self.leq_ == 0), gain_matrix, -1)
-                ),
-                gain_matrix.shape
-            )
-            if i == j == 0:  # pragma: no cover
+            # Like the former argmax over a matrix padded with -1, stop when no pair has a gap below 1.
+            pair = closest_incomparable_pair(self.position_estimates_, self.leq_, max_gap=1.)
+            if pair is None:  # pragma: no cover
                 break
             else:
-                yield i, j
+                yield pair
+
+
+def closest_incomparable_pair(estimates, leq, max_gap=np.inf):
+    """
+    Pair of incomparable items with the closest estimates.
+
+    Parameters
+    ----------
+    estimates: :class:`~numpy.ndarray`
+        Position estimate of each item. Comparable items must have different estimates, which holds for the
+        scorers of :mod:`corsort.scorers`.
+    leq: :class:`~numpy.ndarray`
+        Current `leq` matrix.
+    max_gap: :class:`float`
+        Only the pairs with a gap lower than `max_gap` are considered.
+
+    Returns
+    -------
+    :class:`tuple` or None
+        Pair `(i, j)` with `i < j`, `leq[i, j] == 0` and the smallest gap `|estimates[i] - estimates[j]|` (the first
+        one in lexicographic order in case of tie). None if there is no such pair.
+
+    Notes
+    -----
+    The result is the same as taking the argmax of the gain over the `n x n` matrix, but only items that are close
+    in score order are examined. If some items have equal estimates, they are incomparable, so the pair is the first
+    two items of one of these groups. Otherwise, the pairs at distance 1, 2, etc. in score order are examined, as
+    long as the gaps at this distance can beat the best gap found so far.
+
+    Examples
+    --------
+        >>> my_leq = np.array([[1, 1, 0, 0], [-1, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]])
+        >>> closest_incomparable_pair(np.array([.25, .75, .5, .5]), my_leq)
+        (2, 3)
+        >>> closest_incomparable_pair(np.array([.25, .75, .5, .6]), my_leq)
+        (2, 3)
+        >>> closest_incomparable_pair(np.array([.4, .6, .1, .9]), my_leq)
+        (0, 2)
+        >>> print(closest_incomparable_pair(np.array([.4, .6]), np.ones((2, 2))))
+        None
+        >>> print(closest_incomparable_pair(np.array([.4, .6, .1, .9]), my_leq, max_gap=.2))
+        None
+    """
+    n = len(estimates)
+    order = np.argsort(estimates, kind='stable')
+    values = estimates[order]
+    # Groups of equal estimates: the first two items of a group have the smallest indices (stable sort).
+    firsts = np.flatnonzero(values[1:] == values[:-1])
+    if len(firsts) and max_gap > 0:
+        k = firsts[np.argmin(order[firsts])]
+        return int(order[k]), int(order[k + 1])
+    best = np.inf
+    pairs = np.zeros((0, 2), dtype=int)
+    for d in range(1, n):
+        gaps = values[d:] - values[:-d]
+        candidates = np.flatnonzero((gaps <= best) & (gaps < max_gap))
+        if len(candidates) == 0:
+            # The gaps only increase with the distance in score order.
+            break
+        lows, highs = order[candidates], order[candidates + d]
+        incomparable = leq[lows, highs] == 0
+        if not np.any(incomparable):
+            continue
+        gaps_incomparable = gaps[candidates][incomparable]
+        best_d = np.min(gaps_incomparable)
+        ties = gaps_incomparable == best_d
+        new_pairs = np.sort(np.column_stack((lows[incomparable][ties], highs[incomparable][ties])), axis=1)
+        pairs = new_pairs if best_d < best else np.concatenate([pairs, new_pairs])
+        best = best_d
+    if len(pairs) == 0:
+        return None
+    i, j = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))[0]]
+    return int(i), int(j)
@@ -0,0 +1,47 @@
+from corsort.corsort import Corsort
+from corsort.util_chains import ChainDecomposition
+
+
+class CorsortChainDecomposition(Corsort):
+    """
+    Corsort based on a greedy chain decomposition of the poset.
+
+    The decomposition is stored in `chain_decomposition_` (a :class:`~corsort.ChainDecomposition`), which is
+    repaired after each comparison with the newly learned pairs instead of being computed from scratch.
+
+    Examples
+    --------
+        >>> import numpy as np
+        >>> corsort = CorsortChainDecomposition()
+        >>> corsort._initialize_algo(np.array([3, 0, 2, 1]))
+        >>> corsort.compare_and_update_poset(0, 1)
+        >>> corsort.compare_and_update_poset(2, 3)
+        >>> corsort.chain_decomposition_.chains
+        [[1, 0], [3, 2]]
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.chain_decomposition_ = None
+
+    def _initialize_algo_aux(self):
+        self.chain_decomposition_ = None
+        super()._initialize_algo_aux()
+        self.chain_decomposition_ = ChainDecomposition(self.poset_)
+
+    def update_position_estimates(self, downs=None, ups=None):
+        """
+        Update position estimate of each item, cf. :meth:`~corsort.Corsort.update_position_estimates`.
+
+        The newly learned pairs are also used to repair the chain decomposition.
+
+        Parameters
+        ----------
+        downs: :class:`~numpy.ndarray`, optional
+            Indices of the low items of the pairs learned since the last update.
+        ups: :class:`~numpy.ndarray`, optional
+            Indices of the high items of the pairs learned since the last update.
+        """
+        super().update_position_estimates(downs, ups)
+        if self.chain_decomposition_ is not None and downs is not None:
+            self.chain_decomposition_.update(downs, ups)
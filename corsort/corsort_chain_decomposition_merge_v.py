@@ -1,10 +1,9 @@
 import numpy as np
 from corsort.entropy_bound import entropy_bound
-from corsort.corsort import Corsort
-from corsort.util_chains import greedy_chain_decomposition
+from corsort.corsort_chain_decomposition import CorsortChainDecomposition
 
 
-class CorsortChainDecompositionMergeV(Corsort):
+class CorsortChainDecompositionMergeV(CorsortChainDecomposition):
     """
     Corsort based on chain decomposition, with "V-shape" merging.
 
@@ -29,7 +28,7 @@ class CorsortChainDecompositionMergeV(Corsort):
 
     def next_compare(self):
         while True:
-            chains = greedy_chain_decomposition(self.leq_)
+            chains = self.chain_decomposition_.chains
             if len(chains) <= 1:
                 break
             i_in_chain = 0
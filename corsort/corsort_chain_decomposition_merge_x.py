@@ -1,10 +1,9 @@
 import numpy as np
 from corsort.entropy_bound import entropy_bound
-from corsort.corsort import Corsort
-from corsort.util_chains import greedy_chain_decomposition
+from corsort.corsort_chain_decomposition import CorsortChainDecomposition
 
 
-class CorsortChainDecompositionMergeX(Corsort):
+class CorsortChainDecompositionMergeX(CorsortChainDecomposition):
     """
     Corsort based on chain decomposition, with "X-shape" merging.
 
@@ -29,7 +28,7 @@ class CorsortChainDecompositionMergeX(Corsort):
 
     def next_compare(self):
         while True:
-            chains = greedy_chain_decomposition(self.leq_)
+            chains = self.chain_decomposition_.chains
             if len(chains) <= 1:
                 break
             yield self._find_i_j(chains[-1], chains[-2])
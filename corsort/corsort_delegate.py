@@ -2,6 +2,7 @@ import numpy as np
 from corsort.corsort import Corsort
 from corsort.sort_quick import SortQuick
 from corsort.scorers import scorer_delta
+from corsort.poset_dense import PosetDense
 
 
 class CorsortDelegate(Corsort):
@@ -26,8 +27,9 @@ class CorsortDelegate(Corsort):
         'corsort_delegate_quicksort'
     """
 
-    def __init__(self, sort, compute_history=False, record_leq=False, final_scorer=scorer_delta):
-        super().__init__(compute_history=compute_history, record_leq=record_leq, final_scorer=final_scorer)
+    def __init__(self, sort, compute_history=False, record_leq=False, final_scorer=scorer_delta, poset=PosetDense):
+        super().__init__(compute_history=compute_history, record_leq=record_leq, final_scorer=final_scorer,
+                         poset=poset)
         self.sort = sort
         self.__name__ = "corsort_delegate_" + self.sort.__name__
 
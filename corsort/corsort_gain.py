@@ -1,11 +1,120 @@
+import numpy as np
+from numba import njit  # type: ignore
 from corsort.corsort import Corsort
+from corsort.poset_dense import PosetDense
+from corsort.scorers import scorer_rho
+
+
+@njit
+def _jit_argmax_pair(rows, cols, keys):
+    """Compiled version of :func:`argmax_pair`, with the keys as a `(k, m)` float array."""
+    best = 0
+    for c in range(1, len(rows)):
+        better = rows[c] < rows[best] or (rows[c] == rows[best] and cols[c] < cols[best])
+        for k in range(keys.shape[0]):
+            if keys[k, c] != keys[k, best]:
+                better = keys[k, c] > keys[k, best]
+                break
+        if better:
+            best = c
+    return best
+
+
+def argmax_pair(rows, cols, gains, jit=False):
+    """
+    Candidate pair of maximal gain.
+
+    Parameters
+    ----------
+    rows: :class:`~numpy.ndarray`
+        Vector of size `m`. First index of each candidate pair.
+    cols: :class:`~numpy.ndarray`
+        Vector of size `m`. Second index of each candidate pair.
+    gains: :class:`~numpy.ndarray` or :class:`tuple` of :class:`~numpy.ndarray`
+        Vector of size `m`: gain of each candidate pair. If it is a tuple of vectors, the gains are compared in
+        lexicographic order.
+    jit: :class:`bool`
+        If True, then use a compiled kernel (the gains are converted to floats).
+
+    Returns
+    -------
+    :class:`tuple`
+        The pair (i, j) of maximal gain. In case of tie, the first one in lexicographic order.
+
+    Examples
+    --------
+        >>> my_rows = np.array([2, 0, 0, 1])
+        >>> my_cols = np.array([3, 3, 2, 2])
+        >>> argmax_pair(my_rows, my_cols, np.array([5, 7, 7, 6]))
+        (0, 2)
+        >>> argmax_pair(my_rows, my_cols, (np.array([5, 7, 7, 6]), np.array([0, 1, 0, 3])))
+        (0, 3)
+        >>> argmax_pair(my_rows, my_cols, (np.array([5, 7, 7, 6]), np.array([0, 1, 0, 3])), jit=True)
+        (0, 3)
+    """
+    if isinstance(gains, np.ndarray):
+        gains = (gains,)
+    if jit:
+        keys = np.array(gains, dtype=np.float64).reshape(len(gains), -1)
+        c = _jit_argmax_pair(rows, cols, keys)
+    else:
+        mask = np.ones(len(rows), dtype=bool)
+        for key in gains:
+            mask &= key == np.max(key[mask])
+        selected = np.flatnonzero(mask)
+        c = selected[np.lexsort((cols[selected], rows[selected]))[0]]
+    return int(rows[c]), int(cols[c])
 
 
 class CorsortGain(Corsort):
     """
     Corsort based on a `gain` function.
+
+    The next pair to compare is the one of maximal gain. A subclass defines the gains in one of the following ways:
+
+    * :meth:`gain_matrix`: gains of all the pairs at once, as a matrix of size `(n, n)` (or a tuple of matrices for
+      lexicographic gains). Only the incomparable pairs are considered.
+    * :meth:`gain_candidates`: gains of a list of candidate pairs, e.g. to consider only some of the pairs.
+    * :meth:`gain`: gain of one pair (i, j). All the pairs are examined in Python at each step, so it is only
+      suitable for small `n`.
+
+    Parameters
+    ----------
+    compute_history: :class:`bool`
+        If True, then compute the history of the distance to the sorted array.
+    record_leq: :class:`bool`
+        If True, then record all the states of the `leq_` matrix.
+    final_scorer: callable
+        Scorer used to compute the tentative estimate of the sorted list.
+    poset: class
+        Backend used to store the poset.
+    jit_selection: :class:`bool`
+        If True, then the pair of maximal gain among the candidates is found by a compiled kernel, cf.
+        :func:`argmax_pair`.
+
+    Examples
+    --------
+    Compare the incomparable pair whose position estimates are the closest:
+
+        >>> class CorsortClosest(CorsortGain):
+        ...     def gain_matrix(self):
+        ...         return -np.abs(self.position_estimates_[:, np.newaxis] - self.position_estimates_)
+        >>> my_perm = np.array([4, 1, 7, 6, 0, 8, 2, 3, 5])
+        >>> corsort = CorsortClosest(compute_history=True)
+        >>> corsort(my_perm).n_comparisons_
+        19
+        >>> corsort.history_distances_[-1]
+        0
+        >>> CorsortClosest(jit_selection=True)(my_perm).history_comparisons_ == corsort.history_comparisons_
+        True
     """
 
+    def __init__(self, compute_history=False, record_leq=False, final_scorer=scorer_rho, poset=PosetDense,
+                 jit_selection=False):
+        super().__init__(compute_history=compute_history, record_leq=record_leq, final_scorer=final_scorer,
+                         poset=poset)
+        self.jit_selection = jit_selection
+
     def gain(self, i, j):
         """
         Gain to be expected when comparing perm[i] and perm[j].
@@ -29,7 +138,53 @@ class CorsortGain(Corsort):
         """
         raise NotImplementedError
 
+    def gain_matrix(self):
+        """
+        Gains of all the pairs at once.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray` or :class:`tuple` of :class:`~numpy.ndarray`
+            Matrix of size `(n, n)`. Coefficient (i, j) is the gain to be expected when comparing perm[i] and
+            perm[j]. If it is a tuple of matrices, the gains are compared in lexicographic order. Only the
+            coefficients of the incomparable pairs (i, j) with i < j are used.
+        """
+        raise NotImplementedError
+
+    def gain_candidates(self):
+        """
+        Candidate pairs and their gains.
+
+        By default, the candidates are the incomparable pairs (i, j) with i < j, and their gains are read in
+        :meth:`gain_matrix`.
+
+        Returns
+        -------
+        rows: :class:`~numpy.ndarray`
+            First index of each candidate pair.
+        cols: :class:`~numpy.ndarray`
+            Second index of each candidate pair.
+        gains: :class:`~numpy.ndarray` or :class:`tuple` of :class:`~numpy.ndarray`
+            Gain of each candidate pair, cf. :func:`argmax_pair`.
+        """
+        rows, cols = np.nonzero(np.triu(self.leq_ == 0, 1))
+        matrices = self.gain_matrix()
+        if isinstance(matrices, np.ndarray):
+            return rows, cols, matrices[rows, cols]
+        return rows, cols, tuple(matrix[rows, cols] for matrix in matrices)
+
+    def _is_vectorized(self):
+        return (type(self).gain_matrix is not CorsortGain.gain_matrix
+                or type(self).gain_candidates is not CorsortGain.gain_candidates)
+
     def next_compare(self):
+        if self._is_vectorized():
+            while True:
+                rows, cols, gains = self.gain_candidates()
+                if len(rows) == 0:
+                    break
+                yield argmax_pair(rows, cols, gains, jit=self.jit_selection)
+            return
         while True:
             # Find pair (i, j) with maximal gain.
             max_gain, argmax_i, argmax_j = max(
@@ -74,3 +74,40 @@ class CorsortGainLexi(CorsortGain):
             Ensured gain if i and j are compared. Cf. :meth:`gain_i_lt_j`.
         """
         return min(self.gain_i_lt_j(i, j), self.gain_i_lt_j(j, i))
+
+    def gain_matrix(self):
+        """
+        Ensured gains of all the incomparable pairs at once, cf. :meth:`gain`. They are compared in lexicographic
+        order, cf. :meth:`~corsort.CorsortGain.gain_candidates`.
+
+        For `i < j` to teach something, each `x <= i` must learn the items `y >= j` that it did not know. With
+        `U[x, y] = 1` if `x <= y`, the number of pairs `(x, y)` with `x <= i`, `j <= y` that are already known is
+        `(U^T U U^T)[i, j]`, so all the gains are computed with two matrix products.
+
+        Returns
+        -------
+        n_pairs: :class:`~numpy.ndarray`
+            Matrix of size `(n, n)`. For an incomparable pair `(i, j)`, first element of :meth:`gain` (the value is
+            meaningless for comparable pairs).
+        closeness: :class:`~numpy.ndarray`
+            Matrix of size `(n, n)`. Second element of :meth:`gain`, i.e. opposite of the difference of position
+            estimates.
+
+        Examples
+        --------
+            >>> corsort = CorsortGainLexi()
+            >>> corsort._initialize_algo(np.array([3, 0, 2, 1]))
+            >>> corsort.apply_i_lt_j(1, 2)
+            >>> n_pairs, closeness = corsort.gain_matrix()
+            >>> int(n_pairs[0, 2]), corsort.gain(0, 2)[0]
+            (2, 2)
+            >>> int(n_pairs[0, 3]), corsort.gain(0, 3)[0]
+            (2, 2)
+        """
+        u = (self.leq_ == 1).astype(np.float64)
+        known = u.T @ (u @ u.T)
+        # A pair is learned from both sides, hence the factor 2 (cf. :meth:`gain_i_lt_j`).
+        learned = 2 * (np.outer(np.sum(u, axis=0), np.sum(u, axis=1)) - known)
+        n_pairs = np.minimum(learned, learned.T).astype(int)
+        closeness = -np.abs(self.position_estimates_[np.newaxis, :] - self.position_estimates_[:, np.newaxis])
+        return n_pairs, closeness
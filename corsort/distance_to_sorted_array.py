@@ -1,10 +1,58 @@
 import numpy as np
-import scipy  # type: ignore
+from numba import njit  # type: ignore
 
 
-def _distance_to_sorted_array_old_old(xs):
+@njit
+def _count_inversions(xs):
     """
-    Kendall-tau distance to the sorted array.
+    Number of inversions of an array, by a bottom-up merge sort.
+
+    Parameters
+    ----------
+    xs: :class:`~numpy.ndarray`
+        The array.
+
+    Returns
+    -------
+    :class:`int`
+        Number of pairs (i, j) with i < j and xs[i] > xs[j].
+    """
+    n = len(xs)
+    src = xs.copy()
+    dst = np.empty_like(src)
+    res = 0
+    width = 1
+    while width < n:
+        for start in range(0, n, 2 * width):
+            mid = min(start + width, n)
+            end = min(start + 2 * width, n)
+            i, j, k = start, mid, start
+            while i < mid and j < end:
+                if src[j] < src[i]:
+                    res += mid - i
+                    dst[k] = src[j]
+                    j += 1
+                else:
+                    dst[k] = src[i]
+                    i += 1
+                k += 1
+            while i < mid:
+                dst[k] = src[i]
+                i += 1
+                k += 1
+            while j < end:
+                dst[k] = src[j]
+                j += 1
+                k += 1
+        src, dst = dst, src
+        width *= 2
+    return res
+
+
+@njit
+def kendall_tau_to_sorted_array(xs):
+    """
+    Kendall-tau distance to the sorted array, in O(n log n).
 
     Parameters
     ----------
@@ -18,17 +66,43 @@ def _distance_to_sorted_array_old_old(xs):
 
     Examples
     --------
-        >>> _distance_to_sorted_array_old_old(np.array([2, 1, 3]))
+        >>> kendall_tau_to_sorted_array(np.array([2, 1, 3]))
         1
-        >>> _distance_to_sorted_array_old_old(np.array([4, 1, 7, 6, 0, 8, 2, 3, 5]))
+        >>> kendall_tau_to_sorted_array(np.array([4, 1, 7, 6, 0, 8, 2, 3, 5]))
         17
     """
-    return np.sum(np.tril(xs[:, np.newaxis] < xs[np.newaxis, :]))
+    return _count_inversions(xs)
+
+
+@njit
+def kendall_tau_to_sorted_array_batch(states):
+    """
+    Kendall-tau distance to the sorted array of several arrays.
+
+    Parameters
+    ----------
+    states: :class:`~numpy.ndarray`
+        Array of size `(m, n)`. Each row is an array.
+
+    Returns
+    -------
+    :class:`~numpy.ndarray`
+        Vector of size `m`. The distance of each row.
+
+    Examples
+    --------
+        >>> kendall_tau_to_sorted_array_batch(np.array([[2, 1, 3], [3, 2, 1]]))
+        array([1, 3])
+    """
+    res = np.zeros(states.shape[0], dtype=np.int_)
+    for k in range(states.shape[0]):
+        res[k] = _count_inversions(states[k])
+    return res
 
 
 def distance_to_sorted_array_old(xs):
     """
-    Kendall-tau distance to the sorted array.
+    Kendall-tau distance to the sorted array. Alias of :func:`kendall_tau_to_sorted_array`.
 
     Parameters
     ----------
@@ -47,9 +121,7 @@ def distance_to_sorted_array_old(xs):
         >>> distance_to_sorted_array_old(np.array([4, 1, 7, 6, 0, 8, 2, 3, 5]))
         17
     """
-    n = len(xs)
-    res = scipy.stats.kendalltau(xs, np.arange(n))
-    return round(n*(n-1)*(1-res.statistic)/4)
+    return kendall_tau_to_sorted_array(np.asarray(xs))
 
 
 def distance_to_sorted_array(xs):
@@ -59,12 +131,12 @@ def distance_to_sorted_array(xs):
     Parameters
     ----------
     xs: :class:`~numpy.ndarray`
-        The array.
+        The array, or an array of size `(m, n)` whose rows are arrays.
 
     Returns
     -------
-    :class:`int`
-        The distance
+    :class:`int` or :class:`~numpy.ndarray`
+        The distance, or the vector of the distances of the rows.
 
     Examples
     --------
@@ -72,8 +144,11 @@ def distance_to_sorted_array(xs):
         2
         >>> distance_to_sorted_array(np.array([4, 1, 7, 6, 0, 8, 2, 3, 5]))
         30
-    """
-    n = len(xs)
-    return np.sum(np.abs(np.argsort(xs) - np.arange(n)))
 
+    All the states of an execution can be processed in a single call:
 
+        >>> distance_to_sorted_array(np.array([[1, 0, 2], [2, 1, 0], [0, 1, 2]]))
+        array([2, 4, 0])
+    """
+    n = np.shape(xs)[-1]
+    return np.sum(np.abs(np.argsort(xs, axis=-1) - np.arange(n)), axis=-1)
@@ -0,0 +1,182 @@
+import os
+from numba import config, njit, prange  # type: ignore
+import numpy as np
+from corsort.entropy_bound import entropy_bound
+from corsort.jit_scorers import _replay
+from corsort.jit_sorts import CORSORT_VARIANTS, RECORD_FINAL, jit_corsort_variant
+from corsort.ragged_histories import RaggedHistories
+
+# With TBB, the pools of :mod:`corsort.montecarlo` hang once a parallel kernel has run: prefer the other layers.
+if 'NUMBA_THREADING_LAYER' not in os.environ and 'NUMBA_THREADING_LAYER_PRIORITY' not in os.environ:
+    config.THREADING_LAYER_PRIORITY = ['omp', 'workqueue', 'tbb']
+
+
+def _history_width(n):
+    """
+    Number of columns that almost always fits the history of distances of a sort of `n` items.
+
+    Parameters
+    ----------
+    n: :class:`int`
+        Number of items.
+
+    Returns
+    -------
+    :class:`int`
+        Width of the history (the good sorts are close to the entropy bound).
+
+    Examples
+    --------
+    >>> _history_width(10)
+    54
+    """
+    return int(2 * entropy_bound(n)) + n + 1
+
+
+@njit(parallel=True)
+def jit_corsort_batch(perms, core_rho, tie_break, output_rho, info0, history_width):
+    """
+    Run a corsort on a batch of permutations, in parallel.
+
+    Parameters
+    ----------
+    perms: :class:`~numpy.ndarray`
+        Array of size `(nt, n)`. Each row is a permutation to sort.
+    core_rho: :class:`bool`
+        Cf. :func:`~corsort.jit_sorts.jit_corsort_variant`.
+    tie_break: :class:`int`
+        Cf. :func:`~corsort.jit_sorts.jit_corsort_variant`.
+    output_rho: :class:`bool`
+        Cf. :func:`~corsort.jit_sorts.jit_corsort_variant`.
+    info0: :class:`int`
+        Cf. :func:`~corsort.jit_sorts.jit_corsort_variant`.
+    history_width: :class:`int`
+        Number of columns of the history of distances (0 to skip the history).
+
+    Returns
+    -------
+    n_comparisons: :class:`~numpy.ndarray`
+        Array of size `nt`. Number of comparisons for each permutation.
+    distances: :class:`~numpy.ndarray`
+        Array of size `(nt, history_width)`. History of the distance to the sorted list for each permutation,
+        padded with zeros (or truncated).
+
+    Examples
+    --------
+    >>> np.random.seed(42)
+    >>> ps = np.array([np.random.permutation(10) for _ in range(3)])
+    >>> nc, d = jit_corsort_batch(ps, *CORSORT_VARIANTS['corsort_delta_max_rho'], 25)
+    >>> nc
+    array([22, 22, 22])
+    >>> d[0]
+    array([34, 26, 22, 16, 10, 12,  8, 14,  8,  8,  4,  2,  0,  2,  2,  2,  4,
+            4,  4,  4,  2,  0,  0,  0,  0])
+    """
+    nt = perms.shape[0]
+    n_comparisons = np.zeros(nt, dtype=np.int_)
+    distances = np.zeros((nt, history_width), dtype=np.int_)
+    for k in prange(nt):
+        n_comparisons[k] = jit_corsort_variant(perms[k], core_rho, tie_break, output_rho, info0, distances[k])
+    return n_comparisons, distances
+
+
+@njit(parallel=True)
+def jit_scorer_batch(n, downs, ups, offsets, output_rho):
+    """
+    Final scores of a batch of comparison logs, replayed in parallel.
+
+    Parameters
+    ----------
+    n: :class:`int`
+        Number of items.
+    downs: :class:`~numpy.ndarray`
+        Indices of the lower items of all the logs, one after the other.
+    ups: :class:`~numpy.ndarray`
+        Indices of the higher items of all the logs, one after the other.
+    offsets: :class:`~numpy.ndarray`
+        Vector of size `nt + 1`. Log `k` is `downs[offsets[k]:offsets[k + 1]]` and `ups[offsets[k]:offsets[k + 1]]`.
+    output_rho: :class:`bool`
+        If True, compute the scores of :func:`~corsort.jit_scorer_rho`, otherwise those of
+        :func:`~corsort.jit_scorer_delta`.
+
+    Returns
+    -------
+    :class:`~numpy.ndarray`
+        Matrix of size `(nt, n)` (float). Final scores of each log.
+
+    Examples
+    --------
+    >>> from corsort import SortQuick, jit_scorer_rho
+    >>> np.random.seed(42)
+    >>> logs = [SortQuick()(np.random.permutation(10)).history_comparisons_ for _ in range(3)]
+    >>> my_offsets = np.cumsum([0] + [len(log) for log in logs])
+    >>> my_downs = np.concatenate([log.downs for log in logs])
+    >>> my_ups = np.concatenate([log.ups for log in logs])
+    >>> scores = jit_scorer_batch(10, my_downs, my_ups, my_offsets, True)
+    >>> np.array_equal(scores[1], jit_scorer_rho(10, logs[1].downs, logs[1].ups)[-1])
+    True
+    """
+    nt = len(offsets) - 1
+    res = np.zeros((nt, n))
+    for k in prange(nt):
+        a, b = offsets[k], offsets[k + 1]
+        scores_rho, scores_delta = _replay(n, downs[a:b], ups[a:b], RECORD_FINAL, output_rho)
+        if output_rho:
+            res[k] = scores_rho[0]
+        else:
+            res[k] = scores_delta[0]
+    return res
+
+
+def corsort_batch(perms, name, compute_history=False):
+    """
+    Run a corsort of :mod:`corsort.jit_sorts` on a batch of permutations.
+
+    Parameters
+    ----------
+    perms: :class:`~numpy.ndarray`
+        Array of size `(nt, n)`. Each row is a permutation to sort.
+    name: :class:`str`
+        Name of the corsort, e.g. `'corsort_delta_max_rho'` (cf. :data:`~corsort.jit_sorts.CORSORT_VARIANTS`).
+    compute_history: :class:`bool`
+        If True, then compute the history of the distance to the sorted array.
+
+    Returns
+    -------
+    n_comparisons: :class:`~numpy.ndarray`
+        Array of size `nt`. Number of comparisons for each permutation.
+    distances: :class:`~corsort.RaggedHistories`
+        History of the distance to the sorted list for each permutation (empty if `compute_history` is False).
+
+    Examples
+    --------
+    >>> from corsort.jit_sorts import jit_corsort_delta_max_rho
+    >>> np.random.seed(42)
+    >>> ps = np.array([np.random.permutation(20) for _ in range(100)])
+    >>> nc, d = corsort_batch(ps, 'corsort_delta_max_rho', compute_history=True)
+    >>> np.array_equal(d.lengths, nc + 1)
+    True
+
+    This is the same as running the sort on each permutation:
+
+    >>> _, _, co, history = jit_corsort_delta_max_rho(ps[0], compute_history=True)
+    >>> nc[0] == len(co)
+    True
+    >>> np.array_equal(d[0], history)
+    True
+    """
+    perms = np.ascontiguousarray(perms)
+    params = CORSORT_VARIANTS[name]
+    if not compute_history:
+        n_comparisons, _ = jit_corsort_batch(perms, *params, 0)
+        return n_comparisons, RaggedHistories(np.zeros(0, dtype=int), np.zeros(perms.shape[0] + 1, dtype=int))
+    width = _history_width(perms.shape[1])
+    n_comparisons, distances = jit_corsort_batch(perms, *params, width)
+    truncated = np.flatnonzero(n_comparisons + 1 > width)
+    if len(truncated):
+        # Run again the truncated executions (deterministic) with the exact width.
+        max_width = int(np.max(n_comparisons)) + 1
+        _, distances_truncated = jit_corsort_batch(perms[truncated], *params, max_width)
+        distances = np.concatenate([distances, np.zeros((perms.shape[0], max_width - width), dtype=int)], axis=1)
+        distances[truncated] = distances_truncated
+    return n_comparisons, RaggedHistories.from_padded(distances, n_comparisons + 1)
@@ -0,0 +1,298 @@
+from numba import njit  # type: ignore
+import numpy as np
+from corsort.split_pointer_lists import split_pointer_lists
+
+
+@njit
+def _new_log(n):
+    """Empty comparison log, with room for about n log2(n) comparisons (it is enlarged if needed)."""
+    return np.empty((int(n * np.log2(n + 1)) + 1, 2), dtype=np.int32)
+
+
+@njit
+def _lt(perm, i, j, comparisons, m):
+    """
+    Test whether perm[i] < perm[j] and write the comparison in row `m` of the log.
+
+    Returns the result and the log, which is a new array if it had to be enlarged.
+    """
+    if m == comparisons.shape[0]:
+        new = np.empty((2 * m + 1, 2), dtype=np.int32)
+        new[:m] = comparisons
+        comparisons = new
+    if perm[i] < perm[j]:
+        comparisons[m, 0] = i
+        comparisons[m, 1] = j
+        return True, comparisons
+    comparisons[m, 0] = j
+    comparisons[m, 1] = i
+    return False, comparisons
+
+
+@njit
+def jit_quicksort(perm):
+    """
+    Quicksort, same comparisons as :class:`~corsort.SortQuick`.
+
+    Parameters
+    ----------
+    perm: :class:`~numpy.ndarray`
+        Input permutation to sort.
+
+    Returns
+    -------
+    sorted_indices: :class:`~numpy.ndarray`
+        Indices of the items in sorted order.
+    comparisons: :class:`~numpy.ndarray`
+        Array of size `(m, 2)` (int32). Row (i, j) means that items of indices i and j were compared, and that
+        perm[i] < perm[j].
+
+    Examples
+    --------
+    >>> indices, comparisons = jit_quicksort(np.array([4, 1, 7, 6, 0, 8, 2, 3, 5]))
+    >>> indices
+    array([4, 1, 6, 7, 0, 8, 3, 2, 5])
+    >>> comparisons[:5]
+    array([[1, 0],
+           [0, 2],
+           [0, 3],
+           [4, 0],
+           [0, 5]], dtype=int32)
+    >>> len(comparisons)
+    16
+    """
+    n = len(perm)
+    xs = np.arange(n)
+    comparisons = _new_log(n)
+    m = 0
+    # Stack of the (i, j) portions to sort, the left portion being processed first.
+    stack = [(0, n - 1)]
+    while len(stack):
+        i, j = stack.pop()
+        if not i < j:
+            continue
+        pivot_value = xs[i]
+        pivot_index = i
+        for k in range(i + 1, j + 1):
+            lower, comparisons = _lt(perm, xs[k], pivot_value, comparisons, m)
+            m += 1
+            if lower:
+                x = xs[k]
+                xs[pivot_index + 2:k + 1] = xs[pivot_index + 1:k].copy()
+                xs[pivot_index] = x
+                xs[pivot_index + 1] = pivot_value
+                pivot_index += 1
+        stack.append((pivot_index + 1, j))
+        stack.append((i, pivot_index - 1))
+    return xs, comparisons[:m]
+
+
+@njit
+def _merge(perm, xs, i, j, k, comparisons, m):
+    """Merge xs[i:j] and xs[j:k] like :func:`~corsort.merge`. Returns the log and the number of comparisons."""
+    begin_left = i
+    begin_right = j
+    while begin_left < begin_right < k:
+        lower, comparisons = _lt(perm, xs[begin_left], xs[begin_right], comparisons, m)
+        m += 1
+        if not lower:
+            item_to_insert = xs[begin_right]
+            xs[begin_left + 1:begin_right + 1] = xs[begin_left:begin_right].copy()
+            xs[begin_left] = item_to_insert
+            begin_right += 1
+        begin_left += 1
+    return comparisons, m
+
+
+@njit
+def _merge_sort(perm, merges):
+    """Merge sort given the (i, j, k) merges to perform, in order."""
+    n = len(perm)
+    xs = np.arange(n)
+    comparisons = _new_log(n)
+    m = 0
+    for r in range(merges.shape[0]):
+        comparisons, m = _merge(perm, xs, merges[r, 0], merges[r, 1], merges[r, 2], comparisons, m)
+    return xs, comparisons[:m]
+
+
+@njit
+def _merges_top_down(n):
+    """Merges of the top-down merge sort (post-order of the recursion)."""
+    merges = [(0, 0, 0) for _ in range(0)]
+    # Each portion is visited twice: first to split it, then to merge its halves.
+    stack = [(0, n, False)]
+    while len(stack):
+        i, j, merging = stack.pop()
+        if j - i <= 1:
+            continue
+        middle = (i + j) // 2
+        if merging:
+            merges.append((i, middle, j))
+        else:
+            stack.append((i, j, True))
+            stack.append((middle, j, False))
+            stack.append((i, middle, False))
+    res = np.empty((len(merges), 3), dtype=np.int_)
+    for r in range(len(merges)):
+        res[r, 0], res[r, 1], res[r, 2] = merges[r]
+    return res
+
+
+@njit
+def jit_merge_sort_top_down(perm):
+    """
+    Merge sort, top-down, same comparisons as :class:`~corsort.SortMergeTopDown`.
+
+    Parameters
+    ----------
+    perm: :class:`~numpy.ndarray`
+        Input permutation to sort.
+
+    Returns
+    -------
+    sorted_indices: :class:`~numpy.ndarray`
+        Indices of the items in sorted order.
+    comparisons: :class:`~numpy.ndarray`
+        Array of size `(m, 2)` (int32), cf. :func:`jit_quicksort`.
+
+    Examples
+    --------
+    >>> indices, comparisons = jit_merge_sort_top_down(np.array([4, 1, 7, 6, 0, 8, 2, 3, 5]))
+    >>> indices
+    array([4, 1, 6, 7, 0, 8, 3, 2, 5])
+    >>> comparisons[:3]
+    array([[1, 0],
+           [3, 2],
+           [1, 3]], dtype=int32)
+    >>> len(comparisons)
+    19
+    """
+    return _merge_sort(perm, _merges_top_down(len(perm)))
+
+
+def jit_merge_sort_bottom_up(perm):
+    """
+    Merge sort, bottom-up, same comparisons as :class:`~corsort.SortMergeBottomUp`.
+
+    The merges are planned in Python (cf. :func:`~corsort.split_pointer_lists`), then performed by a compiled kernel.
+
+    Parameters
+    ----------
+    perm: :class:`~numpy.ndarray`
+        Input permutation to sort.
+
+    Returns
+    -------
+    sorted_indices: :class:`~numpy.ndarray`
+        Indices of the items in sorted order.
+    comparisons: :class:`~numpy.ndarray`
+        Array of size `(m, 2)` (int32), cf. :func:`jit_quicksort`.
+
+    Examples
+    --------
+    >>> indices, comparisons = jit_merge_sort_bottom_up(np.array([4, 1, 7, 6, 0, 8, 2, 3, 5]))
+    >>> indices
+    array([4, 1, 6, 7, 0, 8, 3, 2, 5])
+    """
+    merges = [(pointers[i], pointers[i + 1], pointers[i + 2])
+              for pointers in split_pointer_lists(len(perm))[::-1]
+              for i in range(0, len(pointers) - 1, 2)]
+    return _merge_sort(np.asarray(perm), np.array(merges, dtype=np.int_).reshape(-1, 3))
+
+
+@njit
+def jit_binary_insertion_sort(perm):
+    """
+    Binary insertion sort, same comparisons as :class:`~corsort.SortBinaryInsertion`.
+
+    Parameters
+    ----------
+    perm: :class:`~numpy.ndarray`
+        Input permutation to sort.
+
+    Returns
+    -------
+    sorted_indices: :class:`~numpy.ndarray`
+        Indices of the items in sorted order.
+    comparisons: :class:`~numpy.ndarray`
+        Array of size `(m, 2)` (int32), cf. :func:`jit_quicksort`.
+
+    Examples
+    --------
+    >>> indices, comparisons = jit_binary_insertion_sort(np.array([4, 1, 7, 6, 0, 8, 2, 3, 5]))
+    >>> indices
+    array([4, 1, 6, 7, 0, 8, 3, 2, 5])
+    >>> len(comparisons)
+    19
+    """
+    n = len(perm)
+    xs = np.arange(n)
+    comparisons = _new_log(n)
+    m = 0
+    for i_to_sort in range(n):
+        x_to_sort = xs[i_to_sort]
+        i_smaller_or_equal = -1
+        i_greater = i_to_sort
+        while i_greater - i_smaller_or_equal > 1:
+            i_test = (i_smaller_or_equal + i_greater) // 2
+            lower, comparisons = _lt(perm, x_to_sort, xs[i_test], comparisons, m)
+            m += 1
+            if lower:
+                i_greater = i_test
+            else:
+                i_smaller_or_equal = i_test
+        xs[i_greater + 1:i_to_sort + 1] = xs[i_greater:i_to_sort].copy()
+        xs[i_greater] = x_to_sort
+    return xs, comparisons[:m]
+
+
+@njit
+def jit_shellsort(perm, gap_sequence):
+    """
+    Shellsort, same comparisons as :class:`~corsort.SortShell`.
+
+    Parameters
+    ----------
+    perm: :class:`~numpy.ndarray`
+        Input permutation to sort.
+    gap_sequence: :class:`~numpy.ndarray`
+        Gap sequence.
+
+    Returns
+    -------
+    sorted_indices: :class:`~numpy.ndarray`
+        Indices of the items in sorted order.
+    comparisons: :class:`~numpy.ndarray`
+        Array of size `(m, 2)` (int32), cf. :func:`jit_quicksort`.
+
+    Examples
+    --------
+    >>> my_gaps = np.array([701, 301, 132, 57, 23, 10, 4, 1])
+    >>> indices, comparisons = jit_shellsort(np.array([4, 1, 7, 6, 0, 8, 2, 3, 5]), my_gaps)
+    >>> indices
+    array([4, 1, 6, 7, 0, 8, 3, 2, 5])
+    >>> len(comparisons)
+    22
+    """
+    n = len(perm)
+    xs = np.arange(n)
+    comparisons = _new_log(n)
+    m = 0
+    for gap in gap_sequence:
+        for i in range(gap, n):
+            temp = xs[i]
+            j = i
+            while j >= 0:
+                # Like in :func:`~corsort.sort_shell._shellsort`, a negative index wraps around.
+                previous = j - gap if j >= gap else j - gap + n
+                xs[j] = xs[previous]
+                lower, comparisons = _lt(perm, xs[previous], temp, comparisons, m)
+                m += 1
+                if lower:
+                    break
+                j -= gap
+            if j < 0:
+                j += gap
+            xs[j] = temp
+    return xs, comparisons[:m]
@@ -1,9 +1,98 @@
 from numba import njit  # type: ignore
 import numpy as np
+from corsort.jit_sorts import RECORD_FULL, RECORD_FINAL, RECORD_NONE, _is_recorded
+
+_M1 = np.uint64(0x5555555555555555)
+_M2 = np.uint64(0x3333333333333333)
+_M4 = np.uint64(0x0f0f0f0f0f0f0f0f)
+_H01 = np.uint64(0x0101010101010101)
+
+
+@njit
+def _popcount(x):
+    """Number of set bits of a uint64 word."""
+    x = x - ((x >> np.uint64(1)) & _M1)
+    x = (x & _M2) + ((x >> np.uint64(2)) & _M2)
+    x = (x + (x >> np.uint64(4))) & _M4
+    return int((x * _H01) >> np.uint64(56))
+
+
+@njit
+def _has(bits, k):
+    """Whether bit `k` is set in the bitset `bits`."""
+    return (bits[k >> 6] >> np.uint64(k & 63)) & np.uint64(1)
+
+
+@njit
+def _n_records(n_comparisons, record_step):
+    """Number of states recorded when replaying `n_comparisons` comparisons."""
+    if record_step == RECORD_NONE:
+        return 0
+    if record_step == RECORD_FINAL:
+        return 1
+    return n_comparisons // record_step + 1 + (n_comparisons % record_step > 0)
+
+
+@njit
+def _replay(n, downs, ups, record_step, output_rho):
+    """
+    Replay a log of comparisons on bitsets of ancestors and descendants.
+
+    For the comparison i < j, each item below i (included) learns the items above j that it did not know, and
+    conversely: the new pairs are counted with a popcount instead of being scanned one by one.
+
+    Returns the recorded scores rho (float, if `output_rho`) or delta (int, otherwise), one row per record; the
+    other array is empty.
+    """
+    n_words = (n + 63) // 64
+    # below[k] is the set of items known to be lower than or equal to k, above[k] the set of those greater or equal.
+    below = np.zeros((n, n_words), dtype=np.uint64)
+    above = np.zeros((n, n_words), dtype=np.uint64)
+    for k in range(n):
+        below[k, k >> 6] = np.uint64(1) << np.uint64(k & 63)
+        above[k, k >> 6] = np.uint64(1) << np.uint64(k & 63)
+    down = np.ones(n, dtype=np.int_)
+    tot = np.full(n, 2, dtype=np.int_)
+    pos = np.zeros(n, dtype=np.int_)
+    m = len(ups)
+    n_records = _n_records(m, record_step)
+    scores_rho = np.zeros((n_records if output_rho else 0, n))
+    scores_delta = np.zeros((0 if output_rho else n_records, n), dtype=np.int_)
+    r = 0
+    for k in range(m + 1):
+        if _is_recorded(k, k == m, record_step):
+            if output_rho:
+                scores_rho[r] = down / tot
+            else:
+                scores_delta[r] = pos
+            r += 1
+        if k == m:
+            break
+        i, j = downs[k], ups[k]
+        if _has(below[j], i):
+            continue
+        for jj in range(n):
+            if _has(above[j], jj):
+                new = 0
+                for w in range(n_words):
+                    new += _popcount(below[i, w] & ~below[jj, w])
+                    below[jj, w] |= below[i, w]
+                down[jj] += new
+                tot[jj] += new
+                pos[jj] += new
+        for ii in range(n):
+            if _has(below[i], ii):
+                new = 0
+                for w in range(n_words):
+                    new += _popcount(above[j, w] & ~above[ii, w])
+                    above[ii, w] |= above[j, w]
+                tot[ii] += new
+                pos[ii] -= new
+    return scores_rho, scores_delta
 
 
 @njit
-def jit_scorer_rho(n, downs, ups):
+def jit_scorer_rho(n, downs, ups, record_step=RECORD_FULL):
     """
     Estimates scores of nodes by dividing the number of the descendants by the size of the family plus one.
     The rational is to consider that the family should be in average evenly spaced in the sorted result.
@@ -16,11 +105,14 @@ def jit_scorer_rho(n, downs, ups):
         Indices of the low value of a sequence of performed comparisons
     ups: :class:`~numpy.ndarray`
         Indices of the high value of a sequence of performed comparisons
+    record_step: :class:`int`
+        Recording mode, cf. :func:`~corsort.jit_sorts.jit_corsort_delta_max_rho`: `RECORD_FULL` (after each
+        comparison), `RECORD_FINAL` (only the final scores), or a number `k` of comparisons between two records.
 
     Returns
     -------
     :class:`~numpy.ndarray`
-        An array that represents, for each new performed comparison,
+        An array that represents, for each new performed comparison (or each recorded step),
         some item scores that estimate the final position of items.
 
     Examples
@@ -34,30 +126,21 @@ def jit_scorer_rho(n, downs, ups):
            [0.33333333, 0.5       , 0.66666667, 0.5       , 0.5       ],
            [0.33333333, 0.33333333, 0.75      , 0.5       , 0.5       ],
            [0.25      , 0.25      , 0.6       , 0.8       , 0.5       ]])
+
+    Only every second step, or only the final scores:
+
+    >>> jit_scorer_rho(my_n, my_downs, my_ups, 2)
+    array([[0.5       , 0.5       , 0.5       , 0.5       , 0.5       ],
+           [0.33333333, 0.33333333, 0.75      , 0.5       , 0.5       ],
+           [0.25      , 0.25      , 0.6       , 0.8       , 0.5       ]])
+    >>> jit_scorer_rho(my_n, my_downs, my_ups, RECORD_FINAL)
+    array([[0.25, 0.25, 0.6 , 0.8 , 0.5 ]])
     """
-    ncp = len(ups) + 1
-    leq = np.eye(n, dtype=np.int8)
-    down = np.zeros(n, dtype=np.int_) + 1
-    tot = np.zeros(n, dtype=np.int_) + 2
-    res = np.zeros((ncp, n))
-    res[0, :] = down / tot
-    for k in range(len(ups)):
-        i, j = downs[k], ups[k]
-        for ii in range(n):
-            if leq[ii, i] > 0:
-                for jj in range(n):
-                    if leq[j, jj] > 0 and leq[ii, jj] == 0:
-                        leq[ii, jj] = 1
-                        leq[jj, ii] = -1
-                        tot[ii] += 1
-                        tot[jj] += 1
-                        down[jj] += 1
-        res[(k + 1), :] = down / tot
-    return res
+    return _replay(n, downs, ups, record_step, True)[0]
 
 
 @njit
-def jit_scorer_delta(n, downs, ups):
+def jit_scorer_delta(n, downs, ups, record_step=RECORD_FULL):
     """
     Estimates scores of nodes by the difference between the numbers of descendants and ascendants.
     The rational is to consider that an item should be in average halfway between
@@ -71,11 +154,14 @@ def jit_scorer_delta(n, downs, ups):
         Indices of the low value of a sequence of performed comparisons
     ups: :class:`~numpy.ndarray`
         Indices of the high value of a sequence of performed comparisons
+    record_step: :class:`int`
+        Recording mode, cf. :func:`~corsort.jit_sorts.jit_corsort_delta_max_rho`: `RECORD_FULL` (after each
+        comparison), `RECORD_FINAL` (only the final scores), or a number `k` of comparisons between two records.
 
     Returns
     -------
     :class:`~numpy.ndarray`
-        An array that represents, for each new performed comparison,
+        An array that represents, for each new performed comparison (or each recorded step),
         some item scores that estimate the final position of items.
 
     Examples
@@ -90,19 +176,4 @@ def jit_scorer_delta(n, downs, ups):
            [-1, -1,  2,  0,  0],
            [-2, -2,  1,  3,  0]])
     """
-    ncp = len(ups) + 1
-    leq = np.eye(n, dtype=np.int8)
-    pos = np.zeros(n, dtype=np.int_)
-    res = np.zeros((ncp, n), dtype=np.int_)
-    for k in range(len(ups)):
-        i, j = downs[k], ups[k]
-        for ii in range(n):
-            if leq[ii, i] > 0:
-                for jj in range(n):
-                    if leq[j, jj] > 0 and leq[ii, jj] == 0:
-                        leq[ii, jj] = 1
-                        leq[jj, ii] = -1
-                        pos[ii] -= 1
-                        pos[jj] += 1
-        res[(k + 1), :] = pos
-    return res
+    return _replay(n, downs, ups, record_step, False)[1]
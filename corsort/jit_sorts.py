@@ -1,9 +1,417 @@
 from numba import njit  # type: ignore
 import numpy as np
 
+TIE_BREAK_MAX = 0
+TIE_BREAK_SUM = 1
+TIE_BREAK_SUM_MAX = 2
+
+RECORD_NONE = 0
+"""Recording mode of the jit sorts: do not record the states and scores."""
+RECORD_FULL = 1
+"""Recording mode of the jit sorts: record the states and scores after each comparison. More generally, a recording
+mode `k > 0` records them every `k` comparisons (and at the end)."""
+RECORD_FINAL = -1
+"""Recording mode of the jit sorts: record only the final state and scores."""
+
+
+@njit
+def _record_capacity(n, record_step):
+    """Initial number of rows of the recording arrays (they are enlarged if needed)."""
+    if record_step == RECORD_NONE:
+        return 0
+    if record_step == RECORD_FINAL:
+        return 1
+    # Most sorts need about n log2(n) comparisons.
+    return int(n * np.log2(n + 1)) // record_step + 2
+
+
+@njit
+def _is_recorded(step, final, record_step):
+    """Whether the state after `step` comparisons is recorded."""
+    if record_step == RECORD_NONE:
+        return False
+    if final:
+        return True
+    return record_step > 0 and step % record_step == 0
+
+
+@njit
+def _grow(arr):
+    """Copy of a 2-D array with (about) twice as many rows."""
+    new = np.empty((2 * arr.shape[0] + 1, arr.shape[1]), dtype=arr.dtype)
+    new[:arr.shape[0]] = arr
+    return new
+
+
+@njit
+def _grow_1d(arr):
+    """Copy of a 1-D array with (about) twice as many elements."""
+    new = np.empty(2 * len(arr) + 1, dtype=arr.dtype)
+    new[:len(arr)] = arr
+    return new
+
+
+@njit
+def _ranks(perm):
+    ranks = np.empty(len(perm), dtype=np.int_)
+    ranks[np.argsort(perm)] = np.arange(len(perm))
+    return ranks
+
+
+@njit
+def _footrule(ranks, order):
+    """Spearman footrule distance between `order` and the sorted list, where `ranks` are the true ranks."""
+    d = 0
+    for k in range(len(order)):
+        d += abs(ranks[order[k]] - k)
+    return d
+
+
+@njit
+def _sort_and_update_footrule(order, score, ranks, d):
+    """
+    Sort the items by increasing score (and index for ties), in place, and update the footrule distance `d`.
+
+    Insertion sort: only the items whose rank moves are visited, so it is close to linear after a comparison.
+    """
+    for p in range(1, len(order)):
+        x = order[p]
+        q = p - 1
+        while q >= 0 and (score[order[q]] > score[x] or (score[order[q]] == score[x] and order[q] > x)):
+            y = order[q]
+            d += abs(ranks[y] - q - 1) - abs(ranks[y] - q)
+            order[q + 1] = y
+            q -= 1
+        if q + 1 != p:
+            d += abs(ranks[x] - q - 1) - abs(ranks[x] - p)
+            order[q + 1] = x
+    return d
+
+
+@njit
+def _sort_by_estimate(order, est):
+    """
+    Sort the items by increasing estimate (and index for ties), in place.
+
+    Insertion sort: after a comparison, `order` is almost sorted, so this is close to linear.
+    """
+    for p in range(1, len(order)):
+        x = order[p]
+        q = p - 1
+        while q >= 0 and (est[order[q]] > est[x] or (est[order[q]] == est[x] and order[q] > x)):
+            order[q + 1] = order[q]
+            q -= 1
+        order[q + 1] = x
+
 
 @njit
-def jit_corsort_borda(perm):
+def _is_better(diff_ij, xp_ij, ii, jj, diff, xp, i, j, found, tie_break):
+    """
+    Whether pair (ii, jj) beats pair (i, j): smaller gap, then better knowledge, then first in lexicographic order.
+    """
+    if diff_ij != diff:
+        return diff_ij < diff
+    if xp_ij != xp:
+        if tie_break == TIE_BREAK_SUM_MAX:
+            return xp_ij > xp
+        return xp_ij < xp
+    return found and (ii < i or (ii == i and jj < j))
+
+
+@njit
+def _best_pair_in_group(order, start, end, info, tie_break):
+    """
+    Best pair among the items `order[start:end]`, which are sorted by index and pairwise incomparable.
+
+    The best pair minimizes the knowledge (maximizes it for Borda), then comes first in lexicographic order.
+    """
+    sign = -1 if tie_break == TIE_BREAK_SUM_MAX else 1
+    # Two smallest signed knowledges (with multiplicity). The knowledges are at most `len(info) + 1`.
+    m1 = m2 = 2 * len(info) + 2
+    for p in range(start, end):
+        v = sign * info[order[p]]
+        if v < m1:
+            m2 = m1
+            m1 = v
+        elif v < m2:
+            m2 = v
+    if tie_break == TIE_BREAK_MAX or m1 == m2:
+        # All the pairs of items whose knowledge is at most m2 are equally good.
+        first = -1
+        for p in range(start, end):
+            x = order[p]
+            if sign * info[x] <= m2:
+                if first < 0:
+                    first = x
+                else:
+                    return first, x, (m2 if tie_break == TIE_BREAK_MAX else sign * 2 * m2)
+    # The item with knowledge m1 is unique: pair it with the first item with knowledge m2.
+    u = w = -1
+    for p in range(start, end):
+        x = order[p]
+        if sign * info[x] == m1:
+            u = x
+        elif w < 0 and sign * info[x] == m2:
+            w = x
+    return min(u, w), max(u, w), sign * (m1 + m2)
+
+
+@njit
+def _next_pair(order, est, info, leq, tie_break):
+    """
+    Pair of incomparable items with the closest estimates, with the knowledge of the items as tie-break.
+
+    Parameters
+    ----------
+    order: :class:`~numpy.ndarray`
+        Items sorted by estimate, then index (cf. :func:`_sort_by_estimate`).
+    est: :class:`~numpy.ndarray`
+        Estimate of each item.
+    info: :class:`~numpy.ndarray`
+        Knowledge of each item.
+    leq: :class:`~numpy.ndarray`
+        Current `leq` matrix.
+    tie_break: :class:`int`
+        `TIE_BREAK_MAX`, `TIE_BREAK_SUM` or `TIE_BREAK_SUM_MAX`.
+
+    Returns
+    -------
+    i: :class:`int`
+        First item of the pair.
+    j: :class:`int`
+        Second item of the pair (`i < j`).
+    diff: :class:`float`
+        Gap between their estimates, or `n` if no pair is found.
+
+    Notes
+    -----
+    The result is the same as scanning all the pairs `(i, j)` with `i < j` in lexicographic order, but only the
+    neighbours in score order are examined. Comparable items always have different estimates, so each group of
+    items with equal estimates is solved directly from the knowledges. When all estimates are distinct, the scan of
+    the successors of each item stops as soon as the gap exceeds the best one found so far.
+    """
+    n = len(order)
+    diff = float(n)
+    if tie_break == TIE_BREAK_MAX:
+        xp = n + 1
+    elif tie_break == TIE_BREAK_SUM:
+        xp = 2 * n
+    else:
+        xp = 0
+    i, j = 0, 1
+    found = False
+    start = 0
+    while start < n:
+        end = start + 1
+        while end < n and est[order[end]] == est[order[start]]:
+            end += 1
+        if end - start >= 2:
+            ii, jj, xp_ij = _best_pair_in_group(order, start, end, info, tie_break)
+            if _is_better(0., xp_ij, ii, jj, diff, xp, i, j, found, tie_break):
+                diff, xp, i, j, found = 0., xp_ij, ii, jj, True
+        start = end
+    if found:
+        return i, j, diff
+    for p in range(n - 1):
+        x = order[p]
+        for q in range(p + 1, n):
+            y = order[q]
+            diff_ij = est[y] - est[x]
+            if diff_ij > diff:
+                break
+            if leq[x, y] == 0:
+                if tie_break == TIE_BREAK_MAX:
+                    xp_ij = max(info[x], info[y])
+                else:
+                    xp_ij = info[x] + info[y]
+                ii, jj = min(x, y), max(x, y)
+                if _is_better(diff_ij, xp_ij, ii, jj, diff, xp, i, j, found, tie_break):
+                    diff, xp, i, j, found = diff_ij, xp_ij, ii, jj, True
+    return i, j, diff
+
+
+@njit
+def _jit_corsort(perm, core_rho, tie_break, output_rho, info0, distances, grow_distances, record_step,
+                 record_comparisons):
+    """
+    Engine shared by all the corsorts of this module.
+
+    Parameters
+    ----------
+    perm: :class:`~numpy.ndarray`
+        A random permutation.
+    core_rho: :class:`bool`
+        If True, use the rho core scorer, else the delta core scorer.
+    tie_break: :class:`int`
+        `TIE_BREAK_MAX` (max-knowledge), `TIE_BREAK_SUM` (sum-knowledge) or `TIE_BREAK_SUM_MAX` (Borda).
+    output_rho: :class:`bool`
+        If True, use the rho output scorer, else the delta output scorer.
+    info0: :class:`int`
+        Initial value of the knowledge of each item.
+    distances: :class:`~numpy.ndarray`
+        Array of int where the history of the Spearman footrule distance to the sorted list is written. If the
+        execution is longer than the array, the history is truncated (unless `grow_distances`). Use an empty array to
+        skip the history.
+    grow_distances: :class:`bool`
+        If True, `distances` is replaced by a larger array when full, so that the history is never truncated.
+    record_step: :class:`int`
+        Recording mode of the states and scores: `RECORD_NONE`, `RECORD_FULL`, `RECORD_FINAL` or a number of
+        comparisons `k` between two records.
+    record_comparisons: :class:`bool`
+        If True, record the comparisons.
+
+    Returns
+    -------
+    n_comparisons: :class:`int`
+        Number of comparisons.
+    states: :class:`~numpy.ndarray`
+        Recorded estimates of the sorted result, one per row.
+    scores_delta: :class:`~numpy.ndarray`
+        Recorded delta output scores, one per row (no row if `output_rho` is True).
+    scores_rho: :class:`~numpy.ndarray`
+        Recorded rho output scores, one per row (no row if `output_rho` is False).
+    comparisons: :class:`~numpy.ndarray`
+        Array of size `(n_comparisons, 2)` (int32) of the performed comparisons (empty if `record_comparisons` is
+        False).
+    distances: :class:`~numpy.ndarray`
+        History of the distance to the sorted list (the input array, or a larger one if it was grown), truncated to
+        the length of the execution.
+
+    Notes
+    -----
+    The estimate of the sorted list sorts the items by output score, then by index. It is maintained by insertion
+    sort, and the Spearman footrule distance is updated for the items that move only.
+    """
+    n = len(perm)
+    ranks = _ranks(perm)
+    leq = np.eye(n, dtype=np.int8)
+    pos = np.zeros(n, dtype=np.int_)
+    down = np.zeros(n, dtype=np.int_) + 1
+    info = np.zeros(n, dtype=np.int_) + info0
+    capacity = _record_capacity(n, record_step)
+    states = np.empty((capacity, n), dtype=perm.dtype)
+    scores_delta = np.empty((0 if output_rho else capacity, n), dtype=np.int_)
+    scores_rho = np.empty((capacity if output_rho else 0, n), dtype=np.float64)
+    n_records = 0
+    comparisons = np.empty((_record_capacity(n, RECORD_FULL) if record_comparisons else 0, 2), dtype=np.int32)
+    by_est = np.arange(n)
+    by_output = np.arange(n)
+    d = _footrule(ranks, by_output)
+    m = len(distances)
+    track_output = m > 0 or grow_distances or record_step != RECORD_NONE
+    n_comparisons = 0
+    while True:
+        if core_rho:
+            est = down / info
+        else:
+            est = pos.astype(np.float64)
+        _sort_by_estimate(by_est, est)
+        i, j, diff = _next_pair(by_est, est, info, leq, tie_break)
+        final = diff == n
+        record = _is_recorded(n_comparisons, final, record_step)
+        if track_output:
+            if output_rho:
+                rho = down / info
+                d = _sort_and_update_footrule(by_output, rho, ranks, d)
+            else:
+                d = _sort_and_update_footrule(by_output, pos, ranks, d)
+            if record:
+                if n_records == states.shape[0]:
+                    states = _grow(states)
+                    if output_rho:
+                        scores_rho = _grow(scores_rho)
+                    else:
+                        scores_delta = _grow(scores_delta)
+                states[n_records] = perm[by_output]
+                if output_rho:
+                    scores_rho[n_records] = rho
+                else:
+                    scores_delta[n_records] = pos
+                n_records += 1
+            if n_comparisons == m and grow_distances:
+                distances = _grow_1d(distances)
+                m = len(distances)
+            if n_comparisons < m:
+                distances[n_comparisons] = d
+        if final:
+            break
+        if perm[i] > perm[j]:
+            i, j = j, i
+        n_comparisons += 1
+        if record_comparisons:
+            if n_comparisons > comparisons.shape[0]:
+                comparisons = _grow(comparisons)
+            comparisons[n_comparisons - 1, 0] = i
+            comparisons[n_comparisons - 1, 1] = j
+        i_and_smaller = np.flatnonzero(leq[:, i] > 0)
+        j_and_greater = np.flatnonzero(leq[j, :] > 0)
+        for ii in i_and_smaller:
+            for jj in j_and_greater:
+                if leq[ii, jj] == 0:
+                    leq[ii, jj] = 1
+                    leq[jj, ii] = -1
+                    info[ii] += 1
+                    info[jj] += 1
+                    down[jj] += 1
+                    pos[ii] -= 1
+                    pos[jj] += 1
+    return (n_comparisons, states[:n_records], scores_delta[:n_records], scores_rho[:n_records],
+            comparisons[:n_comparisons if record_comparisons else 0], distances[:n_comparisons + 1])
+
+
+@njit
+def jit_corsort_variant(perm, core_rho, tie_break, output_rho, info0, distances):
+    """
+    Generic corsort, parametrized to behave like any corsort of this module (cf. :data:`CORSORT_VARIANTS`).
+
+    Unlike the named corsorts, it does not record the states, scores and comparisons.
+
+    Parameters
+    ----------
+    perm: :class:`~numpy.ndarray`
+        A random permutation.
+    core_rho: :class:`bool`
+        If True, use the rho core scorer, else the delta core scorer.
+    tie_break: :class:`int`
+        `TIE_BREAK_MAX` (max-knowledge), `TIE_BREAK_SUM` (sum-knowledge) or `TIE_BREAK_SUM_MAX` (Borda).
+    output_rho: :class:`bool`
+        If True, use the rho output scorer, else the delta output scorer.
+    info0: :class:`int`
+        Initial value of the knowledge of each item.
+    distances: :class:`~numpy.ndarray`
+        Array of int where the history of the Spearman footrule distance to the sorted list is written. If the
+        execution is longer than the array, the history is truncated. Use an empty array to skip the history.
+
+    Returns
+    -------
+    :class:`int`
+        Number of comparisons.
+
+    Examples
+    --------
+    >>> np.random.seed(42)
+    >>> p = np.random.permutation(10)
+    >>> d = np.zeros(25, dtype=np.int_)
+    >>> jit_corsort_variant(p, *CORSORT_VARIANTS['corsort_delta_max_rho'], d)
+    22
+    >>> d
+    array([34, 26, 22, 16, 10, 12,  8, 14,  8,  8,  4,  2,  0,  2,  2,  2,  4,
+            4,  4,  4,  2,  0,  0,  0,  0])
+
+    Each entry of :data:`CORSORT_VARIANTS` behaves like the corresponding corsort:
+
+    >>> from corsort.distance_to_sorted_array import distance_to_sorted_array
+    >>> for name, params in CORSORT_VARIANTS.items():
+    ...     st, _, co, _ = globals()[f"jit_{name}"](p)
+    ...     d = np.zeros(len(st), dtype=np.int_)
+    ...     assert jit_corsort_variant(p, *params, d) == len(co), name
+    ...     assert list(d) == [distance_to_sorted_array(s) for s in st], name
+    """
+    return _jit_corsort(perm, core_rho, tie_break, output_rho, info0, distances, False, RECORD_NONE, False)[0]
+
+
+@njit
+def jit_corsort_borda(perm, record_step=RECORD_FULL, compute_history=False):
     """
     Corsort designed for low total number of comparison.
     Not efficient in terms of convergence trajectory.
@@ -12,22 +420,30 @@ def jit_corsort_borda(perm):
     ----------
     perm: :class:`~numpy.ndarray`
         A random permutation.
+    record_step: :class:`int`
+        Recording mode of the states and scores: `RECORD_FULL` (default), `RECORD_NONE`, `RECORD_FINAL`, or a number
+        of comparisons `k` between two records (the final state is always recorded).
+    compute_history: :class:`bool`
+        If True, compute the history of the distance to the sorted list.
 
     Returns
     -------
-    states: :class:`list` of :class:`~numpy.ndarray`
-        List of estimates of the sorted result.
-    scores: :class:`list` of :class:`~numpy.ndarray`
-        List of estimates of the importance of each item.
-    comparisons: :class:`list` of :class:`tuple`
-        List of performed comparison. Each element is a tuple (index of lower item, index of higher item).
+    states: :class:`~numpy.ndarray`
+        Recorded estimates of the sorted result, one per row.
+    scores: :class:`~numpy.ndarray`
+        Recorded estimates of the importance of each item, one per row.
+    comparisons: :class:`~numpy.ndarray`
+        Array of size `(m, 2)` (int32) of the performed comparisons. Each row is (index of lower item, index of higher
+        item).
+    distances: :class:`~numpy.ndarray`
+        Spearman footrule distance to the sorted list after each comparison (empty if `compute_history` is False).
 
     Examples
     --------
 
     >>> np.random.seed(42)
     >>> p = np.random.permutation(10)
-    >>> st, sc, co = jit_corsort_borda(p)
+    >>> st, sc, co, _ = jit_corsort_borda(p)
     >>> st[0]
     array([8, 1, 5, 0, 7, 2, 9, 4, 3, 6])
     >>> st[10]
@@ -45,50 +461,13 @@ def jit_corsort_borda(perm):
     >>> len(co)
     22
     """
-    n = len(perm)
-    leq = np.eye(n, dtype=np.int8)
-    pos = np.zeros(n, dtype=np.int_)
-    info = np.zeros(n, dtype=np.int_)
-    states = [perm[np.argsort(pos)]]
-    scores = [pos.copy()]
-    comparisons = []
-    i, j = 0, 1
-    while True:
-        diff = n
-        xp = 0
-        for ii in range(n):
-            for jj in range(ii + 1, n):
-                if leq[ii, jj] == 0:
-                    diff_ij = abs(pos[ii] - pos[jj])
-                    if diff_ij > diff:
-                        continue
-                    xp_ij = info[ii] + info[jj]
-                    if diff_ij < diff or (diff_ij == diff and xp_ij > xp):
-                        diff = diff_ij
-                        xp = xp_ij
-                        i, j = ii, jj
-        if diff == n:
-            break
-        if perm[i] > perm[j]:
-            i, j = j, i
-        comparisons.append((i, j))
-        for ii in range(n):
-            if leq[ii, i] > 0:
-                for jj in range(n):
-                    if leq[j, jj] > 0 and leq[ii, jj] == 0:
-                        leq[ii, jj] = 1
-                        leq[jj, ii] = -1
-                        info[ii] += 1
-                        info[jj] += 1
-                        pos[ii] -= 1
-                        pos[jj] += 1
-        scores.append(pos.copy())
-        states.append(perm[np.argsort(pos)])
-    return states, scores, comparisons
+    _, states, scores, _, comparisons, distances = _jit_corsort(
+        perm, False, TIE_BREAK_SUM_MAX, False, 0, np.zeros(0, dtype=np.int_), compute_history, record_step, True)
+    return states, scores, comparisons, distances
 
 
 @njit
-def jit_corsort_delta_max_rho(perm):
+def jit_corsort_delta_max_rho(perm, record_step=RECORD_FULL, compute_history=False):
     """
     Corsort with delta core scorer, max-knowledge tie-break, and rho output scorer.
     Currently, the best corsort for trajectory.
@@ -97,22 +476,30 @@ def jit_corsort_delta_max_rho(perm):
     ----------
     perm: :class:`~numpy.ndarray`
         A random permutation.
+    record_step: :class:`int`
+        Recording mode of the states and scores: `RECORD_FULL` (default), `RECORD_NONE`, `RECORD_FINAL`, or a number
+        of comparisons `k` between two records (the final state is always recorded).
+    compute_history: :class:`bool`
+        If True, compute the history of the distance to the sorted list.
 
     Returns
     -------
-    states: :class:`list` of :class:`~numpy.ndarray`
-        List of estimates of the sorted result.
-    scores: :class:`list` of :class:`~numpy.ndarray`
-        List of estimates of the importance of each item.
-    comparisons: :class:`list` of :class:`tuple`
-        List of performed comparison. Each element is a tuple (index of lower item, index of higher item).
+    states: :class:`~numpy.ndarray`
+        Recorded estimates of the sorted result, one per row.
+    scores: :class:`~numpy.ndarray`
+        Recorded estimates of the importance of each item, one per row.
+    comparisons: :class:`~numpy.ndarray`
+        Array of size `(m, 2)` (int32) of the performed comparisons. Each row is (index of lower item, index of higher
+        item).
+    distances: :class:`~numpy.ndarray`
+        Spearman footrule distance to the sorted list after each comparison (empty if `compute_history` is False).
 
     Examples
     --------
 
     >>> np.random.seed(42)
     >>> p = np.random.permutation(10)
-    >>> st, sc, co = jit_corsort_delta_max_rho(p)
+    >>> st, sc, co, _ = jit_corsort_delta_max_rho(p)
     >>> st[0]
     array([8, 1, 5, 0, 7, 2, 9, 4, 3, 6])
     >>> st[10]
@@ -129,55 +516,26 @@ def jit_corsort_delta_max_rho(perm):
     array([0.81818182, 0.18181818, 0.54545455, 0.09090909, 0.72727273])
     >>> len(co)
     22
+
+    Record only some states:
+
+    >>> st, sc, co, _ = jit_corsort_delta_max_rho(p, RECORD_FINAL)
+    >>> st
+    array([[0, 1, 2, 3, 4, 5, 6, 7, 8, 9]])
+    >>> st, sc, co, _ = jit_corsort_delta_max_rho(p, 5)  # After 0, 5, 10, 15, 20 and 22 comparisons
+    >>> st.shape
+    (6, 10)
+    >>> st, sc, co, _ = jit_corsort_delta_max_rho(p, RECORD_NONE)
+    >>> st.shape, sc.shape, len(co)
+    ((0, 10), (0, 10), 22)
     """
-    n = len(perm)
-    leq = np.eye(n, dtype=np.int8)
-    pos = np.zeros(n, dtype=np.int_)
-    down = np.zeros(n, dtype=np.int_)+1
-    info = np.zeros(n, dtype=np.int_)+2
-    score = down/info
-    scores = [score]
-    states = [perm[np.argsort(score)]]
-    comparisons = []
-    i, j = 0, 1
-    while True:
-        diff = n
-        xp = n+1
-        for ii in range(n):
-            for jj in range(ii + 1, n):
-                if leq[ii, jj] == 0:
-                    diff_ij = abs(pos[ii] - pos[jj])
-                    if diff_ij > diff:
-                        continue
-                    xp_ij = max(info[ii], info[jj])
-                    if diff_ij < diff or (diff_ij == diff and xp_ij < xp):
-                        diff = diff_ij
-                        xp = xp_ij
-                        i, j = ii, jj
-        if diff == n:
-            break
-        if perm[i] > perm[j]:
-            i, j = j, i
-        comparisons.append((i, j))
-        for ii in range(n):
-            if leq[ii, i] > 0:
-                for jj in range(n):
-                    if leq[j, jj] > 0 and leq[ii, jj] == 0:
-                        leq[ii, jj] = 1
-                        leq[jj, ii] = -1
-                        info[ii] += 1
-                        info[jj] += 1
-                        down[jj] += 1
-                        pos[ii] -= 1
-                        pos[jj] += 1
-        score = down/info
-        scores.append(score)
-        states.append(perm[np.argsort(score)])
-    return states, scores, comparisons
+    _, states, _, scores, comparisons, distances = _jit_corsort(
+        perm, False, TIE_BREAK_MAX, True, 2, np.zeros(0, dtype=np.int_), compute_history, record_step, True)
+    return states, scores, comparisons, distances
 
 
 @njit
-def jit_corsort_delta_sum_rho(perm):
+def jit_corsort_delta_sum_rho(perm, record_step=RECORD_FULL, compute_history=False):
     """
     Corsort with delta core scorer, sum-knowledge tie-break, and rho output scorer.
 
@@ -185,22 +543,30 @@ def jit_corsort_delta_sum_rho(perm):
     ----------
     perm: :class:`~numpy.ndarray`
         A random permutation.
+    record_step: :class:`int`
+        Recording mode of the states and scores: `RECORD_FULL` (default), `RECORD_NONE`, `RECORD_FINAL`, or a number
+        of comparisons `k` between two records (the final state is always recorded).
+    compute_history: :class:`bool`
+        If True, compute the history of the distance to the sorted list.
 
     Returns
     -------
-    states: :class:`list` of :class:`~numpy.ndarray`
-        List of estimates of the sorted result.
-    scores: :class:`list` of :class:`~numpy.ndarray`
-        List of estimates of the importance of each item.
-    comparisons: :class:`list` of :class:`tuple`
-        List of performed comparison. Each element is a tuple (index of lower item, index of higher item).
+    states: :class:`~numpy.ndarray`
+        Recorded estimates of the sorted result, one per row.
+    scores: :class:`~numpy.ndarray`
+        Recorded estimates of the importance of each item, one per row.
+    comparisons: :class:`~numpy.ndarray`
+        Array of size `(m, 2)` (int32) of the performed comparisons. Each row is (index of lower item, index of higher
+        item).
+    distances: :class:`~numpy.ndarray`
+        Spearman footrule distance to the sorted list after each comparison (empty if `compute_history` is False).
 
     Examples
     --------
 
     >>> np.random.seed(42)
     >>> p = np.random.permutation(10)
-    >>> st, sc, co = jit_corsort_delta_sum_rho(p)
+    >>> st, sc, co, _ = jit_corsort_delta_sum_rho(p)
     >>> st[0]
     array([8, 1, 5, 0, 7, 2, 9, 4, 3, 6])
     >>> st[10]
@@ -218,54 +584,13 @@ def jit_corsort_delta_sum_rho(perm):
     >>> len(co)
     21
     """
-    n = len(perm)
-    leq = np.eye(n, dtype=np.int8)
-    pos = np.zeros(n, dtype=np.int_)
-    down = np.zeros(n, dtype=np.int_)+1
-    info = np.zeros(n, dtype=np.int_)+2
-    score = down/info
-    scores = [score]
-    states = [perm[np.argsort(score)]]
-    comparisons = []
-    i, j = 0, 1
-    while True:
-        diff = n
-        xp = 2*n
-        for ii in range(n):
-            for jj in range(ii + 1, n):
-                if leq[ii, jj] == 0:
-                    diff_ij = abs(pos[ii] - pos[jj])
-                    if diff_ij > diff:
-                        continue
-                    xp_ij = info[ii] + info[jj]
-                    if diff_ij < diff or (diff_ij == diff and xp_ij < xp):
-                        diff = diff_ij
-                        xp = xp_ij
-                        i, j = ii, jj
-        if diff == n:
-            break
-        if perm[i] > perm[j]:
-            i, j = j, i
-        comparisons.append((i, j))
-        for ii in range(n):
-            if leq[ii, i] > 0:
-                for jj in range(n):
-                    if leq[j, jj] > 0 and leq[ii, jj] == 0:
-                        leq[ii, jj] = 1
-                        leq[jj, ii] = -1
-                        info[ii] += 1
-                        info[jj] += 1
-                        down[jj] += 1
-                        pos[ii] -= 1
-                        pos[jj] += 1
-        score = down/info
-        scores.append(score)
-        states.append(perm[np.argsort(score)])
-    return states, scores, comparisons
+    _, states, _, scores, comparisons, distances = _jit_corsort(
+        perm, False, TIE_BREAK_SUM, True, 2, np.zeros(0, dtype=np.int_), compute_history, record_step, True)
+    return states, scores, comparisons, distances
 
 
 @njit
-def jit_corsort_delta_max_delta(perm):
+def jit_corsort_delta_max_delta(perm, record_step=RECORD_FULL, compute_history=False):
     """
     Corsort with delta core scorer, max-knowledge tie-break, and delta output scorer.
 
@@ -273,22 +598,30 @@ def jit_corsort_delta_max_delta(perm):
     ----------
     perm: :class:`~numpy.ndarray`
         A random permutation.
+    record_step: :class:`int`
+        Recording mode of the states and scores: `RECORD_FULL` (default), `RECORD_NONE`, `RECORD_FINAL`, or a number
+        of comparisons `k` between two records (the final state is always recorded).
+    compute_history: :class:`bool`
+        If True, compute the history of the distance to the sorted list.
 
     Returns
     -------
-    states: :class:`list` of :class:`~numpy.ndarray`
-        List of estimates of the sorted result.
-    scores: :class:`list` of :class:`~numpy.ndarray`
-        List of estimates of the importance of each item.
-    comparisons: :class:`list` of :class:`tuple`
-        List of performed comparison. Each element is a tuple (index of lower item, index of higher item).
+    states: :class:`~numpy.ndarray`
+        Recorded estimates of the sorted result, one per row.
+    scores: :class:`~numpy.ndarray`
+        Recorded estimates of the importance of each item, one per row.
+    comparisons: :class:`~numpy.ndarray`
+        Array of size `(m, 2)` (int32) of the performed comparisons. Each row is (index of lower item, index of higher
+        item).
+    distances: :class:`~numpy.ndarray`
+        Spearman footrule distance to the sorted list after each comparison (empty if `compute_history` is False).
 
     Examples
     --------
 
     >>> np.random.seed(42)
     >>> p = np.random.permutation(10)
-    >>> st, sc, co = jit_corsort_delta_max_delta(p)
+    >>> st, sc, co, _ = jit_corsort_delta_max_delta(p)
     >>> st[0]
     array([8, 1, 5, 0, 7, 2, 9, 4, 3, 6])
     >>> st[10]
@@ -306,52 +639,13 @@ def jit_corsort_delta_max_delta(perm):
     >>> len(co)
     22
     """
-    n = len(perm)
-    leq = np.eye(n, dtype=np.int8)
-    pos = np.zeros(n, dtype=np.int_)
-    info = np.zeros(n, dtype=np.int_)
-    score = pos.copy()
-    scores = [score]
-    states = [perm[np.argsort(score)]]
-    comparisons = []
-    i, j = 0, 1
-    while True:
-        diff = n
-        xp = n+1
-        for ii in range(n):
-            for jj in range(ii + 1, n):
-                if leq[ii, jj] == 0:
-                    diff_ij = abs(pos[ii] - pos[jj])
-                    if diff_ij > diff:
-                        continue
-                    xp_ij = max(info[ii], info[jj])
-                    if diff_ij < diff or (diff_ij == diff and xp_ij < xp):
-                        diff = diff_ij
-                        xp = xp_ij
-                        i, j = ii, jj
-        if diff == n:
-            break
-        if perm[i] > perm[j]:
-            i, j = j, i
-        comparisons.append((i, j))
-        for ii in range(n):
-            if leq[ii, i] > 0:
-                for jj in range(n):
-                    if leq[j, jj] > 0 and leq[ii, jj] == 0:
-                        leq[ii, jj] = 1
-                        leq[jj, ii] = -1
-                        info[ii] += 1
-                        info[jj] += 1
-                        pos[ii] -= 1
-                        pos[jj] += 1
-        score = pos.copy()
-        scores.append(score)
-        states.append(perm[np.argsort(score)])
-    return states, scores, comparisons
+    _, states, scores, _, comparisons, distances = _jit_corsort(
+        perm, False, TIE_BREAK_MAX, False, 0, np.zeros(0, dtype=np.int_), compute_history, record_step, True)
+    return states, scores, comparisons, distances
 
 
 @njit
-def jit_corsort_delta_sum_delta(perm):
+def jit_corsort_delta_sum_delta(perm, record_step=RECORD_FULL, compute_history=False):
     """
     Corsort with delta core scorer, sum-knowledge tie-break, and delta output scorer.
 
@@ -359,22 +653,30 @@ def jit_corsort_delta_sum_delta(perm):
     ----------
     perm: :class:`~numpy.ndarray`
         A random permutation.
+    record_step: :class:`int`
+        Recording mode of the states and scores: `RECORD_FULL` (default), `RECORD_NONE`, `RECORD_FINAL`, or a number
+        of comparisons `k` between two records (the final state is always recorded).
+    compute_history: :class:`bool`
+        If True, compute the history of the distance to the sorted list.
 
     Returns
     -------
-    states: :class:`list` of :class:`~numpy.ndarray`
-        List of estimates of the sorted result.
-    scores: :class:`list` of :class:`~numpy.ndarray`
-        List of estimates of the importance of each item.
-    comparisons: :class:`list` of :class:`tuple`
-        List of performed comparison. Each element is a tuple (index of lower item, index of higher item).
+    states: :class:`~numpy.ndarray`
+        Recorded estimates of the sorted result, one per row.
+    scores: :class:`~numpy.ndarray`
+        Recorded estimates of the importance of each item, one per row.
+    comparisons: :class:`~numpy.ndarray`
+        Array of size `(m, 2)` (int32) of the performed comparisons. Each row is (index of lower item, index of higher
+        item).
+    distances: :class:`~numpy.ndarray`
+        Spearman footrule distance to the sorted list after each comparison (empty if `compute_history` is False).
 
     Examples
     --------
 
     >>> np.random.seed(42)
     >>> p = np.random.permutation(10)
-    >>> st, sc, co = jit_corsort_delta_sum_delta(p)
+    >>> st, sc, co, _ = jit_corsort_delta_sum_delta(p)
     >>> st[0]
     array([8, 1, 5, 0, 7, 2, 9, 4, 3, 6])
     >>> st[10]
@@ -392,52 +694,13 @@ def jit_corsort_delta_sum_delta(perm):
     >>> len(co)
     21
     """
-    n = len(perm)
-    leq = np.eye(n, dtype=np.int8)
-    pos = np.zeros(n, dtype=np.int_)
-    info = np.zeros(n, dtype=np.int_)
-    score = pos.copy()
-    scores = [score]
-    states = [perm[np.argsort(score)]]
-    comparisons = []
-    i, j = 0, 1
-    while True:
-        diff = n
-        xp = 2*n
-        for ii in range(n):
-            for jj in range(ii + 1, n):
-                if leq[ii, jj] == 0:
-                    diff_ij = abs(pos[ii] - pos[jj])
-                    if diff_ij > diff:
-                        continue
-                    xp_ij = info[ii] + info[jj]
-                    if diff_ij < diff or (diff_ij == diff and xp_ij < xp):
-                        diff = diff_ij
-                        xp = xp_ij
-                        i, j = ii, jj
-        if diff == n:
-            break
-        if perm[i] > perm[j]:
-            i, j = j, i
-        comparisons.append((i, j))
-        for ii in range(n):
-            if leq[ii, i] > 0:
-                for jj in range(n):
-                    if leq[j, jj] > 0 and leq[ii, jj] == 0:
-                        leq[ii, jj] = 1
-                        leq[jj, ii] = -1
-                        info[ii] += 1
-                        info[jj] += 1
-                        pos[ii] -= 1
-                        pos[jj] += 1
-        score = pos.copy()
-        scores.append(score)
-        states.append(perm[np.argsort(score)])
-    return states, scores, comparisons
+    _, states, scores, _, comparisons, distances = _jit_corsort(
+        perm, False, TIE_BREAK_SUM, False, 0, np.zeros(0, dtype=np.int_), compute_history, record_step, True)
+    return states, scores, comparisons, distances
 
 
 @njit
-def jit_corsort_rho_max_rho(perm):
+def jit_corsort_rho_max_rho(perm, record_step=RECORD_FULL, compute_history=False):
     """
     Corsort with rho core scorer, max-knowledge tie-break, and rho output scorer.
 
@@ -445,22 +708,30 @@ def jit_corsort_rho_max_rho(perm):
     ----------
     perm: :class:`~numpy.ndarray`
         A random permutation.
+    record_step: :class:`int`
+        Recording mode of the states and scores: `RECORD_FULL` (default), `RECORD_NONE`, `RECORD_FINAL`, or a number
+        of comparisons `k` between two records (the final state is always recorded).
+    compute_history: :class:`bool`
+        If True, compute the history of the distance to the sorted list.
 
     Returns
     -------
-    states: :class:`list` of :class:`~numpy.ndarray`
-        List of estimates of the sorted result.
-    scores: :class:`list` of :class:`~numpy.ndarray`
-        List of estimates of the importance of each item.
-    comparisons: :class:`list` of :class:`tuple`
-        List of performed comparison. Each element is a tuple (index of lower item, index of higher item).
+    states: :class:`~numpy.ndarray`
+        Recorded estimates of the sorted result, one per row.
+    scores: :class:`~numpy.ndarray`
+        Recorded estimates of the importance of each item, one per row.
+    comparisons: :class:`~numpy.ndarray`
+        Array of size `(m, 2)` (int32) of the performed comparisons. Each row is (index of lower item, index of higher
+        item).
+    distances: :class:`~numpy.ndarray`
+        Spearman footrule distance to the sorted list after each comparison (empty if `compute_history` is False).
 
     Examples
     --------
 
     >>> np.random.seed(42)
     >>> p = np.random.permutation(10)
-    >>> st, sc, co = jit_corsort_rho_max_rho(p)
+    >>> st, sc, co, _ = jit_corsort_rho_max_rho(p)
     >>> st[0]
     array([8, 1, 5, 0, 7, 2, 9, 4, 3, 6])
     >>> st[10]
@@ -478,51 +749,13 @@ def jit_corsort_rho_max_rho(perm):
     >>> len(co)
     23
     """
-    n = len(perm)
-    leq = np.eye(n, dtype=np.int8)
-    down = np.zeros(n, dtype=np.int_)+1
-    info = np.zeros(n, dtype=np.int_)+2
-    score = down/info
-    scores = [score]
-    states = [perm[np.argsort(score)]]
-    comparisons = []
-    i, j = 0, 1
-    while True:
-        diff = n
-        xp = n+1
-        for ii in range(n):
-            for jj in range(ii + 1, n):
-                if leq[ii, jj] == 0:
-                    diff_ij = abs(score[ii] - score[jj])
-                    if diff_ij > diff:
-                        continue
-                    xp_ij = max(info[ii], info[jj])
-                    if diff_ij < diff or (diff_ij == diff and xp_ij < xp):
-                        diff = diff_ij
-                        xp = xp_ij
-                        i, j = ii, jj
-        if diff == n:
-            break
-        if perm[i] > perm[j]:
-            i, j = j, i
-        comparisons.append((i, j))
-        for ii in range(n):
-            if leq[ii, i] > 0:
-                for jj in range(n):
-                    if leq[j, jj] > 0 and leq[ii, jj] == 0:
-                        leq[ii, jj] = 1
-                        leq[jj, ii] = -1
-                        info[ii] += 1
-                        info[jj] += 1
-                        down[jj] += 1
-        score = down/info
-        scores.append(score)
-        states.append(perm[np.argsort(score)])
-    return states, scores, comparisons
+    _, states, _, scores, comparisons, distances = _jit_corsort(
+        perm, True, TIE_BREAK_MAX, True, 2, np.zeros(0, dtype=np.int_), compute_history, record_step, True)
+    return states, scores, comparisons, distances
 
 
 @njit
-def jit_corsort_rho_sum_rho(perm):
+def jit_corsort_rho_sum_rho(perm, record_step=RECORD_FULL, compute_history=False):
     """
     Corsort with rho core scorer, sum-knowledge tie-break, and rho output scorer.
 
@@ -530,22 +763,30 @@ def jit_corsort_rho_sum_rho(perm):
     ----------
     perm: :class:`~numpy.ndarray`
         A random permutation.
+    record_step: :class:`int`
+        Recording mode of the states and scores: `RECORD_FULL` (default), `RECORD_NONE`, `RECORD_FINAL`, or a number
+        of comparisons `k` between two records (the final state is always recorded).
+    compute_history: :class:`bool`
+        If True, compute the history of the distance to the sorted list.
 
     Returns
     -------
-    states: :class:`list` of :class:`~numpy.ndarray`
-        List of estimates of the sorted result.
-    scores: :class:`list` of :class:`~numpy.ndarray`
-        List of estimates of the importance of each item.
-    comparisons: :class:`list` of :class:`tuple`
-        List of performed comparison. Each element is a tuple (index of lower item, index of higher item).
+    states: :class:`~numpy.ndarray`
+        Recorded estimates of the sorted result, one per row.
+    scores: :class:`~numpy.ndarray`
+        Recorded estimates of the importance of each item, one per row.
+    comparisons: :class:`~numpy.ndarray`
+        Array of size `(m, 2)` (int32) of the performed comparisons. Each row is (index of lower item, index of higher
+        item).
+    distances: :class:`~numpy.ndarray`
+        Spearman footrule distance to the sorted list after each comparison (empty if `compute_history` is False).
 
     Examples
     --------
 
     >>> np.random.seed(42)
     >>> p = np.random.permutation(10)
-    >>> st, sc, co = jit_corsort_rho_sum_rho(p)
+    >>> st, sc, co, _ = jit_corsort_rho_sum_rho(p)
     >>> st[0]
     array([8, 1, 5, 0, 7, 2, 9, 4, 3, 6])
     >>> st[10]
@@ -563,51 +804,13 @@ def jit_corsort_rho_sum_rho(perm):
     >>> len(co)
     21
     """
-    n = len(perm)
-    leq = np.eye(n, dtype=np.int8)
-    down = np.zeros(n, dtype=np.int_)+1
-    info = np.zeros(n, dtype=np.int_)+2
-    score = down/info
-    scores = [score]
-    states = [perm[np.argsort(score)]]
-    comparisons = []
-    i, j = 0, 1
-    while True:
-        diff = n
-        xp = 2*n
-        for ii in range(n):
-            for jj in range(ii + 1, n):
-                if leq[ii, jj] == 0:
-                    diff_ij = abs(score[ii] - score[jj])
-                    if diff_ij > diff:
-                        continue
-                    xp_ij = info[ii] + info[jj]
-                    if diff_ij < diff or (diff_ij == diff and xp_ij < xp):
-                        diff = diff_ij
-                        xp = xp_ij
-                        i, j = ii, jj
-        if diff == n:
-            break
-        if perm[i] > perm[j]:
-            i, j = j, i
-        comparisons.append((i, j))
-        for ii in range(n):
-            if leq[ii, i] > 0:
-                for jj in range(n):
-                    if leq[j, jj] > 0 and leq[ii, jj] == 0:
-                        leq[ii, jj] = 1
-                        leq[jj, ii] = -1
-                        info[ii] += 1
-                        info[jj] += 1
-                        down[jj] += 1
-        score = down/info
-        scores.append(score)
-        states.append(perm[np.argsort(score)])
-    return states, scores, comparisons
+    _, states, _, scores, comparisons, distances = _jit_corsort(
+        perm, True, TIE_BREAK_SUM, True, 2, np.zeros(0, dtype=np.int_), compute_history, record_step, True)
+    return states, scores, comparisons, distances
 
 
 @njit
-def jit_corsort_rho_max_delta(perm):
+def jit_corsort_rho_max_delta(perm, record_step=RECORD_FULL, compute_history=False):
     """
     Corsort with rho core scorer, max-knowledge tie-break, and delta output scorer.
 
@@ -615,22 +818,30 @@ def jit_corsort_rho_max_delta(perm):
     ----------
     perm: :class:`~numpy.ndarray`
         A random permutation.
+    record_step: :class:`int`
+        Recording mode of the states and scores: `RECORD_FULL` (default), `RECORD_NONE`, `RECORD_FINAL`, or a number
+        of comparisons `k` between two records (the final state is always recorded).
+    compute_history: :class:`bool`
+        If True, compute the history of the distance to the sorted list.
 
     Returns
     -------
-    states: :class:`list` of :class:`~numpy.ndarray`
-        List of estimates of the sorted result.
-    scores: :class:`list` of :class:`~numpy.ndarray`
-        List of estimates of the importance of each item.
-    comparisons: :class:`list` of :class:`tuple`
-        List of performed comparison. Each element is a tuple (index of lower item, index of higher item).
+    states: :class:`~numpy.ndarray`
+        Recorded estimates of the sorted result, one per row.
+    scores: :class:`~numpy.ndarray`
+        Recorded estimates of the importance of each item, one per row.
+    comparisons: :class:`~numpy.ndarray`
+        Array of size `(m, 2)` (int32) of the performed comparisons. Each row is (index of lower item, index of higher
+        item).
+    distances: :class:`~numpy.ndarray`
+        Spearman footrule distance to the sorted list after each comparison (empty if `compute_history` is False).
 
     Examples
     --------
 
     >>> np.random.seed(42)
     >>> p = np.random.permutation(10)
-    >>> st, sc, co = jit_corsort_rho_max_delta(p)
+    >>> st, sc, co, _ = jit_corsort_rho_max_delta(p)
     >>> st[0]
     array([8, 1, 5, 0, 7, 2, 9, 4, 3, 6])
     >>> st[10]
@@ -648,56 +859,13 @@ def jit_corsort_rho_max_delta(perm):
     >>> len(co)
     23
     """
-    n = len(perm)
-    leq = np.eye(n, dtype=np.int8)
-    pos = np.zeros(n, dtype=np.int_)
-    down = np.zeros(n, dtype=np.int_)+1
-    info = np.zeros(n, dtype=np.int_)+2
-    est = down/info
-    score = pos.copy()
-    scores = [score]
-    states = [perm[np.argsort(score)]]
-    comparisons = []
-    i, j = 0, 1
-    while True:
-        diff = n
-        xp = n+1
-        for ii in range(n):
-            for jj in range(ii + 1, n):
-                if leq[ii, jj] == 0:
-                    diff_ij = abs(est[ii] - est[jj])
-                    if diff_ij > diff:
-                        continue
-                    xp_ij = max(info[ii], info[jj])
-                    if diff_ij < diff or (diff_ij == diff and xp_ij < xp):
-                        diff = diff_ij
-                        xp = xp_ij
-                        i, j = ii, jj
-        if diff == n:
-            break
-        if perm[i] > perm[j]:
-            i, j = j, i
-        comparisons.append((i, j))
-        for ii in range(n):
-            if leq[ii, i] > 0:
-                for jj in range(n):
-                    if leq[j, jj] > 0 and leq[ii, jj] == 0:
-                        leq[ii, jj] = 1
-                        leq[jj, ii] = -1
-                        info[ii] += 1
-                        info[jj] += 1
-                        down[jj] += 1
-                        pos[ii] -= 1
-                        pos[jj] += 1
-        est = down/info
-        score = pos.copy()
-        scores.append(score)
-        states.append(perm[np.argsort(score)])
-    return states, scores, comparisons
+    _, states, scores, _, comparisons, distances = _jit_corsort(
+        perm, True, TIE_BREAK_MAX, False, 2, np.zeros(0, dtype=np.int_), compute_history, record_step, True)
+    return states, scores, comparisons, distances
 
 
 @njit
-def jit_corsort_rho_sum_delta(perm):
+def jit_corsort_rho_sum_delta(perm, record_step=RECORD_FULL, compute_history=False):
     """
     Corsort with rho core scorer, sum-knowledge tie-break, and delta output scorer.
 
@@ -705,22 +873,30 @@ def jit_corsort_rho_sum_delta(perm):
     ----------
     perm: :class:`~numpy.ndarray`
         A random permutation.
+    record_step: :class:`int`
+        Recording mode of the states and scores: `RECORD_FULL` (default), `RECORD_NONE`, `RECORD_FINAL`, or a number
+        of comparisons `k` between two records (the final state is always recorded).
+    compute_history: :class:`bool`
+        If True, compute the history of the distance to the sorted list.
 
     Returns
     -------
-    states: :class:`list` of :class:`~numpy.ndarray`
-        List of estimates of the sorted result.
-    scores: :class:`list` of :class:`~numpy.ndarray`
-        List of estimates of the importance of each item.
-    comparisons: :class:`list` of :class:`tuple`
-        List of performed comparison. Each element is a tuple (index of lower item, index of higher item).
+    states: :class:`~numpy.ndarray`
+        Recorded estimates of the sorted result, one per row.
+    scores: :class:`~numpy.ndarray`
+        Recorded estimates of the importance of each item, one per row.
+    comparisons: :class:`~numpy.ndarray`
+        Array of size `(m, 2)` (int32) of the performed comparisons. Each row is (index of lower item, index of higher
+        item).
+    distances: :class:`~numpy.ndarray`
+        Spearman footrule distance to the sorted list after each comparison (empty if `compute_history` is False).
 
     Examples
     --------
 
     >>> np.random.seed(42)
     >>> p = np.random.permutation(10)
-    >>> st, sc, co = jit_corsort_rho_sum_delta(p)
+    >>> st, sc, co, _ = jit_corsort_rho_sum_delta(p)
     >>> st[0]
     array([8, 1, 5, 0, 7, 2, 9, 4, 3, 6])
     >>> st[10]
@@ -738,59 +914,57 @@ def jit_corsort_rho_sum_delta(perm):
     >>> len(co)
     21
     """
-    n = len(perm)
-    leq = np.eye(n, dtype=np.int8)
-    pos = np.zeros(n, dtype=np.int_)
-    down = np.zeros(n, dtype=np.int_)+1
-    info = np.zeros(n, dtype=np.int_)+2
-    est = down/info
-    score = pos.copy()
-    scores = [score]
-    states = [perm[np.argsort(score)]]
-    comparisons = []
-    i, j = 0, 1
-    while True:
-        diff = n
-        xp = 2*n
-        for ii in range(n):
-            for jj in range(ii + 1, n):
-                if leq[ii, jj] == 0:
-                    diff_ij = abs(est[ii] - est[jj])
-                    if diff_ij > diff:
-                        continue
-                    xp_ij = info[ii] + info[jj]
-                    if diff_ij < diff or (diff_ij == diff and xp_ij < xp):
-                        diff = diff_ij
-                        xp = xp_ij
-                        i, j = ii, jj
-        if diff == n:
-            break
-        if perm[i] > perm[j]:
-            i, j = j, i
-        comparisons.append((i, j))
-        for ii in range(n):
-            if leq[ii, i] > 0:
-                for jj in range(n):
-                    if leq[j, jj] > 0 and leq[ii, jj] == 0:
-                        leq[ii, jj] = 1
-                        leq[jj, ii] = -1
-                        info[ii] += 1
-                        info[jj] += 1
-                        down[jj] += 1
-                        pos[ii] -= 1
-                        pos[jj] += 1
-        est = down/info
-        score = pos.copy()
-        scores.append(score)
-        states.append(perm[np.argsort(score)])
-    return states, scores, comparisons
+    _, states, scores, _, comparisons, distances = _jit_corsort(
+        perm, True, TIE_BREAK_SUM, False, 2, np.zeros(0, dtype=np.int_), compute_history, record_step, True)
+    return states, scores, comparisons, distances
+
+
+CORSORT_VARIANTS = {
+    'corsort_borda': (False, TIE_BREAK_SUM_MAX, False, 0),
+    'corsort_delta_max_rho': (False, TIE_BREAK_MAX, True, 2),
+    'corsort_delta_sum_rho': (False, TIE_BREAK_SUM, True, 2),
+    'corsort_delta_max_delta': (False, TIE_BREAK_MAX, False, 0),
+    'corsort_delta_sum_delta': (False, TIE_BREAK_SUM, False, 0),
+    'corsort_rho_max_rho': (True, TIE_BREAK_MAX, True, 2),
+    'corsort_rho_sum_rho': (True, TIE_BREAK_SUM, True, 2),
+    'corsort_rho_max_delta': (True, TIE_BREAK_MAX, False, 2),
+    'corsort_rho_sum_delta': (True, TIE_BREAK_SUM, False, 2),
+}
+"""Parameters of :func:`jit_corsort_variant` for each corsort of this module: `core_rho`, `tie_break`, `output_rho`
+and `info0`."""
+
+
+@njit
+def _record_state(arr, states, scores, distances, footrule, n_comparisons, final, record_step):
+    if _is_recorded(n_comparisons, final, record_step):
+        states.append(arr.copy())
+        scores.append(0)
+    if len(footrule) and not final:
+        distances.append(footrule[0])
+
+
+@njit
+def _swap(arr, a, b, footrule):
+    """Swap two positions of `arr` and update the footrule distance (if tracked) in constant time."""
+    if len(footrule):
+        footrule[0] += abs(arr[b] - a) + abs(arr[a] - b) - abs(arr[a] - a) - abs(arr[b] - b)
+    (arr[a], arr[b]) = (arr[b], arr[a])
+
+
+@njit
+def _log_comparison(comparisons, n_comparisons, i, j):
+    comparisons[n_comparisons[0], 0] = i
+    comparisons[n_comparisons[0], 1] = j
+    n_comparisons[0] += 1
 
 
 @njit
-def heapify(arr, n, i, states, scores, comparisons):
+def heapify(arr, n, i, states, scores, comparisons, n_comparisons, distances, footrule, record_step=RECORD_FULL):
     """
     Based on a code by Mohit Kumra:
     https://www.geeksforgeeks.org/python-program-for-heap-sort/
+
+    The comparisons are written in the rows of `comparisons`, and `n_comparisons[0]` counts them.
     """
     largest = i  # Initialize largest as root
     left = 2 * i + 1  # left = 2*i + 1
@@ -802,11 +976,10 @@ def heapify(arr, n, i, states, scores, comparisons):
     if left < n:
         if arr[i] < arr[left]:
             largest = left
-            comparisons.append((i, left))
+            _log_comparison(comparisons, n_comparisons, i, left)
         else:
-            comparisons.append((left, i))
-        scores.append(0)
-        states.append(arr.copy())
+            _log_comparison(comparisons, n_comparisons, left, i)
+        _record_state(arr, states, scores, distances, footrule, n_comparisons[0], False, record_step)
 
     # See if right child of root exists and is
     # greater than root
@@ -814,23 +987,22 @@ def heapify(arr, n, i, states, scores, comparisons):
     if right < n:
         if arr[largest] < arr[right]:
             largest = right
-            comparisons.append((largest, right))
+            _log_comparison(comparisons, n_comparisons, largest, right)
         else:
-            comparisons.append((right, largest))
-        scores.append(0)
-        states.append(arr.copy())
+            _log_comparison(comparisons, n_comparisons, right, largest)
+        _record_state(arr, states, scores, distances, footrule, n_comparisons[0], False, record_step)
 
     # Change root, if needed
     if largest != i:
-        (arr[i], arr[largest]) = (arr[largest], arr[i])  # swap
+        _swap(arr, i, largest, footrule)
 
         # Heapify the root.
-        heapify(arr, n, largest, states, scores, comparisons)
+        heapify(arr, n, largest, states, scores, comparisons, n_comparisons, distances, footrule, record_step)
 
 
 # The main function to sort an array of given size
 @njit
-def jit_heapsort(arr):
+def jit_heapsort(arr, record_step=RECORD_FULL, compute_history=False):
     """
     Heap sort.
 
@@ -838,36 +1010,68 @@ def jit_heapsort(arr):
     ----------
     arr:class:`~numpy.ndarray`
         A random permutation.
+    record_step: :class:`int`
+        Recording mode of the states, cf. :func:`jit_corsort_delta_max_rho`.
+    compute_history: :class:`bool`
+        If True, compute the history of the distance to the sorted list.
 
     Returns
     -------
-    states: :class:`list` of :class:`~numpy.ndarray`
-        List of estimates of the sorted result.
-    scores: :class:`list` of :class:`~numpy.ndarray`
-        List of estimates of the importance of each item.
-    comparisons: :class:`list` of :class:`tuple`
-        List of performed comparison. Each element is a tuple (index of lower item, index of higher item).
+    states: :class:`~numpy.ndarray`
+        Recorded estimates of the sorted result, one per row.
+    scores: :class:`list` of :class:`int`
+        Zeros (heapsort has no scores), one per recorded state.
+    comparisons: :class:`~numpy.ndarray`
+        Array of size `(m, 2)` (int32) of the performed comparisons. Each row is (index of lower item, index of higher
+        item).
+    distances: :class:`~numpy.ndarray`
+        Spearman footrule distance to the sorted list after each comparison (empty if `compute_history` is False).
 
     Examples
     --------
     >>> np.random.seed(42)
     >>> p = np.random.permutation(10)
-    >>> st, sc, co = jit_heapsort(p)
+    >>> st, sc, co, d = jit_heapsort(p.copy())
+    >>> st.shape == (len(co) + 1, 10)
+    True
+    >>> st[-1]
+    array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
+    >>> len(d)
+    0
+    >>> st, sc, co, d = jit_heapsort(p.copy(), RECORD_FINAL, compute_history=True)
+    >>> st
+    array([[0, 1, 2, 3, 4, 5, 6, 7, 8, 9]])
+    >>> len(d) == len(co) + 1, d[0], d[-1]
+    (True, 34, 0)
     """
     n = len(arr)
-    states = [arr.copy()]
-    scores = [0]
-    comparisons = [(0, 0) for _ in range(0)]
+    states = [arr.copy() for _ in range(0)]
+    scores = [0 for _ in range(0)]
+    # Building the heap takes at most 2n comparisons, and each extraction at most 2 log2(n) + 2.
+    comparisons = np.empty((2 * n * (int(np.log2(n + 1)) + 2) + 2, 2), dtype=np.int32)
+    n_comparisons = np.zeros(1, dtype=np.int_)
+    distances = [0 for _ in range(0)]
+    footrule = np.zeros(1 if compute_history else 0, dtype=np.int_)
+    if compute_history:
+        footrule[0] = np.sum(np.abs(arr - np.arange(n)))
+    _record_state(arr, states, scores, distances, footrule, 0, False, record_step)
 
     # Build a max-heap.
     # Since last parent will be at ((n//2)-1) we can start at that location.
 
     for i in range(n // 2 - 1, -1, -1):
-        heapify(arr, n, i, states, scores, comparisons)
+        heapify(arr, n, i, states, scores, comparisons, n_comparisons, distances, footrule, record_step)
 
     # One by one extract elements
 
     for i in range(n - 1, 0, -1):
-        (arr[i], arr[0]) = (arr[0], arr[i])  # swap
-        heapify(arr, i, 0, states, scores, comparisons)
-    return states, scores, comparisons
+        _swap(arr, i, 0, footrule)
+        heapify(arr, i, 0, states, scores, comparisons, n_comparisons, distances, footrule, record_step)
+
+    # The final state is recorded unless it already was.
+    if record_step != RECORD_NONE and not _is_recorded(n_comparisons[0], False, record_step):
+        _record_state(arr, states, scores, distances, footrule, n_comparisons[0], True, record_step)
+    states_array = np.empty((len(states), n), dtype=arr.dtype)
+    for k, state in enumerate(states):
+        states_array[k] = state
+    return states_array, scores, comparisons[:n_comparisons[0]], np.array(distances, dtype=np.int_)
@@ -1,19 +1,356 @@
+import json
+import os
+import tempfile
+import zlib
 import numpy as np
+from scipy.stats import t as student  # type: ignore
 from multiprocess.pool import Pool  # type: ignore
 from collections import defaultdict
 from tqdm import tqdm  # type: ignore
+from corsort.online_stats import CountHistogram, RunningProfile
+from corsort.ragged_histories import RaggedHistories
 
 
 def print_res(res):
     for name, di in res.items():
         for n, v in di.items():
             t = v['time']
-            m = np.mean(t)
-            s = np.std(t)
+            if isinstance(t, CountHistogram):
+                m, s = t.mean, t.std
+            else:
+                m = np.mean(t)
+                s = np.std(t)
             print(f"n={n}, {name}: mean={m:.2f}, std={s:.2f}")
 
 
-def evaluate(sort_list, n_list, nt, pool=None):
+CHUNK_SIZE = 100
+"""Number of samples per chunk. Each chunk has its own random stream, cf. :func:`chunk_seeds`."""
+
+
+def chunk_seeds(seed, name, n, nt, chunk_size=CHUNK_SIZE):
+    """
+    Seeds of the chunks of samples of an experiment.
+
+    The stream of a chunk only depends on the master seed, the name of the sort, the size of the permutations and
+    the index of the chunk. Hence the chunks can be run in any order, in any process, and their results merged.
+
+    Parameters
+    ----------
+    seed: :class:`int` or :class:`~numpy.random.SeedSequence`, optional
+        Master seed. If None, fresh entropy is drawn from the OS.
+    name: :class:`str`
+        Name of the sorting algorithm.
+    n: :class:`int`
+        Size of the permutations.
+    nt: :class:`int`
+        Number of samples.
+    chunk_size: :class:`int`
+        Number of samples per chunk.
+
+    Returns
+    -------
+    :class:`list` of :class:`~numpy.random.SeedSequence`
+        Seed of each chunk.
+
+    Examples
+    --------
+    >>> seeds = chunk_seeds(42, 'quicksort', 10, 250)
+    >>> len(seeds)
+    3
+    >>> seeds[2].spawn_key[1:]  # After the hash of the name
+    (10, 2)
+    >>> seeds[2].generate_state(1) == chunk_seeds(42, 'quicksort', 10, 1000)[2].generate_state(1)
+    array([ True])
+    """
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    key = root.spawn_key + (zlib.crc32(name.encode()), n)
+    return [np.random.SeedSequence(root.entropy, spawn_key=key + (c,)) for c in range(-(-nt // chunk_size))]
+
+
+def _random_permutations(n, nt, seed):
+    """
+    Draw random permutations.
+
+    Parameters
+    ----------
+    n: :class:`int`
+        Size of the permutations.
+    nt: :class:`int`
+        Number of permutations.
+    seed: :class:`~numpy.random.SeedSequence`
+        Seed of the random generator.
+
+    Returns
+    -------
+    :class:`~numpy.ndarray`
+        Array of size `(nt, n)`. Each row is a permutation.
+
+    Examples
+    --------
+    >>> _random_permutations(4, 2, np.random.SeedSequence(42))
+    array([[3, 2, 1, 0],
+           [3, 2, 0, 1]])
+    """
+    rng = np.random.default_rng(seed)
+    return rng.permuted(np.tile(np.arange(n), (nt, 1)), axis=1)
+
+
+def _merge_chunks(results):
+    """
+    Gather the results of several chunks.
+
+    Parameters
+    ----------
+    results: :class:`list` of :class:`tuple`
+        For each chunk, the numbers of comparisons and the histories of distances.
+
+    Returns
+    -------
+    n_comparisons: :class:`~numpy.ndarray`
+        Number of comparisons for each sample.
+    distances: :class:`~corsort.RaggedHistories`
+        History of the distance to the sorted list for each sample.
+
+    Examples
+    --------
+    >>> nc, d = _merge_chunks([(np.array([2]), RaggedHistories.from_lists([[3, 1, 0]])),
+    ...                        (np.array([1, 3]), RaggedHistories.from_lists([[2, 0], [1, 0]]))])
+    >>> nc
+    array([2, 1, 3])
+    >>> d.offsets
+    array([0, 3, 5, 7])
+    """
+    n_comparisons = np.concatenate([np.zeros(0, dtype=int)] + [nc for nc, _ in results])
+    return n_comparisons, RaggedHistories.concatenate([d for _, d in results])
+
+
+def _evaluate_batch(sort, n, tasks):
+    """
+    Sort random permutations with the `batch` method of a sort, one call per chunk.
+
+    Parameters
+    ----------
+    sort: :class:`~corsort.WrapFullJit`
+        Sorting algorithm with a `batch` method.
+    n: :class:`int`
+        Size of the permutations.
+    tasks: :class:`list` of :class:`tuple`
+        Seed and number of samples of each chunk.
+
+    Returns
+    -------
+    n_comparisons: :class:`~numpy.ndarray`
+        Number of comparisons for each sample.
+    distances: :class:`~corsort.RaggedHistories`
+        History of the distance to the sorted list for each sample.
+    """
+    results = []
+    with tqdm(total=sum(size for _, size in tasks)) as progress_bar:
+        for seed, size in tasks:
+            results.append(sort.batch(_random_permutations(n, size, seed)))
+            progress_bar.update(size)
+    return _merge_chunks(results)
+
+
+def _evaluate_serial(sort, n, tasks):
+    """
+    Sort random permutations one by one.
+
+    Parameters
+    ----------
+    sort: :class:`~corsort.Sort`
+        Sorting algorithm.
+    n: :class:`int`
+        Size of the permutations.
+    tasks: :class:`list` of :class:`tuple`
+        Seed and number of samples of each chunk.
+
+    Returns
+    -------
+    n_comparisons: :class:`~numpy.ndarray`
+        Number of comparisons for each sample.
+    distances: :class:`~corsort.RaggedHistories`
+        History of the distance to the sorted list for each sample.
+    """
+    results = []
+    with tqdm(total=sum(size for _, size in tasks)) as progress_bar:
+        for seed, size in tasks:
+            n_comparisons = np.zeros(size, dtype=int)
+            distances = []
+            for k, perm in enumerate(_random_permutations(n, size, seed)):
+                sort(perm)
+                n_comparisons[k] = sort.n_comparisons_
+                distances.append(sort.history_distances_)
+            results.append((n_comparisons, RaggedHistories.from_lists(distances)))
+            progress_bar.update(size)
+    return _merge_chunks(results)
+
+
+def _sample_chunk(args):
+    """
+    Sort the random permutations of a chunk in a worker and write the results in a file.
+
+    Parameters
+    ----------
+    args: :class:`tuple`
+        Sort, size of the permutations, seed and number of samples of the chunk, and path of the file.
+
+    Returns
+    -------
+    :class:`str`
+        The path of the file.
+    """
+    sort, n, seed, size, path = args
+    n_comparisons = np.zeros(size, dtype=int)
+    distances = []
+    for k, perm in enumerate(_random_permutations(n, size, seed)):
+        sort(perm)
+        n_comparisons[k] = sort.n_comparisons_
+        distances.append(sort.history_distances_)
+    _save_chunk(path, n_comparisons, RaggedHistories.from_lists(distances))
+    return path
+
+
+def _save_chunk(path, n_comparisons, distances):
+    """
+    Save the results of a chunk, atomically.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        Path of the `.npz` file.
+    n_comparisons: :class:`~numpy.ndarray`
+        Number of comparisons for each sample.
+    distances: :class:`~corsort.RaggedHistories`
+        History of the distance to the sorted list for each sample.
+    """
+    # Write then rename, so that an interruption never leaves a partial chunk.
+    np.savez(path + '.tmp.npz', time=n_comparisons, values=distances.values, offsets=distances.offsets)
+    os.replace(path + '.tmp.npz', path)
+
+
+def _load_chunk(path):
+    """
+    Load the results of a chunk, cf. :func:`_save_chunk`.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        Path of the `.npz` file.
+
+    Returns
+    -------
+    n_comparisons: :class:`~numpy.ndarray`
+        Number of comparisons for each sample.
+    distances: :class:`~corsort.RaggedHistories`
+        History of the distance to the sorted list for each sample.
+    """
+    with np.load(path) as data:
+        return data['time'], RaggedHistories(data['values'], data['offsets'])
+
+
+def _evaluate_pool(sort, n, tasks, pool):
+    """
+    Sort random permutations with a pool, without sending permutations or sorts back and forth.
+
+    Each task is a chunk of samples. The worker draws the permutations of the chunk itself, and writes the numbers
+    of comparisons and the histories of distances directly into a file of a temporary directory.
+
+    Parameters
+    ----------
+    sort: :class:`~corsort.Sort`
+        Sorting algorithm.
+    n: :class:`int`
+        Size of the permutations.
+    tasks: :class:`list` of :class:`tuple`
+        Seed and number of samples of each chunk.
+    pool: :class:`~multiprocess.pool.Pool`
+        The pool.
+
+    Returns
+    -------
+    n_comparisons: :class:`~numpy.ndarray`
+        Number of comparisons for each sample.
+    distances: :class:`~corsort.RaggedHistories`
+        History of the distance to the sorted list for each sample.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        pool_tasks = [(sort, n, seed, size, os.path.join(directory, f"chunk{c:06d}.npz"))
+                      for c, (seed, size) in enumerate(tasks)]
+        results = []
+        with tqdm(total=sum(size for _, size in tasks)) as progress_bar:
+            for (_, size), path in zip(tasks, pool.imap(_sample_chunk, pool_tasks)):
+                results.append(_load_chunk(path))
+                progress_bar.update(size)
+    return _merge_chunks(results)
+
+
+def evaluate_chunks(sort, n, nt, seed=None, pool=None, chunks=None, chunk_size=CHUNK_SIZE):
+    """
+    Sort random permutations, split into chunks with independent random streams.
+
+    The results only depend on `seed`, not on the way they are computed: serially, with the `batch` method of the
+    sort (e.g. :class:`~corsort.WrapFullJit`), or with a pool. A large experiment can also be sharded by running
+    subsets of the chunks on different machines.
+
+    Parameters
+    ----------
+    sort: :class:`~corsort.Sort`
+        Sorting algorithm.
+    n: :class:`int`
+        Size of the permutations.
+    nt: :class:`int`
+        Total number of samples of the experiment.
+    seed: :class:`int` or :class:`~numpy.random.SeedSequence`, optional
+        Master seed, cf. :func:`chunk_seeds`.
+    pool: :class:`~multiprocess.pool.Pool`, optional.
+        Use parallelism.
+    chunks: :class:`list` of :class:`int`, optional
+        Indices of the chunks to run. Default: all of them.
+    chunk_size: :class:`int`
+        Number of samples per chunk.
+
+    Returns
+    -------
+    n_comparisons: :class:`~numpy.ndarray`
+        Number of comparisons for each sample of the chunks, in order.
+    distances: :class:`~corsort.RaggedHistories`
+        History of the distance to the sorted list for each sample.
+
+    Examples
+    --------
+    >>> from corsort import SortQuick
+    >>> my_sort = SortQuick(compute_history=True)
+    >>> nc, d = evaluate_chunks(my_sort, 10, 250, seed=42)
+    >>> nc[:5]
+    array([20, 27, 21, 27, 23])
+
+    The same results with a pool:
+
+    >>> with Pool(2) as p:
+    ...     nc_pool, d_pool = evaluate_chunks(my_sort, 10, 250, seed=42, pool=p)
+    >>> np.array_equal(nc, nc_pool) and np.array_equal(d, d_pool)
+    True
+
+    Or by shards:
+
+    >>> nc_0, _ = evaluate_chunks(my_sort, 10, 250, seed=42, chunks=[0, 1])
+    >>> nc_1, _ = evaluate_chunks(my_sort, 10, 250, seed=42, chunks=[2])
+    >>> np.array_equal(np.concatenate([nc_0, nc_1]), nc)
+    True
+    """
+    seeds = chunk_seeds(seed, sort.__name__, n, nt, chunk_size)
+    if chunks is None:
+        chunks = range(len(seeds))
+    tasks = [(seeds[c], min(chunk_size, nt - c * chunk_size)) for c in chunks]
+    if pool is not None:
+        return _evaluate_pool(sort, n, tasks, pool)
+    if hasattr(sort, 'batch'):
+        return _evaluate_batch(sort, n, tasks)
+    return _evaluate_serial(sort, n, tasks)
+
+
+def evaluate(sort_list, n_list, nt, pool=None, seed=None):
     """
     Run a sim.
 
@@ -27,6 +364,8 @@ def evaluate(sort_list, n_list, nt, pool=None):
         Number of samples.
     pool: :class:`~multiprocess.pool.Pool`, optional.
         Use parallelism.
+    seed: :class:`int` or :class:`~numpy.random.SeedSequence`, optional
+        Master seed. The results only depend on the seed, with or without a pool (cf. :func:`evaluate_chunks`).
 
     Returns
     -------
@@ -36,37 +375,35 @@ def evaluate(sort_list, n_list, nt, pool=None):
 
     >>> from corsort import SortQuick, WrapFullJit, entropy_bound, jit_corsort_borda
     >>> my_nt = 100
-    >>> np.random.seed(42)
     >>> my_sort_list = [SortQuick(), WrapFullJit(jit_corsort_borda)]
     >>> my_n_list = [10, 15]
 
     Evaluate corsort and quicksort using a Pool:
 
     >>> with Pool() as p:
-    ...     my_res = evaluate(my_sort_list, my_n_list, nt=my_nt, pool=p)
+    ...     my_res = evaluate(my_sort_list, my_n_list, nt=my_nt, pool=p, seed=42)
     Evaluate quicksort for n = 10
     Evaluate corsort_borda for n = 10
     Evaluate quicksort for n = 15
     Evaluate corsort_borda for n = 15
     >>> print_res(my_res)
-    n=10, quicksort: mean=24.15, std=3.50
-    n=15, quicksort: mean=46.26, std=6.99
-    n=10, corsort_borda: mean=22.11, std=0.87
-    n=15, corsort_borda: mean=40.59, std=1.33
+    n=10, quicksort: mean=24.66, std=3.78
+    n=15, quicksort: mean=45.37, std=6.63
+    n=10, corsort_borda: mean=22.08, std=0.91
+    n=15, corsort_borda: mean=40.98, std=1.24
 
     Same without the pool:
 
-    >>> np.random.seed(42)
-    >>> my_res = evaluate(my_sort_list, my_n_list, nt=my_nt)
+    >>> my_res = evaluate(my_sort_list, my_n_list, nt=my_nt, seed=42)
     Evaluate quicksort for n = 10
     Evaluate corsort_borda for n = 10
     Evaluate quicksort for n = 15
     Evaluate corsort_borda for n = 15
     >>> print_res(my_res)
-    n=10, quicksort: mean=24.15, std=3.50
-    n=15, quicksort: mean=46.26, std=6.99
-    n=10, corsort_borda: mean=22.11, std=0.87
-    n=15, corsort_borda: mean=40.59, std=1.33
+    n=10, quicksort: mean=24.66, std=3.78
+    n=15, quicksort: mean=45.37, std=6.63
+    n=10, corsort_borda: mean=22.08, std=0.91
+    n=15, corsort_borda: mean=40.98, std=1.24
 
     Bound (loose, not exact):
 
@@ -78,28 +415,12 @@ def evaluate(sort_list, n_list, nt, pool=None):
     for n in n_list:
         for sort in sort_list:
             print(f"Evaluate {sort.__name__} for n = {n}")
-            convergence_times = np.zeros(nt, dtype=int)
-            distances = []
-            if pool is not None:
-                for k, the_sort in enumerate(pool.imap_unordered(sort,
-                                                                 tqdm([np.random.permutation(n)
-                                                                       for _ in range(nt)]))):
-                    convergence_times[k] = the_sort.n_comparisons_
-                    distances.append(the_sort.history_distances_)
-            else:
-                for k in tqdm(range(nt)):
-                    _ = sort(np.random.permutation(n))
-                    convergence_times[k] = sort.n_comparisons_
-                    distances.append(sort.history_distances_)
-            max_d = max(len(d) for d in distances)
-            dist_array = np.zeros((nt, max_d), dtype=int)
-            for i, dist in enumerate(distances):
-                dist_array[i, :len(dist)] = dist
+            convergence_times, dist_array = evaluate_chunks(sort, n, nt, seed=seed, pool=pool)
             res[sort.__name__][n] = {'time': convergence_times, 'distance': dist_array}
     return res
 
 
-def evaluate_convergence(sort_list, n, nt, pool=None):
+def evaluate_convergence(sort_list, n, nt, pool=None, seed=None):
     """
     Performance profile.
 
@@ -113,44 +434,44 @@ def evaluate_convergence(sort_list, n, nt, pool=None):
         Number of samples.
     pool: :class:`~multiprocess.pool.Pool`, optional.
         Use parallelism.
+    seed: :class:`int` or :class:`~numpy.random.SeedSequence`, optional
+        Master seed, cf. :func:`evaluate_chunks`.
 
     Returns
     -------
     dict
-        Key: name of the sorting algorithm. Value: a ndarray of `nt` rows. Each row gives
-        the history of distance to the sorted list.
+        Key: name of the sorting algorithm. Value: a :class:`~corsort.RaggedHistories` of `nt` histories of
+        distance to the sorted list.
 
     Examples
     --------
     >>> from corsort import SortQuick, WrapFullJit, entropy_bound, jit_corsort_borda
     >>> my_nt = 100
-    >>> np.random.seed(42)
     >>> my_sort_list = [SortQuick(), WrapFullJit(jit_corsort_borda)]
     >>> my_n = 10
 
     Evaluate corsort and quicksort using a Pool:
 
     >>> with Pool() as p:
-    ...     my_res = evaluate_convergence(my_sort_list, my_n, nt=my_nt, pool=p)
+    ...     my_res = evaluate_convergence(my_sort_list, my_n, nt=my_nt, pool=p, seed=42)
     Evaluate convergence of quicksort for n = 10
     Evaluate convergence of corsort_borda for n = 10
-    >>> np.round(np.mean(my_res['quicksort'], axis=0), 1)  # doctest: +NORMALIZE_WHITESPACE
-    array([32.7, 32.4, 32. , 31.4, 30.4, 28.9, 27.1, 24.8, 21.7, 18.8, 18.3,
-           17.5, 16.8, 15.3, 13.9, 12.1, 10.2,  9. ,  7.8,  6.5,  5.1,  3.9,
-            2.9,  2.1,  1.5,  1.1,  0.9,  0.6,  0.5,  0.3,  0.2,  0.1,  0.1,
-            0.1,  0. ,  0. ,  0. ])
+    >>> np.round(my_res['quicksort'].mean_profile(), 1)  # doctest: +NORMALIZE_WHITESPACE
+    array([34.1, 33.9, 33.6, 32.6, 31.5, 29.8, 27.8, 24.8, 21.9, 19.1, 18.7,
+           18. , 16.8, 15.3, 13.3, 11.5,  9.8,  8.6,  7.7,  6.6,  5.5,  4.2,
+            3.6,  2.7,  2. ,  1.6,  1.1,  0.8,  0.5,  0.3,  0.3,  0.1,  0.1,
+            0.1,  0. ,  0. ])
 
     Same without the pool:
 
-    >>> np.random.seed(42)
-    >>> my_res = evaluate_convergence(my_sort_list, my_n, nt=my_nt)
+    >>> my_res = evaluate_convergence(my_sort_list, my_n, nt=my_nt, seed=42)
     Evaluate convergence of quicksort for n = 10
     Evaluate convergence of corsort_borda for n = 10
-    >>> np.round(np.mean(my_res['quicksort'], axis=0), 1)  # doctest: +NORMALIZE_WHITESPACE
-    array([32.7, 32.4, 32. , 31.4, 30.4, 28.9, 27.1, 24.8, 21.7, 18.8, 18.3,
-           17.5, 16.8, 15.3, 13.9, 12.1, 10.2,  9. ,  7.8,  6.5,  5.1,  3.9,
-            2.9,  2.1,  1.5,  1.1,  0.9,  0.6,  0.5,  0.3,  0.2,  0.1,  0.1,
-            0.1,  0. ,  0. ,  0. ])
+    >>> np.round(my_res['quicksort'].mean_profile(), 1)  # doctest: +NORMALIZE_WHITESPACE
+    array([34.1, 33.9, 33.6, 32.6, 31.5, 29.8, 27.8, 24.8, 21.9, 19.1, 18.7,
+           18. , 16.8, 15.3, 13.3, 11.5,  9.8,  8.6,  7.7,  6.6,  5.5,  4.2,
+            3.6,  2.7,  2. ,  1.6,  1.1,  0.8,  0.5,  0.3,  0.3,  0.1,  0.1,
+            0.1,  0. ,  0. ])
     """
     res = dict()
     for sort in sort_list:
@@ -158,26 +479,15 @@ def evaluate_convergence(sort_list, n, nt, pool=None):
         compute_history_old = sort.compute_history
         sort.compute_history = True
         print(f"Evaluate convergence of {name} for n = {n}")
-        distances = []
-        if pool is not None:
-            for instant in pool.imap_unordered(sort,
-                                               tqdm([np.random.permutation(n)
-                                                     for _ in range(nt)])):
-                distances.append(instant.history_distances_)
-        else:
-            for _ in tqdm(range(nt)):
-                sort(np.random.permutation(n))
-                distances.append(sort.history_distances_)
-        max_d = max(len(d) for d in distances)
-        dist_array = np.zeros((nt, max_d), dtype=int)
-        for i, dist in enumerate(distances):
-            dist_array[i, :len(dist)] = dist
+        try:
+            _, dist_array = evaluate_chunks(sort, n, nt, seed=seed, pool=pool)
+        finally:
+            sort.compute_history = compute_history_old
         res[name] = dist_array
-        sort.compute_history = compute_history_old
     return res
 
 
-def evaluate_comparisons(sort_list, n_list, nt, pool=None):
+def evaluate_comparisons(sort_list, n_list, nt, pool=None, seed=None):
     """
 
     Parameters
@@ -186,6 +496,7 @@ def evaluate_comparisons(sort_list, n_list, nt, pool=None):
     n_list
     nt
     pool
+    seed
 
     Returns
     -------
@@ -194,44 +505,356 @@ def evaluate_comparisons(sort_list, n_list, nt, pool=None):
     --------
     >>> from corsort import SortQuick, WrapFullJit, entropy_bound, jit_corsort_borda
     >>> my_nt = 100
-    >>> np.random.seed(42)
     >>> my_sort_list = [SortQuick(), WrapFullJit(jit_corsort_borda)]
     >>> my_n_list = [10, 15]
 
     Evaluate corsort and quicksort using a Pool:
 
     >>> with Pool() as p:
-    ...     my_res = evaluate_comparisons(my_sort_list, my_n_list, nt=my_nt, pool=p)
+    ...     my_res = evaluate_comparisons(my_sort_list, my_n_list, nt=my_nt, pool=p, seed=42)
     Evaluate comparisons of quicksort for n = 10
     Evaluate comparisons of corsort_borda for n = 10
     Evaluate comparisons of quicksort for n = 15
     Evaluate comparisons of corsort_borda for n = 15
     >>> np.round(np.mean(my_res['quicksort'][10]), 1)
-    24.2
+    24.7
 
     Same without the pool:
 
-    >>> np.random.seed(42)
-    >>> my_res = evaluate_comparisons(my_sort_list, my_n_list, nt=my_nt)
+    >>> my_res = evaluate_comparisons(my_sort_list, my_n_list, nt=my_nt, seed=42)
     Evaluate comparisons of quicksort for n = 10
     Evaluate comparisons of corsort_borda for n = 10
     Evaluate comparisons of quicksort for n = 15
     Evaluate comparisons of corsort_borda for n = 15
     >>> np.round(np.mean(my_res['quicksort'][10]), 1)
-    24.2
+    24.7
     """
     res = defaultdict(dict)
     for n in n_list:
         for sort in sort_list:
             print(f"Evaluate comparisons of {sort.__name__} for n = {n}")
-            convergence_times = np.zeros(nt, dtype=int)
-            if pool is not None:
-                for k, instant in enumerate(pool.imap_unordered(sort, tqdm([np.random.permutation(n)
-                                                                            for _ in range(nt)]))):
-                    convergence_times[k] = instant.n_comparisons_
-            else:
-                for k in tqdm(range(nt)):
-                    sort(np.random.permutation(n))
-                    convergence_times[k] = sort.n_comparisons_
+            compute_history_old = sort.compute_history
+            sort.compute_history = False
+            try:
+                convergence_times, _ = evaluate_chunks(sort, n, nt, seed=seed, pool=pool)
+            finally:
+                sort.compute_history = compute_history_old
             res[sort.__name__][n] = convergence_times
     return res
+
+
+def evaluate_online(sort_list, n_list, nt, pool=None, seed=None, chunks_per_step=10):
+    """
+    Run a sim with streaming statistics, so that the memory does not depend on `nt`.
+
+    The samples are computed `chunks_per_step` chunks at a time (cf. :func:`evaluate_chunks`) and folded into
+    accumulators of :mod:`corsort.online_stats`, then discarded.
+
+    Parameters
+    ----------
+    sort_list: :class:`list`
+        List of sorting algorithms.
+    n_list: :class:`list`
+        List of sizes for the tested lists.
+    nt: :class:`int`
+        Number of samples.
+    pool: :class:`~multiprocess.pool.Pool`, optional.
+        Use parallelism.
+    seed: :class:`int` or :class:`~numpy.random.SeedSequence`, optional
+        Master seed. The samples are the same as with :func:`evaluate`.
+    chunks_per_step: :class:`int`
+        Number of chunks in memory at a time.
+
+    Returns
+    -------
+    :class:`dict`
+        Same format as :func:`evaluate`, but `'time'` is a :class:`~corsort.CountHistogram` of the numbers of
+        comparisons and `'distance'` is a :class:`~corsort.RunningProfile` of the histories.
+
+    Examples
+    --------
+    >>> from corsort import SortQuick
+    >>> my_sort = SortQuick(compute_history=True)
+    >>> my_res = evaluate_online([my_sort], [10], nt=250, seed=42, chunks_per_step=1)
+    Evaluate quicksort for n = 10
+    >>> print_res(my_res)
+    n=10, quicksort: mean=24.29, std=3.78
+
+    The statistics are the same as with :func:`evaluate`:
+
+    >>> nc, d = evaluate_chunks(my_sort, 10, 250, seed=42)
+    >>> float(np.mean(nc)), float(np.std(nc))
+    (24.288, 3.7763813366766867)
+    >>> np.allclose(my_res['quicksort'][10]['distance'].mean_profile(), d.mean_profile())
+    True
+    """
+    res = defaultdict(dict)
+    n_chunks = -(-nt // CHUNK_SIZE)
+    for n in n_list:
+        for sort in sort_list:
+            print(f"Evaluate {sort.__name__} for n = {n}")
+            times = CountHistogram()
+            profile = RunningProfile()
+            for start in range(0, n_chunks, chunks_per_step):
+                chunks = list(range(start, min(start + chunks_per_step, n_chunks)))
+                n_comparisons, distances = evaluate_chunks(sort, n, nt, seed=seed, pool=pool, chunks=chunks)
+                times.update(n_comparisons)
+                profile.update(distances)
+            res[sort.__name__][n] = {'time': times, 'distance': profile}
+    return res
+
+
+def _ci_width(std, count, confidence):
+    """
+    Width of the confidence interval on a mean (Student).
+
+    Parameters
+    ----------
+    std: :class:`float` or :class:`~numpy.ndarray`
+        Standard deviation (population) of the samples.
+    count: :class:`int`
+        Number of samples.
+    confidence: :class:`float`
+        Confidence level, e.g. 0.95.
+
+    Returns
+    -------
+    :class:`float` or :class:`~numpy.ndarray`
+        Width of the interval.
+
+    Examples
+    --------
+    >>> float(np.round(_ci_width(1., 101, .95), 3))
+    0.397
+    """
+    if count < 2:
+        return np.inf * np.ones_like(std)
+    return 2 * student.ppf((1 + confidence) / 2, count - 1) * std / np.sqrt(count - 1)
+
+
+def evaluate_adaptive(sort_list, n_list, width, max_nt, pool=None, seed=None, confidence=.95, profile_width=None,
+                      chunks_per_step=1):
+    """
+    Run a sim until the confidence interval on the mean number of comparisons is narrow enough.
+
+    Chunks of samples (cf. :func:`evaluate_chunks`) are added `chunks_per_step` at a time, until the width of the
+    confidence interval on the mean number of comparisons is at most `width` (and, if `profile_width` is given, the
+    width of the interval on each step of the mean profile of distances is at most `profile_width`), or until
+    `max_nt` samples. The samples are the first ones of :func:`evaluate` with `nt = max_nt` and the same seed.
+
+    Parameters
+    ----------
+    sort_list: :class:`list`
+        List of sorting algorithms.
+    n_list: :class:`list`
+        List of sizes for the tested lists.
+    width: :class:`float`
+        Target width of the confidence interval on the mean number of comparisons.
+    max_nt: :class:`int`
+        Maximal number of samples.
+    pool: :class:`~multiprocess.pool.Pool`, optional.
+        Use parallelism.
+    seed: :class:`int` or :class:`~numpy.random.SeedSequence`, optional
+        Master seed.
+    confidence: :class:`float`
+        Confidence level of the intervals.
+    profile_width: :class:`float`, optional
+        Target width of the confidence interval on each step of the mean profile of distances. If None, the
+        histories are not computed.
+    chunks_per_step: :class:`int`
+        Number of chunks added between two checks of the stopping criterion.
+
+    Returns
+    -------
+    :class:`dict`
+        Same format as :func:`evaluate_online`, plus `'nt'`, the number of samples used.
+
+    Examples
+    --------
+    >>> from corsort import SortQuick, WrapFullJit, jit_corsort_borda
+    >>> my_sort_list = [SortQuick(), WrapFullJit(jit_corsort_borda)]
+    >>> my_res = evaluate_adaptive(my_sort_list, [10], width=.5, max_nt=2000, seed=42)
+    Evaluate quicksort for n = 10: 900 samples
+    Evaluate corsort_borda for n = 10: 100 samples
+    >>> print_res(my_res)
+    n=10, quicksort: mean=24.19, std=3.76
+    n=10, corsort_borda: mean=22.08, std=0.91
+
+    The samples are the first ones of the fixed-size experiment:
+
+    >>> nc, _ = evaluate_chunks(SortQuick(), 10, 2000, seed=42, chunks=range(9))
+    >>> np.array_equal(my_res['quicksort'][10]['time'].counts, np.bincount(nc))
+    True
+
+    The convergence profile may need more samples:
+
+    >>> my_res = evaluate_adaptive(my_sort_list[:1], [10], width=1., max_nt=2000, seed=42, profile_width=1.)
+    Evaluate quicksort for n = 10: 1100 samples
+    """
+    res = defaultdict(dict)
+    n_chunks = -(-max_nt // CHUNK_SIZE)
+    for n in n_list:
+        for sort in sort_list:
+            compute_history_old = sort.compute_history
+            sort.compute_history = profile_width is not None
+            times = CountHistogram()
+            profile = RunningProfile()
+            try:
+                for start in range(0, n_chunks, chunks_per_step):
+                    chunks = range(start, min(start + chunks_per_step, n_chunks))
+                    n_comparisons, distances = evaluate_chunks(sort, n, max_nt, seed=seed, pool=pool, chunks=chunks)
+                    times.update(n_comparisons)
+                    if profile_width is not None:
+                        profile.update(distances)
+                    if _ci_width(times.std, times.count, confidence) > width:
+                        continue
+                    if profile_width is None or np.all(
+                            _ci_width(profile.std_profile(), profile.count, confidence) <= profile_width):
+                        break
+            finally:
+                sort.compute_history = compute_history_old
+            print(f"Evaluate {sort.__name__} for n = {n}: {times.count} samples")
+            res[sort.__name__][n] = {'time': times, 'distance': profile, 'nt': times.count}
+    return res
+
+
+MANIFEST = 'manifest.json'
+"""Name of the file that describes a sweep in its directory, cf. :func:`sweep`."""
+
+
+def _open_manifest(directory, nt, seed):
+    """
+    Read the manifest of a sweep, or create it.
+
+    Parameters
+    ----------
+    directory: :class:`str`
+        Directory of the sweep.
+    nt: :class:`int`
+        Number of samples.
+    seed: :class:`int` or :class:`~numpy.random.SeedSequence`, optional
+        Master seed. If None, the seed of an existing sweep is used (or fresh entropy for a new one).
+
+    Returns
+    -------
+    :class:`dict`
+        The manifest: entropy of the master seed, number of samples and size of the chunks.
+    """
+    path = os.path.join(directory, MANIFEST)
+    seed = seed if seed is None or isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    if os.path.exists(path):
+        with open(path) as f:
+            manifest = json.load(f)
+        if manifest['nt'] != nt:
+            raise ValueError(f"The sweep in {directory} has nt = {manifest['nt']}, not {nt}.")
+        if seed is not None and seed.entropy != manifest['entropy']:
+            raise ValueError(f"The sweep in {directory} was started with another seed.")
+        return manifest
+    os.makedirs(directory, exist_ok=True)
+    seed = np.random.SeedSequence() if seed is None else seed
+    manifest = {'entropy': seed.entropy, 'nt': nt, 'chunk_size': CHUNK_SIZE}
+    with open(path, 'w') as f:
+        json.dump(manifest, f)
+    return manifest
+
+
+def _chunk_path(directory, name, n, chunk):
+    return os.path.join(directory, name, f"n{n}", f"chunk{chunk:06d}.npz")
+
+
+def sweep(sort_list, n_list, nt, directory, seed=None, pool=None, chunks_per_step=10):
+    """
+    Run a sim with results stored on disk, so that it can be resumed after an interruption.
+
+    The results of each (sort, n, chunk) are written to a `.npz` file of `directory`, and the chunks already on disk
+    are skipped. The master seed is kept in a manifest (cf. :data:`MANIFEST`), so a resumed sweep gives the same
+    results as an uninterrupted one. Only `chunks_per_step` chunks are in memory at a time.
+
+    Parameters
+    ----------
+    sort_list: :class:`list`
+        List of sorting algorithms.
+    n_list: :class:`list`
+        List of sizes for the tested lists.
+    nt: :class:`int`
+        Number of samples.
+    directory: :class:`str`
+        Directory of the sweep.
+    seed: :class:`int` or :class:`~numpy.random.SeedSequence`, optional
+        Master seed. To resume a sweep, use the same seed or None.
+    pool: :class:`~multiprocess.pool.Pool`, optional.
+        Use parallelism.
+    chunks_per_step: :class:`int`
+        Number of chunks computed between two writes to disk.
+
+    Examples
+    --------
+    >>> from corsort import SortQuick
+    >>> my_sort = SortQuick(compute_history=True)
+    >>> with tempfile.TemporaryDirectory() as my_directory:
+    ...     sweep([my_sort], [10], nt=250, directory=my_directory, seed=42)
+    ...     os.remove(_chunk_path(my_directory, 'quicksort', 10, 1))  # As if the sweep had been interrupted
+    ...     sweep([my_sort], [10], nt=250, directory=my_directory)
+    ...     my_res = load_sweep(my_directory)
+    Evaluate quicksort for n = 10 (0/3 chunks done)
+    Evaluate quicksort for n = 10 (2/3 chunks done)
+
+    The results are the same as with :func:`evaluate`:
+
+    >>> nc, d = evaluate_chunks(my_sort, 10, 250, seed=42)
+    >>> np.array_equal(my_res['quicksort'][10]['time'], nc)
+    True
+    >>> np.array_equal(my_res['quicksort'][10]['distance'], d)
+    True
+    """
+    manifest = _open_manifest(directory, nt, seed)
+    seed = np.random.SeedSequence(manifest['entropy'])
+    chunk_size = manifest['chunk_size']
+    n_chunks = -(-nt // chunk_size)
+    for n in n_list:
+        for sort in sort_list:
+            name = sort.__name__
+            os.makedirs(os.path.dirname(_chunk_path(directory, name, n, 0)), exist_ok=True)
+            todo = [c for c in range(n_chunks) if not os.path.exists(_chunk_path(directory, name, n, c))]
+            print(f"Evaluate {name} for n = {n} ({n_chunks - len(todo)}/{n_chunks} chunks done)")
+            for i in range(0, len(todo), chunks_per_step):
+                step = todo[i:i + chunks_per_step]
+                n_comparisons, distances = evaluate_chunks(sort, n, nt, seed=seed, pool=pool, chunks=step,
+                                                           chunk_size=chunk_size)
+                start = 0
+                for c in step:
+                    size = min(chunk_size, nt - c * chunk_size)
+                    _save_chunk(_chunk_path(directory, name, n, c), n_comparisons[start:start + size],
+                                distances[start:start + size])
+                    start += size
+
+
+def load_sweep(directory):
+    """
+    Load the results of a sweep.
+
+    Parameters
+    ----------
+    directory: :class:`str`
+        Directory of the sweep, cf. :func:`sweep`.
+
+    Returns
+    -------
+    :class:`dict`
+        Same format as :func:`evaluate`. Only the (sort, n) whose chunks are all on disk are included.
+    """
+    with open(os.path.join(directory, MANIFEST)) as f:
+        manifest = json.load(f)
+    n_chunks = -(-manifest['nt'] // manifest['chunk_size'])
+    res = defaultdict(dict)
+    for name in sorted(os.listdir(directory)):
+        if not os.path.isdir(os.path.join(directory, name)):
+            continue
+        for folder in sorted(os.listdir(os.path.join(directory, name)), key=lambda f: int(f[1:])):
+            n = int(folder[1:])
+            paths = [_chunk_path(directory, name, n, c) for c in range(n_chunks)]
+            if not all(os.path.exists(path) for path in paths):
+                continue
+            n_comparisons, distances = _merge_chunks([_load_chunk(path) for path in paths])
+            res[name][n] = {'time': n_comparisons, 'distance': distances}
+    return res
@@ -0,0 +1,400 @@
+import numpy as np
+from numba import njit  # type: ignore
+
+
+class RunningMoments:
+    """
+    Running mean and variance of a stream of numbers (Welford's algorithm, updated by batches).
+
+    Examples
+    --------
+        >>> moments = RunningMoments()
+        >>> moments.update([1, 2, 3]).update([4, 5])
+        RunningMoments(count=5, mean=3.0, std=1.4142135623730951)
+        >>> np.mean([1, 2, 3, 4, 5]), np.std([1, 2, 3, 4, 5])
+        (3.0, 1.4142135623730951)
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.
+        self.m2 = 0.
+
+    def __repr__(self):
+        return f"RunningMoments(count={self.count}, mean={self.mean}, std={self.std})"
+
+    def update(self, values):
+        """
+        Add a batch of values.
+
+        Parameters
+        ----------
+        values: :class:`~numpy.ndarray`
+            The values.
+
+        Returns
+        -------
+        :class:`RunningMoments`
+            Itself.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        if len(values):
+            mean = np.mean(values)
+            self._combine(len(values), mean, np.sum((values - mean) ** 2))
+        return self
+
+    def merge(self, other):
+        """
+        Add the values of another accumulator, e.g. computed by another process.
+
+        Parameters
+        ----------
+        other: :class:`RunningMoments`
+            The other accumulator.
+
+        Returns
+        -------
+        :class:`RunningMoments`
+            Itself.
+        """
+        if other.count:
+            self._combine(other.count, other.mean, other.m2)
+        return self
+
+    def _combine(self, count, mean, m2):
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+
+    @property
+    def variance(self):
+        """:class:`float`: Variance (population), like :func:`numpy.var`."""
+        return self.m2 / self.count if self.count else np.nan
+
+    @property
+    def std(self):
+        """:class:`float`: Standard deviation (population), like :func:`numpy.std`."""
+        return np.sqrt(self.variance)
+
+
+class CountHistogram:
+    """
+    Histogram of a stream of non-negative integers, e.g. numbers of comparisons.
+
+    Its memory is the range of the values, whatever their number. The quantiles are exact.
+
+    Examples
+    --------
+        >>> histogram = CountHistogram()
+        >>> histogram.update([22, 21, 22]).update([25])
+        CountHistogram(count=4, mean=22.5, std=1.5)
+        >>> histogram.quantile(.5)
+        22
+        >>> histogram.quantile([0, 1])
+        array([21, 25])
+
+    Like :class:`RunningMoments`, an empty histogram has a mean of 0 and an undefined standard deviation:
+
+        >>> CountHistogram()
+        CountHistogram(count=0, mean=0.0, std=nan)
+        >>> CountHistogram().quantile(.5), CountHistogram().quantile([0, 1])
+        (nan, array([nan, nan]))
+    """
+
+    def __init__(self):
+        self.counts = np.zeros(0, dtype=int)
+
+    def __repr__(self):
+        return f"CountHistogram(count={self.count}, mean={self.mean}, std={self.std})"
+
+    def update(self, values):
+        """
+        Add a batch of values.
+
+        Parameters
+        ----------
+        values: :class:`~numpy.ndarray`
+            The values.
+
+        Returns
+        -------
+        :class:`CountHistogram`
+            Itself.
+        """
+        return self._add(np.bincount(np.asarray(values, dtype=int).ravel()))
+
+    def merge(self, other):
+        """
+        Add the values of another histogram.
+
+        Parameters
+        ----------
+        other: :class:`CountHistogram`
+            The other histogram.
+
+        Returns
+        -------
+        :class:`CountHistogram`
+            Itself.
+        """
+        return self._add(other.counts)
+
+    def _add(self, counts):
+        if len(counts) > len(self.counts):
+            self.counts = np.concatenate([self.counts, np.zeros(len(counts) - len(self.counts), dtype=int)])
+        self.counts[:len(counts)] += counts
+        return self
+
+    @property
+    def count(self):
+        """:class:`int`: Number of values."""
+        return int(np.sum(self.counts))
+
+    @property
+    def mean(self):
+        """:class:`float`: Mean (0 if there is no value)."""
+        if not self.count:
+            return 0.
+        return float(np.average(np.arange(len(self.counts)), weights=self.counts))
+
+    @property
+    def std(self):
+        """:class:`float`: Standard deviation (population), like :func:`numpy.std` (NaN if there is no value)."""
+        if not self.count:
+            return np.nan
+        return float(np.sqrt(np.average((np.arange(len(self.counts)) - self.mean) ** 2, weights=self.counts)))
+
+    def quantile(self, q):
+        """
+        Quantile(s), as the smallest value whose cumulative frequency reaches `q` (inverted CDF).
+
+        Parameters
+        ----------
+        q: :class:`float` or :class:`~numpy.ndarray`
+            Quantile(s), between 0 and 1.
+
+        Returns
+        -------
+        :class:`int` or :class:`~numpy.ndarray`
+            The value(s). NaN if there is no value.
+        """
+        if not self.count:
+            return np.nan if np.ndim(q) == 0 else np.full(np.shape(q), np.nan)
+        cumulative = np.cumsum(self.counts)
+        res = np.searchsorted(cumulative, np.maximum(np.asarray(q) * cumulative[-1], 1))
+        return int(res) if np.ndim(res) == 0 else res
+
+
+@njit
+def _p2_update(heights, positions, desired, increments, values):
+    """Update the markers of a :class:`P2Quantile` (after the first five values) with new values."""
+    for x in values:
+        if x < heights[0]:
+            heights[0] = x
+            k = 0
+        elif x >= heights[4]:
+            heights[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= heights[k + 1]:
+                k += 1
+        for i in range(k + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            desired[i] += increments[i]
+        for i in range(1, 4):
+            d = desired[i] - positions[i]
+            if (d >= 1 and positions[i + 1] - positions[i] > 1) or (d <= -1 and positions[i - 1] - positions[i] < -1):
+                d = 1. if d > 0 else -1.
+                # Piecewise-parabolic prediction, or linear if it is not monotonic.
+                h = heights[i] + d / (positions[i + 1] - positions[i - 1]) * (
+                    (positions[i] - positions[i - 1] + d) * (heights[i + 1] - heights[i])
+                    / (positions[i + 1] - positions[i])
+                    + (positions[i + 1] - positions[i] - d) * (heights[i] - heights[i - 1])
+                    / (positions[i] - positions[i - 1]))
+                if not heights[i - 1] < h < heights[i + 1]:
+                    j = i + int(d)
+                    h = heights[i] + d * (heights[j] - heights[i]) / (positions[j] - positions[i])
+                heights[i] = h
+                positions[i] += d
+
+
+class P2Quantile:
+    """
+    Estimate of a quantile of a stream of numbers in constant memory (P² algorithm of Jain and Chlamtac).
+
+    Parameters
+    ----------
+    p: :class:`float`
+        The quantile, between 0 and 1.
+
+    Examples
+    --------
+        >>> rng = np.random.default_rng(42)
+        >>> values = rng.normal(size=100000)
+        >>> median = P2Quantile(.5).update(values[:50000]).update(values[50000:])
+        >>> round(median.value, 2), round(np.quantile(values, .5), 2)
+        (-0.01, -0.01)
+        >>> round(P2Quantile(.9).update(values).value, 2), round(np.quantile(values, .9), 2)
+        (1.28, 1.28)
+
+    With less than five values, the quantile is exact:
+
+        >>> P2Quantile(.5).update([3, 1, 2]).value
+        2.0
+    """
+
+    def __init__(self, p):
+        self.p = p
+        self.first = []
+        self.heights = None
+        self.positions = np.arange(1, 6, dtype=float)
+        self.desired = np.array([1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5])
+        self.increments = np.array([0, p / 2, p, (1 + p) / 2, 1])
+
+    def update(self, values):
+        """
+        Add a batch of values.
+
+        Parameters
+        ----------
+        values: :class:`~numpy.ndarray`
+            The values.
+
+        Returns
+        -------
+        :class:`P2Quantile`
+            Itself.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        if self.heights is None:
+            n_first = min(5 - len(self.first), len(values))
+            self.first.extend(values[:n_first])
+            values = values[n_first:]
+            if len(self.first) < 5:
+                return self
+            self.heights = np.sort(self.first)
+        _p2_update(self.heights, self.positions, self.desired, self.increments, values)
+        return self
+
+    @property
+    def value(self):
+        """:class:`float`: Current estimate of the quantile."""
+        if self.heights is None:
+            return float(np.quantile(self.first, self.p)) if self.first else np.nan
+        return float(self.heights[2])
+
+
+class RunningProfile:
+    """
+    Running mean and standard deviation, step by step, of histories of distances.
+
+    Its memory is proportional to the longest history, whatever the number of histories. Like in
+    :class:`~corsort.RaggedHistories`, a finished history is extended with its final value.
+
+    Examples
+    --------
+        >>> from corsort.ragged_histories import RaggedHistories
+        >>> histories = RaggedHistories.from_lists([[4, 2, 0], [2, 0], [6, 4, 2, 2, 0]])
+        >>> profile = RunningProfile().update(histories[:2]).update(histories[2:])
+        >>> profile.mean_profile()
+        array([4.        , 2.        , 0.66666667, 0.66666667, 0.        ])
+        >>> histories.mean_profile()
+        array([4.        , 2.        , 0.66666667, 0.66666667, 0.        ])
+        >>> np.allclose(profile.std_profile(), np.std(np.asarray(histories), axis=0))
+        True
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.sums = np.zeros(0)
+        self.squares = np.zeros(0)
+        self.ends = np.zeros(1)
+        self.ends_squares = np.zeros(1)
+
+    def update(self, histories):
+        """
+        Add histories.
+
+        Parameters
+        ----------
+        histories: :class:`~corsort.RaggedHistories`
+            The histories.
+
+        Returns
+        -------
+        :class:`RunningProfile`
+            Itself.
+        """
+        steps = histories.steps()
+        values = histories.values.astype(float)
+        non_empty = histories.lengths > 0
+        finals = histories.finals()[non_empty].astype(float)
+        lengths = histories.lengths[non_empty]
+        self.sums = _add(self.sums, np.bincount(steps, weights=values))
+        self.squares = _add(self.squares, np.bincount(steps, weights=values ** 2))
+        # The final value of a history counts for all the steps after its end.
+        self.ends = _add(self.ends, np.bincount(lengths, weights=finals))
+        self.ends_squares = _add(self.ends_squares, np.bincount(lengths, weights=finals ** 2))
+        self.count += len(histories)
+        return self
+
+    def merge(self, other):
+        """
+        Add the histories of another profile.
+
+        Parameters
+        ----------
+        other: :class:`RunningProfile`
+            The other profile.
+
+        Returns
+        -------
+        :class:`RunningProfile`
+            Itself.
+        """
+        self.sums = _add(self.sums, other.sums)
+        self.squares = _add(self.squares, other.squares)
+        self.ends = _add(self.ends, other.ends)
+        self.ends_squares = _add(self.ends_squares, other.ends_squares)
+        self.count += other.count
+        return self
+
+    def _totals(self, sums, ends):
+        width = len(self.sums)
+        return (_add(np.zeros(width), sums) + np.cumsum(_add(np.zeros(width), ends[:width]))) / max(self.count, 1)
+
+    def mean_profile(self):
+        """
+        Mean of the histories, step by step.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            Vector of size the maximal length.
+        """
+        return self._totals(self.sums, self.ends)
+
+    def std_profile(self):
+        """
+        Standard deviation (population) of the histories, step by step.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            Vector of size the maximal length.
+        """
+        mean = self.mean_profile()
+        return np.sqrt(np.maximum(self._totals(self.squares, self.ends_squares) - mean ** 2, 0))
+
+
+def _add(a, b):
+    """Sum of two vectors, the shortest being padded with zeros."""
+    if len(a) < len(b):
+        a, b = b, a
+    res = a.copy()
+    res[:len(b)] += b
+    return res
@@ -0,0 +1,288 @@
+import numpy as np
+
+WORD = np.dtype('<u8')
+WORD_SIZE = 64
+
+# Number of set bits of each byte value.
+POPCOUNT_TABLE = np.array([bin(b).count('1') for b in range(256)], dtype=np.uint8)
+
+
+def n_words(n):
+    """
+    Number of 64-bit words needed to store `n` bits.
+
+    Parameters
+    ----------
+    n: :class:`int`
+        Number of bits.
+
+    Returns
+    -------
+    :class:`int`
+        Number of words.
+
+    Examples
+    --------
+        >>> n_words(64)
+        1
+        >>> n_words(65)
+        2
+    """
+    return (n + WORD_SIZE - 1) // WORD_SIZE
+
+
+def pack_rows(mask):
+    """
+    Pack a boolean matrix into bitsets.
+
+    Parameters
+    ----------
+    mask: :class:`~numpy.ndarray`
+        Boolean matrix of size `(m, n)`.
+
+    Returns
+    -------
+    :class:`~numpy.ndarray`
+        Matrix of size `(m, n_words(n))` and dtype little-endian uint64. Bit `k` of row `i` is `mask[i, k]`.
+
+    Examples
+    --------
+        >>> pack_rows(np.array([[True, False, True], [False, True, False]]))
+        array([[5],
+               [2]], dtype=uint64)
+    """
+    m, n = mask.shape
+    packed = np.zeros((m, 8 * n_words(n)), dtype=np.uint8)
+    packed[:, :(n + 7) // 8] = np.packbits(mask, axis=1, bitorder='little')
+    return packed.view(WORD)
+
+
+def unpack_rows(bits, n):
+    """
+    Unpack bitsets into a boolean matrix.
+
+    Parameters
+    ----------
+    bits: :class:`~numpy.ndarray`
+        Matrix of size `(m, n_words(n))` (or a single row of size `n_words(n)`), as returned by :func:`pack_rows`.
+    n: :class:`int`
+        Number of bits per row.
+
+    Returns
+    -------
+    :class:`~numpy.ndarray`
+        Boolean matrix of size `(m, n)` (or a boolean vector of size `n`).
+
+    Examples
+    --------
+        >>> unpack_rows(np.array([[5], [2]], dtype=np.uint64), 3)
+        array([[ True, False,  True],
+               [False,  True, False]])
+    """
+    as_bytes = np.ascontiguousarray(bits, dtype=WORD).view(np.uint8)
+    return np.unpackbits(as_bytes, axis=-1, count=n, bitorder='little').astype(bool)
+
+
+def popcount_rows(bits):
+    """
+    Number of set bits in each bitset.
+
+    Parameters
+    ----------
+    bits: :class:`~numpy.ndarray`
+        Matrix of size `(m, w)` of uint64 words.
+
+    Returns
+    -------
+    :class:`~numpy.ndarray`
+        Vector of size `m`.
+
+    Examples
+    --------
+        >>> popcount_rows(np.array([[5, 1], [2, 0]], dtype=np.uint64))
+        array([3, 1])
+    """
+    as_bytes = np.ascontiguousarray(bits, dtype=WORD).view(np.uint8)
+    return POPCOUNT_TABLE[as_bytes].sum(axis=-1, dtype=int)
+
+
+class PosetBitset:
+    """
+    Poset stored as packed bitsets of ancestors and descendants.
+
+    Each item has one row of `ceil(n / 64)` uint64 words for its ancestors and one for its descendants, so the
+    memory footprint is `n ** 2 / 4` bytes instead of `8 * n ** 2` for a dense int matrix. Learning a comparison
+    ORs a single row into the rows of the items concerned.
+
+    The saving only holds as long as nobody reads the dense view :attr:`leq`, i.e. in a :class:`~corsort.Corsort`
+    whose `final_scorer` is an :class:`~corsort.IncrementalScorer` and whose comparison policy does not use `leq_`.
+    Once read, the dense view is kept and updated with the newly learned pairs, so that it is not rebuilt at each
+    comparison.
+
+    Parameters
+    ----------
+    n: :class:`int`
+        Number of items.
+
+    Attributes
+    ----------
+    ancestors: :class:`~numpy.ndarray`
+        Matrix of size `(n, n_words(n))`. Bit `k` of row `i` is set if we know that item i <= item k.
+    descendants: :class:`~numpy.ndarray`
+        Matrix of size `(n, n_words(n))`. Bit `k` of row `i` is set if we know that item k <= item i.
+
+    Examples
+    --------
+        >>> poset = PosetBitset(4)
+        >>> _ = poset.apply_i_lt_j(0, 1)
+        >>> _ = poset.apply_i_lt_j(2, 3)
+        >>> _ = poset.apply_i_lt_j(1, 2)
+        >>> poset.leq
+        array([[ 1,  1,  1,  1],
+               [-1,  1,  1,  1],
+               [-1, -1,  1,  1],
+               [-1, -1, -1,  1]], dtype=int8)
+        >>> poset.n_ancestors()
+        array([4, 3, 2, 1])
+        >>> poset.n_descendants()
+        array([1, 2, 3, 4])
+
+    The result is the same as with a dense matrix:
+
+        >>> from corsort.poset_dense import PosetDense
+        >>> np.random.seed(42)
+        >>> n = 100
+        >>> poset_bitset = PosetBitset(n)
+        >>> poset_dense = PosetDense(n)
+        >>> for _ in range(300):
+        ...     i, j = np.random.choice(n, 2, replace=False)
+        ...     if poset_dense.leq[i, j] == 0:
+        ...         _ = poset_bitset.apply_i_lt_j(i, j)
+        ...         _ = poset_dense.apply_i_lt_j(i, j)
+        >>> np.array_equal(poset_bitset.leq, poset_dense.leq)
+        True
+    """
+
+    def __init__(self, n):
+        self.n = n
+        self.ancestors = pack_rows(np.eye(n, dtype=bool))
+        self.descendants = self.ancestors.copy()
+        self._leq = None
+
+    @classmethod
+    def from_leq(cls, leq):
+        """
+        Poset from a `leq` matrix.
+
+        Parameters
+        ----------
+        leq: :class:`~numpy.ndarray`.
+            Matrix of size `(n, n)`.
+
+        Returns
+        -------
+        :class:`PosetBitset`
+            The poset.
+
+        Examples
+        --------
+            >>> poset = PosetBitset.from_leq(np.array([[1, 1], [-1, 1]]))
+            >>> poset.ancestors
+            array([[3],
+                   [2]], dtype=uint64)
+            >>> poset.descendants
+            array([[1],
+                   [3]], dtype=uint64)
+        """
+        poset = cls.__new__(cls)
+        poset.n = leq.shape[0]
+        poset.ancestors = pack_rows(leq == 1)
+        poset.descendants = pack_rows((leq == 1).T)
+        poset._leq = None
+        return poset
+
+    @property
+    def leq(self):
+        """:class:`~numpy.ndarray`: Dense `leq` matrix of size `(n, n)`, cf. :class:`~corsort.PosetDense`.
+
+        It is computed on demand, then kept up to date by :meth:`apply_i_lt_j`.
+
+        Examples
+        --------
+            >>> poset = PosetBitset(3)
+            >>> poset.leq
+            array([[1, 0, 0],
+                   [0, 1, 0],
+                   [0, 0, 1]], dtype=int8)
+            >>> _ = poset.apply_i_lt_j(0, 1)
+            >>> _ = poset.apply_i_lt_j(1, 2)
+            >>> poset.leq
+            array([[ 1,  1,  1],
+                   [-1,  1,  1],
+                   [-1, -1,  1]], dtype=int8)
+        """
+        if self._leq is None:
+            geq = unpack_rows(self.ancestors, self.n).astype(np.int8)
+            self._leq = geq - geq.T
+            np.fill_diagonal(self._leq, 1)
+        return self._leq
+
+    def apply_i_lt_j(self, i, j):
+        """
+        Assuming item i < item j, update the poset by transitivity.
+
+        Parameters
+        ----------
+        i: :class:`int`
+            Index of the small item.
+        j: :class:`int`
+            Index of the big item.
+
+        Returns
+        -------
+        downs: :class:`~numpy.ndarray`
+            Indices of the low items of the newly learned pairs.
+        ups: :class:`~numpy.ndarray`
+            Indices of the high items of the newly learned pairs.
+
+        Examples
+        --------
+            >>> poset = PosetBitset(3)
+            >>> poset.apply_i_lt_j(0, 1)
+            (array([0]), array([1]))
+            >>> poset.apply_i_lt_j(1, 2)
+            (array([0, 1]), array([2, 2]))
+        """
+        i_and_smaller = np.flatnonzero(unpack_rows(self.descendants[i], self.n))
+        j_and_greater = np.flatnonzero(unpack_rows(self.ancestors[j], self.n))
+        new_bits = self.ancestors[j] & ~self.ancestors[i_and_smaller]
+        new_rows, new_cols = np.nonzero(unpack_rows(new_bits, self.n))
+        self.ancestors[i_and_smaller] |= self.ancestors[j]
+        self.descendants[j_and_greater] |= self.descendants[i]
+        downs, ups = i_and_smaller[new_rows], new_cols
+        if self._leq is not None:
+            self._leq[downs, ups] = 1
+            self._leq[ups, downs] = -1
+        return downs, ups
+
+    def n_ancestors(self):
+        """
+        Number of ancestors.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            For each item, the number of items known to be greater or equal (including itself).
+        """
+        return popcount_rows(self.ancestors)
+
+    def n_descendants(self):
+        """
+        Number of descendants.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            For each item, the number of items known to be lower or equal (including itself).
+        """
+        return popcount_rows(self.descendants)
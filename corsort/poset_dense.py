@@ -0,0 +1,125 @@
+import numpy as np
+
+
+class PosetDense:
+    """
+    Poset stored as a dense `leq` matrix.
+
+    This is the historical backend of :class:`~corsort.Corsort`.
+
+    Parameters
+    ----------
+    n: :class:`int`
+        Number of items.
+
+    Attributes
+    ----------
+    leq: :class:`~numpy.ndarray`.
+        Matrix of size `(n, n)`. Coefficient (i, j) is
+        +1 if we know that item i <= item j,
+        -1 if we know that item i > item j,
+        0 if we do not know the comparison between them.
+
+    Examples
+    --------
+        >>> poset = PosetDense(4)
+        >>> _ = poset.apply_i_lt_j(0, 1)
+        >>> _ = poset.apply_i_lt_j(2, 3)
+        >>> _ = poset.apply_i_lt_j(1, 2)
+        >>> poset.leq
+        array([[ 1,  1,  1,  1],
+               [-1,  1,  1,  1],
+               [-1, -1,  1,  1],
+               [-1, -1, -1,  1]])
+        >>> poset.n_ancestors()
+        array([4, 3, 2, 1])
+        >>> poset.n_descendants()
+        array([1, 2, 3, 4])
+    """
+
+    def __init__(self, n):
+        self.n = n
+        self.leq = np.eye(n, dtype=int)
+
+    @classmethod
+    def from_leq(cls, leq):
+        """
+        Poset from a `leq` matrix.
+
+        Parameters
+        ----------
+        leq: :class:`~numpy.ndarray`.
+            Matrix of size `(n, n)`. The matrix is used as is (not copied).
+
+        Returns
+        -------
+        :class:`PosetDense`
+            The poset.
+
+        Examples
+        --------
+            >>> my_leq = np.array([[1, 1], [-1, 1]])
+            >>> poset = PosetDense.from_leq(my_leq)
+            >>> poset.leq is my_leq
+            True
+        """
+        poset = cls.__new__(cls)
+        poset.n = leq.shape[0]
+        poset.leq = leq
+        return poset
+
+    def apply_i_lt_j(self, i, j):
+        """
+        Assuming item i < item j, update the poset by transitivity.
+
+        Parameters
+        ----------
+        i: :class:`int`
+            Index of the small item.
+        j: :class:`int`
+            Index of the big item.
+
+        Returns
+        -------
+        downs: :class:`~numpy.ndarray`
+            Indices of the low items of the newly learned pairs.
+        ups: :class:`~numpy.ndarray`
+            Indices of the high items of the newly learned pairs.
+
+        Examples
+        --------
+            >>> poset = PosetDense(3)
+            >>> poset.apply_i_lt_j(0, 1)
+            (array([0]), array([1]))
+            >>> poset.apply_i_lt_j(1, 2)
+            (array([0, 1]), array([2, 2]))
+        """
+        i_and_smaller = np.flatnonzero(self.leq[:, i] > 0)
+        j_and_greater = np.flatnonzero(self.leq[j, :] > 0)
+        block = np.ix_(i_and_smaller, j_and_greater)
+        new_rows, new_cols = np.nonzero(self.leq[block] == 0)
+        self.leq[block] = 1
+        self.leq[np.ix_(j_and_greater, i_and_smaller)] = -1
+        return i_and_smaller[new_rows], j_and_greater[new_cols]
+
+    def n_ancestors(self):
+        """
+        Number of ancestors.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            For each item, the number of items known to be greater or equal (including itself).
+        """
+        return np.sum(self.leq == 1, axis=1)
+
+    def n_descendants(self):
+        """
+        Number of descendants.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            For each item, the number of items known to be lower or equal (including itself).
+        """
+        return np.sum(self.leq == 1, axis=0)
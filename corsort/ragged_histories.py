@@ -0,0 +1,260 @@
+import numpy as np
+
+
+class RaggedHistories:
+    """
+    Histories of distances of different lengths, stored as flat values and offsets (CSR-style).
+
+    A history ends when the sort is over: in the padded view and in the profiles, each history is extended with its
+    final value (0 for a sort whose final estimate is the sorted list). Converting to a NumPy array (e.g. with
+    :func:`numpy.percentile`) gives the padded view.
+
+    Parameters
+    ----------
+    values: :class:`~numpy.ndarray`
+        All the histories, one after the other.
+    offsets: :class:`~numpy.ndarray`
+        Vector of size `nt + 1`. History `k` is `values[offsets[k]:offsets[k + 1]]`.
+
+    Examples
+    --------
+        >>> histories = RaggedHistories.from_lists([[4, 2, 0], [2, 0], [6, 4, 2, 2, 0]])
+        >>> histories.values
+        array([4, 2, 0, 2, 0, 6, 4, 2, 2, 0])
+        >>> histories.offsets
+        array([ 0,  3,  5, 10])
+        >>> len(histories), histories.shape
+        (3, (3, 5))
+        >>> histories[1]
+        array([2, 0])
+        >>> histories.lengths
+        array([3, 2, 5])
+        >>> np.asarray(histories)
+        array([[4, 2, 0, 0, 0],
+               [2, 0, 0, 0, 0],
+               [6, 4, 2, 2, 0]])
+        >>> histories.mean_profile()
+        array([4.        , 2.        , 0.66666667, 0.66666667, 0.        ])
+        >>> histories.quantile_profile(.5)
+        array([4., 2., 0., 0., 0.])
+    """
+
+    def __init__(self, values, offsets):
+        self.values = np.asarray(values, dtype=int)
+        self.offsets = np.asarray(offsets, dtype=int)
+
+    @classmethod
+    def from_lists(cls, histories):
+        """
+        Histories from a list of lists.
+
+        Parameters
+        ----------
+        histories: :class:`list` of :class:`list`
+            The histories.
+
+        Returns
+        -------
+        :class:`RaggedHistories`
+            The histories.
+
+        Examples
+        --------
+            >>> RaggedHistories.from_lists([]).shape
+            (0, 0)
+        """
+        offsets = np.zeros(len(histories) + 1, dtype=int)
+        offsets[1:] = np.cumsum([len(h) for h in histories])
+        values = np.concatenate([np.zeros(0, dtype=int)] + [np.asarray(h, dtype=int) for h in histories])
+        return cls(values, offsets)
+
+    @classmethod
+    def from_padded(cls, matrix, lengths):
+        """
+        Histories from the rows of a matrix.
+
+        Parameters
+        ----------
+        matrix: :class:`~numpy.ndarray`
+            Matrix of size `(nt, width)`.
+        lengths: :class:`~numpy.ndarray`
+            Vector of size `nt`. Length of each history (at most `width`).
+
+        Returns
+        -------
+        :class:`RaggedHistories`
+            The histories.
+
+        Examples
+        --------
+            >>> RaggedHistories.from_padded(np.array([[3, 1, 0], [2, 0, 0]]), np.array([3, 2])).values
+            array([3, 1, 0, 2, 0])
+        """
+        lengths = np.asarray(lengths, dtype=int)
+        offsets = np.zeros(len(lengths) + 1, dtype=int)
+        offsets[1:] = np.cumsum(lengths)
+        mask = np.arange(matrix.shape[1]) < lengths[:, np.newaxis]
+        return cls(matrix[mask], offsets)
+
+    @classmethod
+    def concatenate(cls, parts):
+        """
+        Concatenate histories.
+
+        Parameters
+        ----------
+        parts: :class:`list` of :class:`RaggedHistories`
+            The histories to concatenate.
+
+        Returns
+        -------
+        :class:`RaggedHistories`
+            The histories of all the parts, in order.
+
+        Examples
+        --------
+            >>> a = RaggedHistories.from_lists([[3, 1, 0]])
+            >>> b = RaggedHistories.from_lists([[2, 0], [0]])
+            >>> RaggedHistories.concatenate([a, b]).offsets
+            array([0, 3, 5, 6])
+        """
+        offsets = [np.zeros(1, dtype=int)]
+        start = 0
+        for part in parts:
+            offsets.append(part.offsets[1:] + start)
+            start += part.offsets[-1]
+        values = np.concatenate([np.zeros(0, dtype=int)] + [part.values for part in parts])
+        return cls(values, np.concatenate(offsets))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self))
+            if step != 1:
+                raise ValueError("Only contiguous slices of histories are supported.")
+            stop = max(start, stop)
+            return RaggedHistories(self.values[self.offsets[start]:self.offsets[stop]],
+                                   self.offsets[start:stop + 1] - self.offsets[start])
+        return self.values[self.offsets[item]:self.offsets[item + 1]]
+
+    @property
+    def lengths(self):
+        """:class:`~numpy.ndarray`: Length of each history."""
+        return np.diff(self.offsets)
+
+    @property
+    def shape(self):
+        """:class:`tuple`: Shape of the padded view, i.e. number of histories and maximal length."""
+        return len(self), int(np.max(self.lengths, initial=0))
+
+    def steps(self):
+        """
+        Index of each value in its history.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            Vector of the same size as `values`.
+
+        Examples
+        --------
+            >>> RaggedHistories.from_lists([[4, 2, 0], [2, 0]]).steps()
+            array([0, 1, 2, 0, 1])
+        """
+        return np.arange(len(self.values)) - np.repeat(self.offsets[:-1], self.lengths)
+
+    def finals(self):
+        """
+        Final value of each history.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            Vector of size `nt` (0 for an empty history).
+
+        Examples
+        --------
+            >>> RaggedHistories.from_lists([[4, 2, 1], [], [2, 0]]).finals()
+            array([1, 0, 0])
+        """
+        if len(self.values) == 0:
+            return np.zeros(len(self), dtype=int)
+        return np.where(self.lengths > 0, self.values[np.maximum(self.offsets[1:] - 1, 0)], 0)
+
+    def to_padded(self, start=0, stop=None):
+        """
+        Padded view of a range of steps.
+
+        Parameters
+        ----------
+        start: :class:`int`
+            First step.
+        stop: :class:`int`, optional
+            Last step (excluded). Default: maximal length.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            Matrix of size `(nt, stop - start)`. Each history is extended with its final value.
+
+        Examples
+        --------
+            >>> RaggedHistories.from_lists([[4, 2, 0], [2, 1]]).to_padded(1, 4)
+            array([[2, 0, 0],
+                   [1, 1, 1]])
+        """
+        if stop is None:
+            stop = self.shape[1]
+        res = np.empty((len(self), stop - start), dtype=int)
+        res[:] = self.finals()[:, np.newaxis]
+        steps = self.steps()
+        selected = (steps >= start) & (steps < stop)
+        rows = np.repeat(np.arange(len(self)), self.lengths)
+        res[rows[selected], steps[selected] - start] = self.values[selected]
+        return res
+
+    def __array__(self, dtype=None):
+        res = self.to_padded()
+        return res if dtype is None else res.astype(dtype)
+
+    def mean_profile(self):
+        """
+        Mean of the histories, step by step.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            Vector of size the maximal length. Same as the mean over the rows of the padded view, without building
+            it.
+        """
+        nt, width = self.shape
+        sums = np.bincount(self.steps(), weights=self.values, minlength=width)
+        non_empty = self.lengths > 0
+        # A finished history keeps contributing with its final value.
+        ends = np.bincount(self.lengths[non_empty], weights=self.finals()[non_empty], minlength=width + 1)
+        return (sums + np.cumsum(ends[:width])) / max(nt, 1)
+
+    def quantile_profile(self, q, block_size=1024):
+        """
+        Quantiles of the histories, step by step.
+
+        Parameters
+        ----------
+        q: :class:`float` or :class:`~numpy.ndarray`
+            Quantile(s), between 0 and 1.
+        block_size: :class:`int`
+            Number of steps of the padded view that are built at a time.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            Same as :func:`numpy.quantile` over the rows of the padded view, which is built by blocks of steps.
+        """
+        width = self.shape[1]
+        blocks = [np.quantile(self.to_padded(start, min(start + block_size, width)), q, axis=0)
+                  for start in range(0, width, block_size)]
+        if not blocks:
+            return np.quantile(np.zeros((1, 0)), q, axis=0)
+        return np.concatenate(blocks, axis=-1)
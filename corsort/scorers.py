@@ -1,4 +1,6 @@
+from abc import ABC, abstractmethod
 import numpy as np
+from corsort.poset_dense import PosetDense
 
 
 def scorer_delta(leq):
@@ -71,3 +73,170 @@ def scorer_rho(leq):
     n_ancestors = np.sum(leq == 1, axis=1)
     n_descendants = np.sum(leq == 1, axis=0)
     return n_descendants / n_ancestors
+
+
+class IncrementalScorer(ABC):
+    """
+    Stateful scorer, updated with the newly learned pairs instead of recomputed from the full `leq` matrix.
+
+    The scorer keeps track of the number of ancestors and descendants of each item. Calling it on a `leq` matrix
+    (or :meth:`initialize` on a poset) recomputes everything from scratch and resets the state; :meth:`update` only
+    processes the pairs learned since then.
+
+    Attributes
+    ----------
+    n_ancestors_: :class:`~numpy.ndarray`
+        For each item, the number of items known to be greater or equal (including itself).
+    n_descendants_: :class:`~numpy.ndarray`
+        For each item, the number of items known to be lower or equal (including itself).
+    """
+
+    def __init__(self):
+        self.n_ancestors_ = None
+        self.n_descendants_ = None
+
+    def __call__(self, leq):
+        """
+        Full computation of the scores.
+
+        Parameters
+        ----------
+        leq: :class:`~numpy.ndarray`.
+            Matrix of size `(n_, n_)`, cf. :func:`scorer_delta`.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            Score for each item.
+        """
+        return self.initialize(PosetDense.from_leq(leq))
+
+    def initialize(self, poset):
+        """
+        Full computation of the scores from a poset backend.
+
+        The counts are given by the backend, e.g. by popcounts for a :class:`~corsort.PosetBitset`, so that no
+        dense `leq` matrix is needed.
+
+        Parameters
+        ----------
+        poset: :class:`~corsort.PosetDense` or :class:`~corsort.PosetBitset`
+            The poset.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            Score for each item.
+
+        Examples
+        --------
+            >>> from corsort.poset_bitset import PosetBitset
+            >>> poset = PosetBitset(3)
+            >>> _ = poset.apply_i_lt_j(0, 1)
+            >>> ScorerRho().initialize(poset)
+            array([0.5, 2. , 1. ])
+        """
+        self.n_ancestors_ = poset.n_ancestors()
+        self.n_descendants_ = poset.n_descendants()
+        return self.scores()
+
+    def update(self, downs, ups):
+        """
+        Incremental computation of the scores.
+
+        The scorer must have been initialized first, by a call on a `leq` matrix or by :meth:`initialize`.
+
+        Parameters
+        ----------
+        downs: :class:`~numpy.ndarray`
+            Indices of the low items of the newly learned pairs.
+        ups: :class:`~numpy.ndarray`
+            Indices of the high items of the newly learned pairs.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            Score for each item.
+
+        Examples
+        --------
+            >>> ScorerRho().update(downs=np.array([0]), ups=np.array([1]))
+            Traceback (most recent call last):
+            ...
+            ValueError: The scorer must be initialized before being updated.
+        """
+        if self.n_ancestors_ is None:
+            raise ValueError("The scorer must be initialized before being updated.")
+        n = len(self.n_ancestors_)
+        self.n_ancestors_ += np.bincount(downs, minlength=n)
+        self.n_descendants_ += np.bincount(ups, minlength=n)
+        return self.scores()
+
+    @abstractmethod
+    def scores(self):
+        """
+        Scores from the current numbers of ancestors and descendants.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            Score for each item.
+        """
+
+
+class ScorerDelta(IncrementalScorer):
+    """
+    Incremental version of :func:`scorer_delta`.
+
+    Examples
+    --------
+        >>> my_leq = np.array([
+        ...     [ 1,  1,  1,  0],
+        ...     [-1,  1, -1, -1],
+        ...     [-1,  1,  1,  0],
+        ...     [ 0,  1,  0,  1],
+        ... ])
+        >>> scorer = ScorerDelta()
+        >>> scorer(my_leq)
+        array([-2,  3,  0, -1])
+
+    Now we learn that item 0 <= item 3:
+
+        >>> scorer.update(downs=np.array([0]), ups=np.array([3]))
+        array([-3,  3,  0,  0])
+        >>> my_leq[0, 3], my_leq[3, 0] = 1, -1
+        >>> scorer_delta(my_leq)
+        array([-3,  3,  0,  0])
+    """
+
+    def scores(self):
+        return self.n_descendants_ - self.n_ancestors_
+
+
+class ScorerRho(IncrementalScorer):
+    """
+    Incremental version of :func:`scorer_rho`.
+
+    Examples
+    --------
+        >>> my_leq = np.array([
+        ...     [ 1,  1,  1,  0],
+        ...     [-1,  1, -1, -1],
+        ...     [-1,  1,  1,  0],
+        ...     [ 0,  1,  0,  1],
+        ... ])
+        >>> scorer = ScorerRho()
+        >>> scorer(my_leq)
+        array([0.33333333, 4.        , 1.        , 0.5       ])
+
+    Now we learn that item 0 <= item 3:
+
+        >>> scorer.update(downs=np.array([0]), ups=np.array([3]))
+        array([0.25, 4.  , 1.  , 1.  ])
+        >>> my_leq[0, 3], my_leq[3, 0] = 1, -1
+        >>> scorer_rho(my_leq)
+        array([0.25, 4.  , 1.  , 1.  ])
+    """
+
+    def scores(self):
+        return self.n_descendants_ / self.n_ancestors_
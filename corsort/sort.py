@@ -1,4 +1,5 @@
 import numpy as np
+from corsort.comparison_log import ComparisonLog
 
 
 class Sort:
@@ -9,6 +10,9 @@ class Sort:
     ----------
     compute_history: :class:`bool`
         If True, then compute the history of the distance to the sorted array.
+    jit: :class:`bool`
+        If True and `compute_history` is False, then use the compiled version of the algorithm, if any (cf.
+        :mod:`corsort.jit_comparison_sorts`). The comparisons are the same.
 
     Attributes
     ----------
@@ -20,14 +24,15 @@ class Sort:
         Number of comparison performed.
     history_distances_: :class:`list` of :class:`int`
         History of the Spearman footrule metric to the sorted list.
-    history_comparisons_: :class:`list` of :class:`tuple`
-        History of the pairwise comparisons. Tuple (i, j) means that items of indices i and j were compared, and
+    history_comparisons_: :class:`~corsort.ComparisonLog`
+        History of the pairwise comparisons. Comparison (i, j) means that items of indices i and j were compared, and
         that perm[i] < perm[j].
     """
 
-    def __init__(self, compute_history=False):
+    def __init__(self, compute_history=False, jit=False):
         # Parameters
         self.compute_history = compute_history
+        self.jit = jit
         # Computed values
         self.n_ = None
         self.perm_ = None
@@ -71,10 +76,10 @@ class Sort:
         if self.compute_history:
             self.history_distances_.append(self.distance_to_sorted_array())
         if self.perm_[i] < self.perm_[j]:
-            self.history_comparisons_.append((i, j))
+            self.history_comparisons_.append(i, j)
             return True
         else:
-            self.history_comparisons_.append((j, i))
+            self.history_comparisons_.append(j, i)
             return False
 
     def _initialize_algo(self, perm):
@@ -92,7 +97,7 @@ class Sort:
         self.perm_ = perm
         self.n_comparisons_ = 0
         self.history_distances_ = []
-        self.history_comparisons_ = []
+        self.history_comparisons_ = ComparisonLog()
         self._initialize_algo_aux()
 
     def _initialize_algo_aux(self):
@@ -115,6 +120,10 @@ class Sort:
         Itself.
         """
         self._initialize_algo(perm)
+        if self.jit and not self.compute_history:
+            self.history_comparisons_ = ComparisonLog.from_array(self._call_jit())
+            self.n_comparisons_ = len(self.history_comparisons_)
+            return self
         self._call_aux()
         # Final update of history_distance
         if self.compute_history:
@@ -127,11 +136,20 @@ class Sort:
         """
         raise NotImplementedError
 
+    def _call_jit(self):
+        """
+        Compiled version of the algorithm, without history of distances.
+
+        Must update the state of the algorithm and return the comparisons as an int32 array of size `(m, 2)`.
+        """
+        raise NotImplementedError
+
     @property
     def history_comparisons_values_(self):
-        """:class:`list` of :class:`tuple`: History of the pairwise comparisons, in terms of compared values.
-        Tuple (x, y) means that items of values x and y were compared, and that x < y.
+        """:class:`~numpy.ndarray`: History of the pairwise comparisons, in terms of compared values, as an array of
+        size `(m, 2)`. Row (x, y) means that items of values x and y were compared, and that x < y. It is computed once
+        per sort, cf. :meth:`~corsort.ComparisonLog.values`.
         """
         if self.history_comparisons_ is None:
             return None
-        return [(self.perm_[i], self.perm_[j]) for (i, j) in self.history_comparisons_]
+        return self.history_comparisons_.values(self.perm_)
@@ -1,6 +1,7 @@
 import numpy as np
 from corsort.sort import Sort
 from corsort.distance_to_sorted_array import distance_to_sorted_array
+from corsort.jit_comparison_sorts import jit_merge_sort_bottom_up
 from corsort.merge import merge
 from corsort.split_pointer_lists import split_pointer_lists
 
@@ -26,8 +27,8 @@ class SortMergeBottomUp(Sort):
 
     __name__ = 'mergesort_bottom_up'
 
-    def __init__(self, compute_history=False):
-        super().__init__(compute_history=compute_history)
+    def __init__(self, compute_history=False, jit=False):
+        super().__init__(compute_history=compute_history, jit=jit)
         self.sorted_indices_ = None
 
     def _initialize_algo_aux(self):
@@ -36,6 +37,10 @@ class SortMergeBottomUp(Sort):
     def _call_aux(self):
         _merge_sort_bottom_up(self.sorted_indices_, lt=self.test_i_lt_j)
 
+    def _call_jit(self):
+        self.sorted_indices_, comparisons = jit_merge_sort_bottom_up(self.perm_)
+        return comparisons
+
     def distance_to_sorted_array(self):
         return distance_to_sorted_array(self.perm_[self.sorted_indices_])
 
@@ -1,6 +1,7 @@
 import numpy as np
 from corsort.sort import Sort
 from corsort.distance_to_sorted_array import distance_to_sorted_array
+from corsort.jit_comparison_sorts import jit_merge_sort_top_down
 from corsort.merge import merge
 
 
@@ -25,8 +26,8 @@ class SortMergeTopDown(Sort):
 
     __name__ = 'mergesort_top_down'
 
-    def __init__(self, compute_history=False):
-        super().__init__(compute_history=compute_history)
+    def __init__(self, compute_history=False, jit=False):
+        super().__init__(compute_history=compute_history, jit=jit)
         self.sorted_indices_ = None
 
     def _initialize_algo_aux(self):
@@ -35,6 +36,10 @@ class SortMergeTopDown(Sort):
     def _call_aux(self):
         _merge_sort_top_down(self.sorted_indices_, lt=self.test_i_lt_j)
 
+    def _call_jit(self):
+        self.sorted_indices_, comparisons = jit_merge_sort_top_down(self.perm_)
+        return comparisons
+
     def distance_to_sorted_array(self):
         return distance_to_sorted_array(self.perm_[self.sorted_indices_])
 
@@ -1,11 +1,28 @@
 import numpy as np
-from itertools import permutations
+
+
+def _strict(leq):
+    """Boolean matrix of the pairs (i, j) such that item i < item j."""
+    strict = (leq == 1)
+    np.fill_diagonal(strict, False)
+    return strict
+
+
+def _has_middle(lower, upper):
+    """For each pair (i, j), whether there is an item k such that lower[i, k] and upper[k, j] (matrix product)."""
+    return (lower.astype(np.float32) @ upper.astype(np.float32)) > 0
+
+
+def _edges(covers):
+    return [(i, j) for i, j in zip(*np.nonzero(covers))]
 
 
 def transitive_reduction(leq):
     """
     Transitive reduction of a `leq` matrix.
 
+    A pair (i, j) is kept if there is no item k such that i < k < j, which is computed with one matrix product.
+
     Parameters
     ----------
     leq: :class:`~numpy.ndarray`.
@@ -29,10 +46,68 @@ def transitive_reduction(leq):
         >>> transitive_reduction(my_leq)
         [(0, 1), (1, 2)]
     """
-    mask_keep = (leq == 1)
-    comparisons = [(i, j) for i, j in zip(*np.where(leq == 1)) if i != j]
-    for (i, j), (k, l) in permutations(comparisons, 2):
-        if j == k:
-            mask_keep[i, l] = False
-    comparisons = [(i, j) for i, j in zip(*np.where(mask_keep)) if i != j]
-    return comparisons
+    strict = _strict(leq)
+    return _edges(strict & ~_has_middle(strict, strict))
+
+
+class TransitiveReduction:
+    """
+    Transitive reduction of a poset, updated when new pairs are learned.
+
+    When pairs (x, y) are learned, the status of a pair (i, j) can only change if i is the low item or j the high
+    item of a new pair, so only these rows and columns are computed again.
+
+    Parameters
+    ----------
+    poset: :class:`~corsort.PosetDense` or :class:`~corsort.PosetBitset`
+        The poset. Its matrix `leq` is read at each update.
+
+    Attributes
+    ----------
+    covers: :class:`~numpy.ndarray`
+        Matrix of size `(n, n)`. Coefficient (i, j) is True if (i, j) is an edge of the transitive reduction.
+
+    Examples
+    --------
+        >>> from corsort.poset_dense import PosetDense
+        >>> poset = PosetDense(4)
+        >>> reduction = TransitiveReduction(poset)
+        >>> for i, j in [(0, 1), (2, 3), (0, 3)]:
+        ...     reduction.update(*poset.apply_i_lt_j(i, j))
+        >>> reduction.edges
+        [(0, 1), (0, 3), (2, 3)]
+        >>> reduction.update(*poset.apply_i_lt_j(1, 2))
+        >>> reduction.edges
+        [(0, 1), (1, 2), (2, 3)]
+        >>> reduction.edges == transitive_reduction(poset.leq)
+        True
+    """
+
+    def __init__(self, poset):
+        self.poset = poset
+        strict = _strict(poset.leq)
+        self.covers = strict & ~_has_middle(strict, strict)
+
+    def update(self, downs, ups):
+        """
+        Update the reduction after new pairs have been learned.
+
+        Parameters
+        ----------
+        downs: :class:`~numpy.ndarray`
+            Indices of the low items of the newly learned pairs.
+        ups: :class:`~numpy.ndarray`
+            Indices of the high items of the newly learned pairs.
+        """
+        if len(downs) == 0:
+            return
+        strict = _strict(self.poset.leq)
+        rows = np.unique(downs)
+        cols = np.unique(ups)
+        self.covers[rows, :] = strict[rows, :] & ~_has_middle(strict[rows, :], strict)
+        self.covers[:, cols] = strict[:, cols] & ~_has_middle(strict, strict[:, cols])
+
+    @property
+    def edges(self):
+        """:class:`list`: Edges of the transitive reduction, cf. :func:`transitive_reduction`."""
+        return _edges(self.covers)
@@ -1,4 +1,88 @@
 import numpy as np
+from numba import njit  # type: ignore
+
+
+@njit
+def jit_chain_heights(leq):
+    """
+    Length of the longest chain starting at each item (dynamic programming in topological order).
+
+    Parameters
+    ----------
+    leq: :class:`~numpy.ndarray`.
+        Matrix of size `(n_, n_)`. Coefficient (i, j) is
+        +1 if we know that item i <= item j,
+        -1 if we know that item i > item j,
+        0 if we do not know the comparison between them.
+        An item i such that `leq[i, i] == -1` is considered as removed (cf. :func:`greedy_chain_decomposition`).
+
+    Returns
+    -------
+    heights: :class:`~numpy.ndarray`
+        For each item, number of items of the longest chain starting at it (0 for a removed item).
+    successors: :class:`~numpy.ndarray`
+        For each item, next item of this chain (-1 if there is none). In case of tie, the item of lowest index.
+
+    Notes
+    -----
+    The complexity is `O(n^2)`: the items are processed from the greatest ones to the smallest ones (Kahn's
+    algorithm), and each item examines the items that are greater than itself only once.
+
+    Examples
+    --------
+        >>> my_leq = np.array([
+        ...     [ 1,  1,  1,  1,  0,  0],
+        ...     [-1,  1,  1,  0,  0,  0],
+        ...     [-1, -1,  1,  0,  0,  0],
+        ...     [-1,  0,  0,  1,  0,  0],
+        ...     [ 0,  0,  0,  0,  1,  1],
+        ...     [ 0,  0,  0,  0, -1,  1],
+        ... ])
+        >>> heights, successors = jit_chain_heights(my_leq)
+        >>> heights
+        array([3, 2, 1, 1, 2, 1])
+        >>> successors
+        array([ 1,  2, -1, -1,  5, -1])
+    """
+    n = leq.shape[0]
+    heights = np.zeros(n, dtype=np.int64)
+    successors = np.full(n, -1, dtype=np.int64)
+    # Number of greater items that are not processed yet (a removed item counts itself, so it is never processed).
+    n_waiting = np.zeros(n, dtype=np.int64)
+    for i in range(n):
+        for j in range(n):
+            if leq[j, i] == -1:
+                n_waiting[i] += 1
+    ready = np.empty(n, dtype=np.int64)
+    n_ready = 0
+    for i in range(n):
+        if n_waiting[i] == 0:
+            ready[n_ready] = i
+            n_ready += 1
+    k = 0
+    while k < n_ready:
+        i = ready[k]
+        k += 1
+        heights[i] = 1
+        for j in range(n):
+            if leq[j, i] == -1 and heights[j] + 1 > heights[i]:
+                heights[i] = heights[j] + 1
+                successors[i] = j
+        for j in range(n):
+            if leq[i, j] == -1 and j != i:
+                n_waiting[j] -= 1
+                if n_waiting[j] == 0:
+                    ready[n_ready] = j
+                    n_ready += 1
+    return heights, successors
+
+
+def _follow(successors, start_item):
+    """Chain obtained by following the successors from an item."""
+    chain = [start_item]
+    while successors[chain[-1]] >= 0:
+        chain.append(int(successors[chain[-1]]))
+    return chain
 
 
 def longest_chain_starting_at(leq, start_item):
@@ -18,7 +102,8 @@ def longest_chain_starting_at(leq, start_item):
     Returns
     -------
     :class:`list`.
-        The chain, from smallest to greatest element.
+        The chain, from smallest to greatest element. In case of tie, each item is followed by the item of lowest
+        index, cf. :func:`jit_chain_heights`.
 
     Examples
     --------
@@ -33,11 +118,8 @@ def longest_chain_starting_at(leq, start_item):
         >>> longest_chain_starting_at(my_leq, 0)
         [0, 1, 2]
     """
-    greater_items = np.where(leq[:, start_item] == -1)[0]
-    return [start_item] + max([
-        longest_chain_starting_at(leq, second_item)
-        for second_item in greater_items
-    ], key=len, default=[])
+    _, successors = jit_chain_heights(leq)
+    return _follow(successors, int(start_item))
 
 
 def longest_chain(leq):
@@ -55,7 +137,8 @@ def longest_chain(leq):
     Returns
     -------
     :class:`list`.
-        The chain, from smallest to greatest element.
+        The chain, from smallest to greatest element. In case of tie, the one starting with the item of lowest
+        index.
 
     Examples
     --------
@@ -70,11 +153,9 @@ def longest_chain(leq):
         >>> longest_chain(my_leq)
         [0, 1, 2]
     """
-    minimal_elements = np.where(np.sum(leq == -1, axis=1) == 0)[0]
-    return max([
-        longest_chain_starting_at(leq, start_item)
-        for start_item in minimal_elements
-    ], key=len)
+    heights, successors = jit_chain_heights(leq)
+    # An item of maximal height is always minimal, since an item below it would start a longer chain.
+    return _follow(successors, int(np.argmax(heights)))
 
 
 def greedy_chain_decomposition(leq):
@@ -111,15 +192,195 @@ def greedy_chain_decomposition(leq):
         >>> greedy_chain_decomposition(my_leq)
         [[0, 1, 2], [4, 5], [3]]
     """
-    leq_copy = leq.copy()
+    return _complete_chain_decomposition(leq.copy(), [])
+
+
+def _remove_chain(leq, chain):
+    """Remove the items of a chain from `leq` (in place): they are neither minimal nor greater than another item."""
+    leq[chain, :] = 0
+    leq[:, chain] = 0
+    leq[chain, chain] = -1
+
+
+def _complete_chain_decomposition(leq, chains):
+    """Append the greedy chains of `leq` (modified in place), from which the items of `chains` are removed."""
     n, _ = leq.shape
-    number_of_recorded_items = 0
-    chains = []
+    number_of_recorded_items = sum(len(chain) for chain in chains)
     while number_of_recorded_items < n:
-        chain = longest_chain(leq_copy)
+        chain = longest_chain(leq)
         chains.append(chain)
         number_of_recorded_items += len(chain)
-        leq_copy[chain, :] = 0
-        leq_copy[:, chain] = 0
-        leq_copy[chain, chain] = -1
+        _remove_chain(leq, chain)
     return chains
+
+
+class ChainDecomposition:
+    """
+    Greedy chain decomposition of a poset, cached and repaired when new comparisons are learned.
+
+    The chains are the same as :func:`greedy_chain_decomposition`. After an update, the chains are computed again
+    from the first one whose items are concerned by the newly learned pairs: if it is unchanged, the next one is
+    examined, and so on. The chains after the last concerned one are kept as they are.
+
+    Parameters
+    ----------
+    poset: :class:`~corsort.PosetDense` or :class:`~corsort.PosetBitset`
+        The poset. Its matrix `leq` is read when the chains need to be computed.
+
+    Attributes
+    ----------
+    n_longest_chains_: :class:`int`
+        Number of calls to :func:`longest_chain` so far.
+
+    Examples
+    --------
+        >>> from corsort.poset_dense import PosetDense
+        >>> poset = PosetDense(6)
+        >>> decomposition = ChainDecomposition(poset)
+        >>> for i, j in [(0, 1), (1, 2), (0, 3), (4, 5)]:
+        ...     decomposition.update(*poset.apply_i_lt_j(i, j))
+        >>> decomposition.chains
+        [[0, 1, 2], [4, 5], [3]]
+        >>> decomposition.n_longest_chains_
+        3
+
+    Learning that 3 < 5 does not change the first chain, and only concerns the items of the second one:
+
+        >>> decomposition.update(*poset.apply_i_lt_j(3, 5))
+        >>> decomposition.chains
+        [[0, 1, 2], [3, 5], [4]]
+        >>> decomposition.n_longest_chains_
+        6
+        >>> greedy_chain_decomposition(poset.leq)
+        [[0, 1, 2], [3, 5], [4]]
+
+    Learning that 2 < 5 changes the first chain, and the following ones are computed again:
+
+        >>> decomposition.update(*poset.apply_i_lt_j(2, 5))
+        >>> decomposition.chains
+        [[0, 1, 2, 5], [3], [4]]
+        >>> decomposition.n_longest_chains_
+        9
+    """
+
+    def __init__(self, poset):
+        self.poset = poset
+        self.n_longest_chains_ = 0
+        self._chains = None
+
+    @property
+    def chains(self):
+        """:class:`list` of :class:`list`: The chains, cf. :func:`greedy_chain_decomposition`."""
+        if self._chains is None:
+            self._chains = self._complete(self.poset.leq.copy(), [])
+        return self._chains
+
+    def _complete(self, leq, chains):
+        n_chains = len(chains)
+        chains = _complete_chain_decomposition(leq, chains)
+        self.n_longest_chains_ += len(chains) - n_chains
+        return chains
+
+    def update(self, downs, ups):
+        """
+        Repair the chains after new pairs have been learned.
+
+        Parameters
+        ----------
+        downs: :class:`~numpy.ndarray`
+            Indices of the low items of the newly learned pairs.
+        ups: :class:`~numpy.ndarray`
+            Indices of the high items of the newly learned pairs.
+        """
+        if self._chains is None or len(downs) == 0:
+            return
+        leq = self.poset.leq.copy()
+        remaining = np.ones(leq.shape[0], dtype=bool)
+        for k, chain in enumerate(self._chains):
+            if not np.any(remaining[downs] & remaining[ups]):
+                # The order on the remaining items is unchanged, hence the following chains.
+                return
+            new_chain = longest_chain(leq)
+            self.n_longest_chains_ += 1
+            _remove_chain(leq, new_chain)
+            if new_chain != chain:
+                self._chains = self._complete(leq, self._chains[:k] + [new_chain])
+                return
+            remaining[chain] = False
+
+
+def minimum_chain_decomposition(leq):
+    """
+    Decomposition in a minimum number of chains (Dilworth's theorem).
+
+    It is computed with a maximum matching between the items and their greater items (augmenting paths): each
+    matched pair (i, j) means that j follows i in a chain. Unlike :func:`greedy_chain_decomposition`, the number of
+    chains is minimal, i.e. it is the size of the largest antichain.
+
+    Parameters
+    ----------
+    leq: :class:`~numpy.ndarray`.
+        Matrix of size `(n_, n_)`. Coefficient (i, j) is
+        +1 if we know that item i <= item j,
+        -1 if we know that item i > item j,
+        0 if we do not know the comparison between them.
+        The relation must be transitively closed, like the `leq_` matrix of a :class:`~corsort.Corsort`.
+
+    Returns
+    -------
+    :class:`list` of :class:`list`
+        The chains, from the longest to the shortest (in case of tie, by lowest first item). Each chain is sorted from
+        smallest item to greatest item.
+
+    Examples
+    --------
+    Items 0 < 3 < 2, 3 < 4 and 1 < 2: the greedy decomposition takes the chain 0 < 3 < 2 first and needs three
+    chains, whereas two are enough.
+
+        >>> my_leq = np.array([
+        ...     [ 1,  0,  1,  1,  1],
+        ...     [ 0,  1,  1,  0,  0],
+        ...     [-1, -1,  1, -1,  0],
+        ...     [-1,  0,  1,  1,  1],
+        ...     [-1,  0,  0, -1,  1],
+        ... ])
+        >>> greedy_chain_decomposition(my_leq)
+        [[0, 3, 2], [1], [4]]
+        >>> minimum_chain_decomposition(my_leq)
+        [[0, 3, 4], [1, 2]]
+    """
+    n = leq.shape[0]
+    greater_items = [[j for j in np.flatnonzero(leq[i, :] == 1) if j != i] for i in range(n)]
+    following = np.full(n, -1, dtype=int)
+    preceding = np.full(n, -1, dtype=int)
+    for start in range(n):
+        # Breadth-first search of an augmenting path from `start` to an item that does not follow anyone yet.
+        reached_from = np.full(n, -1, dtype=int)
+        queue = [start]
+        end = -1
+        k = 0
+        while k < len(queue) and end < 0:
+            i = queue[k]
+            k += 1
+            for j in greater_items[i]:
+                if reached_from[j] < 0:
+                    reached_from[j] = i
+                    if preceding[j] < 0:
+                        end = j
+                        break
+                    queue.append(preceding[j])
+        # Flip the path: each item on it now precedes the item through which it was reached.
+        j = end
+        while j >= 0:
+            i = reached_from[j]
+            previous_j = following[i]
+            following[i] = j
+            preceding[j] = i
+            j = previous_j
+    chains = []
+    for start in np.flatnonzero(preceding < 0):
+        chain = [int(start)]
+        while following[chain[-1]] >= 0:
+            chain.append(int(following[chain[-1]]))
+        chains.append(chain)
+    return sorted(chains, key=lambda chain: -len(chain))
@@ -1,43 +1,13 @@
-from string import Template
-from corsort.corsort_delegate import CorsortDelegate
+import sys
+import numpy as np
+from corsort.distance_to_sorted_array import distance_to_sorted_array
+from corsort.poset_dense import PosetDense
+from corsort.scorers import scorer_delta
 from corsort.wrap_full_jit import WrapFullJit
 from corsort.jit_sorts import jit_corsort_delta_max_rho
-from corsort.transitive_reduction import transitive_reduction
+from corsort.transitive_reduction import TransitiveReduction
 
-
-def _print_legend(k, state, distance):
-    if k == 0:
-        positioning = ""
-    elif k % 2 == 1:
-        positioning = Template(r", right = \lrgap of x$ref").safe_substitute(ref=k-1)
-    else:
-        positioning = Template(r", below = \interspace of x$ref").safe_substitute(ref=k-2)
-    state_as_str = "".join([str(element) for element in state])
-    print(Template(r"\node[draw$positioning] (x$k) {$X_$k=($state_as_str), \tau_$k=$distance$};").safe_substitute(
-        positioning=positioning, k=k, distance=distance, state_as_str=state_as_str))
-
-
-def _print_graph(k, leq, history_comparisons, state, perm):
-    print(Template(r"\node[above = \intraspace of x$k] (x${k}p) {\execution{").safe_substitute(k=k))
-    n_ancestors = (leq > 0).sum(axis=1)
-    n_descendants = (leq > 0).sum(axis=0)
-    next_comparison = history_comparisons[k] if k < len(history_comparisons) else {}
-    rows = []
-    for i, x in enumerate(state):
-        n_anc = n_ancestors[i]
-        n_des = n_descendants[i]
-        rows.append(Template("    $val/$borda/$n_des/$n_tot/$select").safe_substitute(
-            val=perm[i], borda=n_des - n_anc, n_des=n_des, n_tot=n_anc + n_des,
-            select="select" if i in next_comparison else ""
-        ))
-    print(", \n".join(rows) + "%")
-    comparisons = transitive_reduction(leq)
-    comparisons_as_str = ", ".join([f"{perm[i]}/{perm[j]}" for i, j in comparisons])
-    print(Template(r"}{$comparisons_as_str}};").safe_substitute(comparisons_as_str=comparisons_as_str))
-
-
-def _print_preamble():
-    print(r"""
+_PREAMBLE = r"""
 \begin{tikzpicture}
 \def\interspace{3cm}
 \def\intraspace{.1cm}
@@ -52,11 +22,112 @@ def _print_preamble():
         \foreach \i/\j in {#2}{\draw[<-] (\i) -- (\j) ;}
     \end{tikzpicture}%
 }
-    """)
+    """
+
+
+class _BufferedWriter:
+    """Accumulate text and write it to a file-like object by chunks of at least `buffer_size` characters."""
+
+    def __init__(self, file, buffer_size):
+        self.file = file
+        self.buffer_size = buffer_size
+        self.chunks = []
+        self.size = 0
+
+    def write(self, text):
+        self.chunks.append(text)
+        self.size += len(text)
+        if self.size >= self.buffer_size:
+            self.flush()
 
+    def flush(self):
+        self.file.write("".join(self.chunks))
+        self.chunks = []
+        self.size = 0
 
-def _print_end():
-    print(r"\end{tikzpicture}")
+
+def _write_legend(writer, frame, step, state, distance):
+    if frame == 0:
+        positioning = ""
+    elif frame % 2 == 1:
+        positioning = rf", right = \lrgap of x{frame - 1}"
+    else:
+        positioning = rf", below = \interspace of x{frame - 2}"
+    state_as_str = "".join([str(element) for element in state])
+    writer.write(rf"\node[draw{positioning}] (x{frame}) "
+                 rf"{{$X_{step}=({state_as_str}), \tau_{step}={distance}$}};" + "\n")
+
+
+def _write_graph(writer, frame, poset, reduction, next_comparison, perm):
+    writer.write(rf"\node[above = \intraspace of x{frame}] (x{frame}p) {{\execution{{" + "\n")
+    n_ancestors = poset.n_ancestors()
+    n_descendants = poset.n_descendants()
+    rows = []
+    for i in range(len(perm)):
+        n_anc = n_ancestors[i]
+        n_des = n_descendants[i]
+        select = "select" if i in next_comparison else ""
+        rows.append(f"    {perm[i]}/{n_des - n_anc}/{n_des}/{n_anc + n_des}/{select}")
+    writer.write(", \n".join(rows) + "%\n")
+    comparisons_as_str = ", ".join([f"{perm[i]}/{perm[j]}" for i, j in reduction.edges])
+    writer.write(f"}}{{{comparisons_as_str}}}}};\n")
+
+
+def write_corsort_execution(perm, file=None, frame_step=1, buffer_size=65536):
+    r"""
+    Write an execution of corsort in LaTeX (TikZ).
+
+    The comparisons are made by a jit corsort, which records the states of the list only for the written frames.
+    Then they are applied one by one to a poset, whose transitive reduction is updated incrementally (cf.
+    :class:`~corsort.TransitiveReduction`). Hence the memory does not depend on the number of frames.
+
+    Parameters
+    ----------
+    perm: :class:`list` or :class:`~numpy.ndarray`
+        Input permutation.
+    file: file-like, optional
+        Where to write. Default: standard output.
+    frame_step: :class:`int`
+        Number of comparisons between two written frames. The final frame is always written.
+    buffer_size: :class:`int`
+        The text is written to `file` by chunks of about this number of characters.
+
+    Examples
+    --------
+        >>> import io
+        >>> output = io.StringIO()
+        >>> write_corsort_execution([4, 2, 3, 1, 5], file=output, frame_step=3)
+        >>> print("\n".join(line for line in output.getvalue().splitlines() if line.startswith(r"\node[draw")))
+        \node[draw] (x0) {$X_0=(42315), \tau_0=6$};
+        \node[draw, right = \lrgap of x0] (x1) {$X_3=(12354), \tau_3=2$};
+        \node[draw, below = \interspace of x0] (x2) {$X_6=(21345), \tau_6=2$};
+        \node[draw, right = \lrgap of x2] (x3) {$X_7=(12345), \tau_7=0$};
+    """
+    if file is None:
+        file = sys.stdout
+    perm = np.asarray(perm)
+    n = len(perm)
+    sort = WrapFullJit(jit_sort=jit_corsort_delta_max_rho, record_states=frame_step)
+    sort(perm)
+    comparisons = sort.history_comparisons_
+    m = len(comparisons)
+    states = iter(sort.history_states_)
+    poset = PosetDense(n)
+    reduction = TransitiveReduction(poset)
+    writer = _BufferedWriter(file, buffer_size)
+    writer.write(_PREAMBLE + "\n")
+    frame = 0
+    for step in range(m + 1):
+        if step > 0:
+            reduction.update(*poset.apply_i_lt_j(*comparisons[step - 1]))
+        if step % frame_step and step < m:
+            continue
+        distance = distance_to_sorted_array(perm[np.argsort(scorer_delta(poset.leq))])
+        _write_legend(writer, frame, step, next(states), distance)
+        _write_graph(writer, frame, poset, reduction, comparisons[step] if step < m else (), perm)
+        frame += 1
+    writer.write(r"\end{tikzpicture}" + "\n")
+    writer.flush()
 
 
 def print_corsort_execution(perm):
@@ -155,23 +226,4 @@ def print_corsort_execution(perm):
         }{4/5, 2/3, 3/4, 1/2}};
         \end{tikzpicture}
     """
-    corsort = CorsortDelegate(
-        sort=WrapFullJit(jit_sort=jit_corsort_delta_max_rho, record_states=True),
-        compute_history=True,
-        record_leq=True
-    )
-    corsort(perm)
-    _print_preamble()
-    # raise ValueError(str(corsort.sort.record_states))
-    # if corsort.sort.history_states_ is None:
-    #     raise ValueError("A")
-    # if corsort.history_distances_ is None:
-    #     raise ValueError("B")
-    # if corsort.history_leq_ is None:
-    #     raise ValueError("C")
-    for k, (state, distance, leq) in enumerate(zip(corsort.sort.history_states_,
-                                                   corsort.history_distances_,
-                                                   corsort.history_leq_)):
-        _print_legend(k, state, distance)
-        _print_graph(k, leq, corsort.history_comparisons_, state, perm)
-    _print_end()
+    write_corsort_execution(perm)
@@ -1,7 +1,9 @@
 import numpy as np
+from corsort.comparison_log import ComparisonLog
 from corsort.entropy_bound import entropy_bound
-from corsort.distance_to_sorted_array import distance_to_sorted_array
-from corsort.jit_sorts import jit_corsort_borda, \
+from corsort.jit_batch import corsort_batch
+from corsort.ragged_histories import RaggedHistories
+from corsort.jit_sorts import CORSORT_VARIANTS, RECORD_NONE, jit_corsort_borda, \
     jit_corsort_delta_max_rho, jit_corsort_delta_sum_rho, jit_corsort_delta_max_delta, jit_corsort_delta_sum_delta, \
     jit_corsort_rho_max_rho, jit_corsort_rho_sum_rho, jit_corsort_rho_max_delta, jit_corsort_rho_sum_delta, \
     jit_heapsort
@@ -15,8 +17,10 @@ class WrapFullJit:
     ----------
     compute_history: :class:`bool`
         If True, then compute the history of the distance to the sorted array.
-    record_states: :class:`bool`
-        If True, then record the states of the algorithm.
+    record_states: :class:`bool` or :class:`int`
+        Recording mode of the states of the algorithm: False (or `RECORD_NONE`), True (or `RECORD_FULL`),
+        `RECORD_FINAL` (only the final state), or a number `k` of comparisons between two recorded states (the final
+        state is always recorded). Cf. :mod:`corsort.jit_sorts`.
 
     Attributes
     ----------
@@ -27,12 +31,12 @@ class WrapFullJit:
     n_comparisons_: :class:`int`
         Number of comparison performed.
     history_distances_: :class:`list` of :class:`int`
-        History of the kendall-tau distance to the sorted list.
-    history_comparisons_: :class:`list` of :class:`tuple`
-        History of the pairwise comparisons. Tuple (i, j) means that items of indices i and j were compared, and
+        History of the Spearman footrule distance to the sorted list.
+    history_comparisons_: :class:`~corsort.ComparisonLog`
+        History of the pairwise comparisons. Comparison (i, j) means that items of indices i and j were compared, and
         that perm[i] < perm[j].
-    history_states_: :class:`list` of :class:`tuple`
-        History of the state of the list.
+    history_states_: :class:`list` of :class:`list`
+        History of the state of the list (recorded states only, cf. `record_states`).
 
     Examples
     --------
@@ -55,16 +59,24 @@ class WrapFullJit:
         (13, 12), (8, 12), (12, 10), (6, 12), (4, 6), (12, 1), (10, 1), (13, 0), (2, 13),
         (11, 2), (11, 3), (7, 13), (9, 0), (2, 9), (4, 8), (5, 12), (6, 5), (7, 9), (13, 9),
         (14, 0), (2, 14), (13, 14), (14, 9)]
-        >>> corsort.history_comparisons_values_  # doctest: +NORMALIZE_WHITESPACE
-        [(7, 14), (1, 2), (1, 7), (7, 8), (8, 14), (2, 8), (2, 7), (7, 11), (3, 10), (3, 7),
-        (1, 3), (7, 9), (9, 11), (11, 14), (9, 10), (2, 3), (6, 13), (9, 13), (0, 9), (0, 3),
-        (4, 12), (9, 12), (12, 13), (10, 12), (8, 10), (12, 14), (13, 14), (4, 7), (2, 4),
-        (0, 2), (0, 1), (3, 4), (6, 7), (2, 6), (8, 9), (11, 12), (10, 11), (3, 6), (4, 6),
-        (5, 7), (2, 5), (4, 5), (5, 6)]
+        >>> corsort.history_comparisons_values_[:3]
+        array([[ 7, 14],
+               [ 1,  2],
+               [ 1,  7]])
 
         >>> p = np.array([2, 1, 3, 0])
         >>> corsort(p).history_states_
         [[2, 1, 3, 0], [1, 3, 0, 2], [1, 0, 2, 3], [1, 0, 2, 3], [1, 0, 2, 3], [0, 1, 2, 3]]
+
+    Record only some states:
+
+        >>> corsort.record_states = 2
+        >>> corsort(p).history_states_
+        [[2, 1, 3, 0], [1, 0, 2, 3], [1, 0, 2, 3], [0, 1, 2, 3]]
+        >>> from corsort.jit_sorts import RECORD_FINAL
+        >>> corsort.record_states = RECORD_FINAL
+        >>> corsort(p).history_states_
+        [[0, 1, 2, 3]]
     """
 
     def __init__(self, jit_sort, compute_history=False, record_states=False):
@@ -109,27 +121,74 @@ class WrapFullJit:
         """
         if isinstance(perm, list):
             perm = np.array(perm)
-        states, scores, comparisons = self.jit_sort(perm)
+        states, scores, comparisons, distances = self.jit_sort(perm, int(self.record_states), self.compute_history)
         self.n_ = len(perm)
         self.perm_ = perm
-        self.n_comparisons_ = len(states) - 1
-        if self.compute_history:
-            self.history_distances_ = [distance_to_sorted_array(state) for state in states]
-        else:
-            self.history_distances_ = []
-        self.history_comparisons_ = comparisons
+        self.n_comparisons_ = len(comparisons)
+        self.history_distances_ = distances.tolist()
+        self.history_comparisons_ = ComparisonLog.from_array(comparisons)
         if self.record_states:
             self.history_states_ = [list(state) for state in states]
         return self
 
+    def batch(self, perms):
+        """
+        Sort a batch of permutations.
+
+        For the corsorts of :mod:`corsort.jit_sorts`, the whole batch is processed by a single parallel jit kernel
+        (cf. :func:`~corsort.jit_batch.corsort_batch`). For other jit sorts, the permutations are sorted one by one.
+        The attributes of the object are not updated.
+
+        Parameters
+        ----------
+        perms: :class:`~numpy.ndarray`
+            Array of size `(nt, n)`. Each row is a permutation to sort.
+
+        Returns
+        -------
+        n_comparisons: :class:`~numpy.ndarray`
+            Array of size `nt`. Number of comparisons for each permutation.
+        distances: :class:`~corsort.RaggedHistories`
+            History of the distance to the sorted list for each permutation (empty if `compute_history` is False).
+
+        Examples
+        --------
+            >>> np.random.seed(42)
+            >>> ps = np.array([np.random.permutation(10) for _ in range(3)])
+            >>> corsort = WrapFullJit(jit_sort=jit_corsort_borda, compute_history=True)
+            >>> nc, d = corsort.batch(ps)
+            >>> print(corsort.n_comparisons_)
+            None
+            >>> all(nc[k] == len(corsort(ps[k]).history_comparisons_) for k in range(3))
+            True
+            >>> list(d[0]) == corsort(ps[0]).history_distances_
+            True
+            >>> heapsort = WrapFullJit(jit_sort=jit_heapsort, compute_history=True)
+            >>> nc, d = heapsort.batch(ps)
+            >>> print(heapsort.n_comparisons_)
+            None
+            >>> list(d[0]) == heapsort(ps[0]).history_distances_
+            True
+        """
+        if self.__name__ in CORSORT_VARIANTS:
+            return corsort_batch(perms, self.__name__, compute_history=self.compute_history)
+        n_comparisons = np.zeros(len(perms), dtype=int)
+        distances = []
+        for k, perm in enumerate(perms):
+            _, _, comparisons, history = self.jit_sort(perm.copy(), RECORD_NONE, self.compute_history)
+            n_comparisons[k] = len(comparisons)
+            distances.append(history)
+        return n_comparisons, RaggedHistories.from_lists(distances)
+
     @property
     def history_comparisons_values_(self):
-        """:class:`list` of :class:`tuple`: History of the pairwise comparisons, in terms of compared values.
-        Tuple (x, y) means that items of values x and y were compared, and that x < y.
+        """:class:`~numpy.ndarray`: History of the pairwise comparisons, in terms of compared values, as an array of
+        size `(m, 2)`. Row (x, y) means that items of values x and y were compared, and that x < y. It is computed once
+        per sort, cf. :meth:`~corsort.ComparisonLog.values`.
         """
         if self.history_comparisons_ is None:
             return None
-        return [(self.perm_[i], self.perm_[j]) for (i, j) in self.history_comparisons_]
+        return self.history_comparisons_.values(self.perm_)
 
 
 class JitCorsortBorda(WrapFullJit):
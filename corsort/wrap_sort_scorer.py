@@ -2,10 +2,23 @@ import numpy as np
 from corsort.distance_to_sorted_array import distance_to_sorted_array
 from corsort.sort_quick import SortQuick
 from corsort.jit_scorers import jit_scorer_rho
+from corsort.jit_sorts import RECORD_FINAL, RECORD_FULL
 
 
 class WrapSortScorer:
     """
+    Run a sort, then estimate the positions of the items after each comparison with a scorer.
+
+    Parameters
+    ----------
+    scorer: callable
+        Function `scorer(n, downs, ups, record_step)`, e.g. :func:`~corsort.jit_scorer_rho`. Without history, only
+        the final scores are requested (`RECORD_FINAL`).
+    sort: :class:`~corsort.Sort`
+        Sorting algorithm.
+    compute_history: :class:`bool`
+        If True, then compute the history of the distance to the sorted array.
+
     Examples
     --------
         >>> my_sort = SortQuick(compute_history=False)
@@ -18,9 +31,12 @@ class WrapSortScorer:
         >>> jit_sort.history_comparisons_  # doctest: +NORMALIZE_WHITESPACE
         [(1, 0), (0, 2), (0, 3), (4, 0), (0, 5), (6, 0), (7, 0), (0, 8),
         (4, 1), (1, 6), (1, 7), (6, 7), (3, 2), (2, 5), (8, 2), (8, 3)]
-        >>> jit_sort.history_comparisons_values_  # doctest: +NORMALIZE_WHITESPACE
-        [(1, 4), (4, 7), (4, 6), (0, 4), (4, 8), (2, 4), (3, 4), (4, 5),
-        (0, 1), (1, 2), (1, 3), (2, 3), (6, 7), (7, 8), (5, 7), (5, 6)]
+        >>> jit_sort.history_comparisons_values_[:3]
+        array([[1, 4],
+               [4, 7],
+               [4, 6]])
+        >>> WrapSortScorer(scorer=jit_scorer_rho, sort=my_sort, compute_history=True)(my_xs).history_distances_
+        [30, 28, 22, 20, 16, 6, 4, 8, 12, 10, 10, 6, 6, 6, 4, 2, 0]
     """
 
     def __init__(self, scorer, sort, compute_history=False):
@@ -57,22 +73,22 @@ class WrapSortScorer:
         self.perm_ = perm
         self.sort(perm)
         self.history_comparisons_ = self.sort.history_comparisons_
-        downs = np.array([c[0] for c in self.sort.history_comparisons_])
-        ups = np.array([c[1] for c in self.sort.history_comparisons_])
-        states = self.scorer(self.n_, downs, ups)
-        self.n_comparisons_ = states.shape[0] - 1
+        # Without history, only the final scores are needed.
+        record_step = RECORD_FULL if self.compute_history else RECORD_FINAL
+        states = self.scorer(self.n_, self.history_comparisons_.downs, self.history_comparisons_.ups, record_step)
+        self.n_comparisons_ = len(self.history_comparisons_)
         if self.compute_history:
-            self.history_distances_ = [distance_to_sorted_array(self.perm_[np.argsort(state)])
-                                       for state in states]
+            self.history_distances_ = distance_to_sorted_array(self.perm_[np.argsort(states, axis=1)]).tolist()
         else:
             self.history_distances_ = []
         return self
 
     @property
     def history_comparisons_values_(self):
-        """:class:`list` of :class:`tuple`: History of the pairwise comparisons, in terms of compared values.
-        Tuple (x, y) means that items of values x and y were compared, and that x < y.
+        """:class:`~numpy.ndarray`: History of the pairwise comparisons, in terms of compared values, as an array of
+        size `(m, 2)`. Row (x, y) means that items of values x and y were compared, and that x < y. It is computed once
+        per sort, cf. :meth:`~corsort.ComparisonLog.values`.
         """
         if self.history_comparisons_ is None:
             return None
-        return [(self.perm_[i], self.perm_[j]) for (i, j) in self.history_comparisons_]
+        return self.history_comparisons_.values(self.perm_)